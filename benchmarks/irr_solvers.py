@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from qfinancetools.core.corporate import irr
+from qfinancetools.models.corporate import IrrInput
+
+
+def _legacy_irr(cash_flows: list[float], guess: float = 0.1) -> float:
+    # The scalar Newton-then-bisection solver irr() used before the roots mode was added.
+    def npv(rate: float) -> float:
+        return sum(cash / (1 + rate) ** idx for idx, cash in enumerate(cash_flows))
+
+    rate = guess
+    for _ in range(100):
+        f = npv(rate)
+        derivative = 0.0
+        for idx, cash in enumerate(cash_flows[1:], start=1):
+            derivative -= idx * cash / ((1 + rate) ** (idx + 1))
+        if derivative == 0:
+            break
+        next_rate = rate - f / derivative
+        if abs(next_rate - rate) < 1e-10:
+            return next_rate
+        rate = next_rate
+    low, high = -0.99, 10.0
+    for _ in range(200):
+        mid = (low + high) / 2
+        value = npv(mid)
+        if abs(value) < 1e-8:
+            return mid
+        if value > 0:
+            low = mid
+        else:
+            high = mid
+    return rate
+
+
+def _conventional(periods: int) -> list[float]:
+    return [-1000.0 * periods / 12] + [100.0 + idx % 7 for idx in range(periods)]
+
+
+def _two_irrs(periods: int) -> list[float]:
+    # An upfront outlay, level inflows and a closing liability: NPV is negative at 0%, turns positive, then falls again.
+    inflow = 100.0
+    return [-inflow * periods * 0.5] + [inflow] * (periods - 1) + [-inflow * periods * 0.45]
+
+
+def _no_irr() -> list[float]:
+    return [100.0, -300.0, 250.0, 10.0, -5.0, 40.0, -20.0, 30.0, 15.0, 5.0]
+
+
+CASES = {
+    "10 flows, conventional": _conventional(10),
+    "60 flows, conventional": _conventional(60),
+    "360 flows, conventional": _conventional(360),
+    "60 flows, two IRRs": _two_irrs(60),
+    "360 flows, two IRRs": _two_irrs(360),
+    "10 flows, no IRR": _no_irr(),
+}
+
+
+def _time(call, repeat: int) -> float:
+    return min(timeit.repeat(call, number=1, repeat=repeat)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the IRR solvers on conventional and non-conventional flows.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'case':<26}{'legacy us':>12}{'newton us':>12}{'roots us':>12}  roots found")
+    for name, flows in CASES.items():
+        try:
+            _legacy_irr(flows)
+            legacy = f"{_time(lambda: _legacy_irr(flows), args.repeat):,.0f}"
+        except ArithmeticError:
+            # Overflow or a division by zero inside the bisection.
+            legacy = "fails"
+        newton = _time(lambda: irr(IrrInput(cash_flows=flows)), args.repeat)
+        roots = _time(lambda: irr(IrrInput(cash_flows=flows, method="roots")), args.repeat)
+        found = irr(IrrInput(cash_flows=flows, method="roots")).roots
+        print(f"{name:<26}{legacy:>12}{newton:>12,.0f}{roots:>12,.0f}  {', '.join(f'{root:.4f}%' for root in found) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import csv
 import json
+import sys
+from pathlib import Path
+
+import numpy as np
 import typer
 
 from qfinancetools.core.bonds import (
+    bond_portfolio,
+    bond_ytm_batch,
+    iter_bond_table,
     bond_price,
     bond_ytm,
     bond_duration,
     bond_convexity,
+    bond_analytics,
     bond_ladder,
 )
 from qfinancetools.models.bonds import (
@@ -15,6 +24,7 @@ from qfinancetools.models.bonds import (
     BondYtmInput,
     BondDurationInput,
     BondConvexityInput,
+    BondAnalyticsInput,
     BondLadderInput,
 )
 from qfinancetools.cli.renderers.bonds import (
@@ -22,13 +32,47 @@ from qfinancetools.cli.renderers.bonds import (
     render_bond_ytm,
     render_bond_duration,
     render_bond_convexity,
+    render_bond_analytics,
     render_bond_ladder,
+    render_bond_portfolio,
 )
 from qfinancetools.cli.prompts import prompt_float, prompt_int, prompt_list_int, prompt_list_float
 
 
 bonds_app = typer.Typer(no_args_is_help=True)
 
+_PORTFOLIO_COLUMNS = ["face_value", "coupon_rate", "yield_rate", "years"]
+_QUOTE_COLUMNS = ["face_value", "coupon_rate", "price", "years"]
+_YTM_FIELDS = ["row", "yield_rate", "iterations", "converged", "method", "warnings"]
+
+
+def _stream_ytm(path: Path, as_json: bool) -> None:
+    writer = None if as_json else csv.writer(sys.stdout)
+    if writer is not None:
+        writer.writerow(_YTM_FIELDS)
+    offset = 0
+    try:
+        for columns in iter_bond_table(path, _QUOTE_COLUMNS):
+            result = bond_ytm_batch(**columns)
+            for idx in range(len(result)):
+                codes = ";".join(item.code for item in result.warnings.get(idx, []))
+                values = [
+                    offset + idx,
+                    float(result.yield_rate[idx]),
+                    int(result.iterations[idx]),
+                    bool(result.converged[idx]),
+                    str(result.method[idx]),
+                    codes,
+                ]
+                if writer is not None:
+                    writer.writerow(values)
+                else:
+                    sys.stdout.write(json.dumps(dict(zip(_YTM_FIELDS, values))) + "\n")
+            sys.stdout.flush()
+            offset += len(result)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--file") from exc
+
 
 @bonds_app.command("price")
 def price_command(
@@ -70,9 +114,13 @@ def ytm_command(
     price: float | None = typer.Option(None, "--price", help="Bond price."),
     years: int | None = typer.Option(None, "--years", help="Years to maturity."),
     freq: int = typer.Option(2, "--freq", help="Payments per year."),
+    file: Path | None = typer.Option(None, "--file", help="CSV with face_value, coupon_rate, price, years[, payments_per_year] columns; streams one yield per row."),
     interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
     as_json: bool = typer.Option(False, "--json"),
 ) -> None:
+    if file is not None:
+        _stream_ytm(file, as_json)
+        return
     if interactive:
         face = prompt_float("Face value", face)
         coupon = prompt_float("Coupon rate (%)", coupon)
@@ -162,6 +210,39 @@ def convexity_command(
     render_bond_convexity(result)
 
 
+@bonds_app.command("analytics")
+def analytics_command(
+    face: float | None = typer.Option(None, "--face", help="Face value."),
+    coupon: float | None = typer.Option(None, "--coupon", help="Coupon rate (percent)."),
+    ytm: float | None = typer.Option(None, "--ytm", help="Yield to maturity (percent)."),
+    years: int | None = typer.Option(None, "--years", help="Years to maturity."),
+    freq: int = typer.Option(2, "--freq", help="Payments per year."),
+    interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
+    as_json: bool = typer.Option(False, "--json"),
+) -> None:
+    if interactive:
+        face = prompt_float("Face value", face)
+        coupon = prompt_float("Coupon rate (%)", coupon)
+        ytm = prompt_float("Yield to maturity (%)", ytm)
+        years = prompt_int("Years to maturity", years)
+        freq = prompt_int("Payments per year", freq)
+    if face is None or coupon is None or ytm is None or years is None:
+        raise typer.BadParameter("--face, --coupon, --ytm, and --years are required unless --interactive is used")
+
+    data = BondAnalyticsInput(
+        face_value=face,
+        coupon_rate=coupon,
+        yield_rate=ytm,
+        years=years,
+        payments_per_year=freq,
+    )
+    result = bond_analytics(data)
+    if as_json:
+        typer.echo(json.dumps(result.model_dump(), indent=2))
+        return
+    render_bond_analytics(result)
+
+
 @bonds_app.command("ladder")
 def ladder_command(
     maturities: list[int] | None = typer.Option(None, "--maturity", help="Maturity in years (repeatable)."),
@@ -181,3 +262,45 @@ def ladder_command(
         typer.echo(json.dumps(result.model_dump(), indent=2))
         return
     render_bond_ladder(result)
+
+
+@bonds_app.command("portfolio")
+def portfolio_command(
+    file: Path = typer.Option(..., "--file", help="CSV with face_value, coupon_rate, yield_rate, years[, payments_per_year] columns."),
+    as_json: bool = typer.Option(False, "--json"),
+) -> None:
+    try:
+        chunks = list(iter_bond_table(file, _PORTFOLIO_COLUMNS))
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--file") from exc
+    if not chunks:
+        raise typer.BadParameter("bond table has no rows", param_hint="--file")
+    columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+    try:
+        result = bond_portfolio(**columns)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--file") from exc
+    if as_json:
+        payload = {
+            "bonds": [
+                {
+                    "row": idx,
+                    "price": float(result.price[idx]),
+                    "macaulay_duration": float(result.macaulay_duration[idx]),
+                    "modified_duration": float(result.modified_duration[idx]),
+                    "convexity": float(result.convexity[idx]),
+                    "warnings": [item.model_dump() for item in result.warnings.get(idx, [])],
+                }
+                for idx in range(len(result))
+            ],
+            "portfolio": {
+                "market_value": result.market_value,
+                "face_value": result.face_value,
+                "macaulay_duration": result.macaulay_duration_total,
+                "modified_duration": result.modified_duration_total,
+                "convexity": result.convexity_total,
+            },
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+    render_bond_portfolio(result)
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import csv
 import json
+import sys
+from pathlib import Path
+
 import typer
 
-from qfinancetools.core.corporate import wacc, capm, npv, irr, dcf, comps
+from qfinancetools.core.corporate import wacc, capm, npv, irr, irr_batch, iter_cash_flow_rows, dcf, dcf_grid, comps, comps_table, load_peer_table
 from qfinancetools.models.corporate import (
     WaccInput,
     CapmInput,
     NpvInput,
     IrrInput,
     DcfInput,
+    DcfGridInput,
     CompsInput,
+    CompsTableInput,
 )
 from qfinancetools.cli.renderers.corporate import (
     render_wacc,
@@ -18,7 +24,9 @@ from qfinancetools.cli.renderers.corporate import (
     render_npv,
     render_irr,
     render_dcf,
+    render_dcf_grid,
     render_comps,
+    render_comps_table,
 )
 from qfinancetools.cli.prompts import (
     prompt_float,
@@ -29,6 +37,29 @@ from qfinancetools.cli.prompts import (
 
 corporate_app = typer.Typer(no_args_is_help=True)
 
+_IRR_FIELDS = ["row", "irr", "iterations", "converged"]
+
+
+def _stream_irr(path: Path, guess: float, as_json: bool) -> None:
+    writer = None if as_json else csv.writer(sys.stdout)
+    if writer is not None:
+        writer.writerow(_IRR_FIELDS)
+    offset = 0
+    try:
+        for chunk in iter_cash_flow_rows(path):
+            result = irr_batch(chunk, guess=guess)
+            for idx in range(len(result)):
+                converged = bool(result.converged[idx])
+                values = [offset + idx, float(result.irr[idx]) if converged else None, int(result.iterations[idx]), converged]
+                if writer is not None:
+                    writer.writerow(values)
+                else:
+                    sys.stdout.write(json.dumps(dict(zip(_IRR_FIELDS, values))) + "\n")
+            sys.stdout.flush()
+            offset += len(result)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--file") from exc
+
 
 @corporate_app.command("wacc")
 def wacc_command(
@@ -117,16 +148,24 @@ def npv_command(
 def irr_command(
     cash_flows: list[float] | None = typer.Option(None, "--cash-flow", help="Cash flow (repeatable)."),
     guess: float = typer.Option(0.1, "--guess", help="Initial guess (rate, decimal)."),
+    method: str = typer.Option("newton", "--method", help="Solver: newton, or roots to find every IRR."),
+    file: Path | None = typer.Option(None, "--file", help="CSV with one project's cash flows per line; streams one IRR per line."),
     interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
     as_json: bool = typer.Option(False, "--json"),
 ) -> None:
+    if file is not None:
+        _stream_irr(file, guess, as_json)
+        return
     if interactive:
         cash_flows = prompt_list_float("Cash flows (comma or space separated)")
         guess = prompt_float("Initial guess (decimal)", guess)
     if not cash_flows:
         raise typer.BadParameter("--cash-flow is required unless --interactive is used")
 
-    data = IrrInput(cash_flows=cash_flows, guess=guess)
+    if method not in {"newton", "roots"}:
+        raise typer.BadParameter("--method must be newton or roots")
+
+    data = IrrInput(cash_flows=cash_flows, guess=guess, method=method)
     result = irr(data)
     if as_json:
         typer.echo(json.dumps(result.model_dump(), indent=2))
@@ -164,6 +203,31 @@ def dcf_command(
     render_dcf(result)
 
 
+@corporate_app.command("dcf-grid")
+def dcf_grid_command(
+    cash_flows: list[float] | None = typer.Option(None, "--cash-flow", help="Cash flow (repeatable)."),
+    rates: list[float] | None = typer.Option(None, "--rate", help="Discount rate in percent (repeatable)."),
+    growths: list[float] | None = typer.Option(None, "--growth", help="Terminal growth as a decimal (repeatable)."),
+    interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
+    as_json: bool = typer.Option(False, "--json"),
+) -> None:
+    if interactive:
+        cash_flows = prompt_list_float("Cash flows (comma or space separated)")
+        rates = prompt_list_float("Discount rates (%, comma or space separated)")
+        growths = prompt_list_float("Terminal growths (decimal, comma or space separated)")
+    if not cash_flows or not rates or not growths:
+        raise typer.BadParameter("--cash-flow, --rate, and --growth are required unless --interactive is used")
+
+    try:
+        result = dcf_grid(DcfGridInput(cash_flows=cash_flows, discount_rates=rates, terminal_growths=growths))
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    if as_json:
+        typer.echo(json.dumps(result.model_dump(), indent=2))
+        return
+    render_dcf_grid(result)
+
+
 @corporate_app.command("comps")
 def comps_command(
     metric: float | None = typer.Option(None, "--metric", help="Metric value (e.g., EBITDA)."),
@@ -183,3 +247,44 @@ def comps_command(
         typer.echo(json.dumps(result.model_dump(), indent=2))
         return
     render_comps(result)
+
+
+@corporate_app.command("comps-table")
+def comps_table_command(
+    file: Path = typer.Option(..., "--file", help="Peer CSV with one column per multiple, plus optional sector and size columns."),
+    columns: list[str] = typer.Option(..., "--column", help="Multiple column to summarize (repeatable)."),
+    sectors: list[str] | None = typer.Option(None, "--sector", help="Keep peers in this sector (repeatable)."),
+    min_size: float | None = typer.Option(None, "--min-size", help="Minimum peer size."),
+    max_size: float | None = typer.Option(None, "--max-size", help="Maximum peer size."),
+    sector_column: str = typer.Option("sector", "--sector-column", help="Sector column name."),
+    size_column: str = typer.Option("market_cap", "--size-column", help="Size column name."),
+    trim: float = typer.Option(0.1, "--trim", help="Fraction trimmed from each tail for the trimmed mean."),
+    subject: list[str] | None = typer.Option(None, "--subject", help="Subject metric as MULTIPLE=VALUE (repeatable)."),
+    as_json: bool = typer.Option(False, "--json"),
+) -> None:
+    values: dict[str, float] = {}
+    for item in subject or []:
+        name, sep, raw = item.partition("=")
+        try:
+            values[name] = float(raw)
+        except ValueError:
+            sep = ""
+        if not sep:
+            raise typer.BadParameter(f"expected MULTIPLE=VALUE, got {item!r}", param_hint="--subject")
+    try:
+        table = load_peer_table(file, columns, sector_column=sector_column, size_column=size_column)
+        data = CompsTableInput(
+            **table,
+            sectors=sectors or None,
+            min_size=min_size,
+            max_size=max_size,
+            trim=trim,
+            subject=values,
+        )
+        result = comps_table(data)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    if as_json:
+        typer.echo(json.dumps(result.model_dump(), indent=2))
+        return
+    render_comps_table(result)
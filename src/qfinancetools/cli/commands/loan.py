@@ -1,23 +1,84 @@
 from __future__ import annotations
 
+import csv
 import json
+import sys
+from pathlib import Path
+
 import typer
 
-from qfinancetools.core.loans import amortization_schedule, loan_summary
-from qfinancetools.models.loans import LoanInput
+from qfinancetools.core.loans import (
+    SCHEDULE_FIELDS,
+    amortization_schedule,
+    iter_amortization_rows,
+    iter_loan_table,
+    loan_summary,
+    loan_summary_batch,
+    write_amortization_schedule,
+)
+from qfinancetools.models.loans import LoanInput, LoanResult
 from qfinancetools.cli.renderers.loan import render_loan_summary, render_amortization
 from qfinancetools.cli.prompts import prompt_float, prompt_int, prompt_bool
 
 
+_BATCH_FIELDS = ["row", "monthly_payment", "total_interest", "total_paid", "years", "warnings"]
+
+
+def _stream_batch(path: Path, as_json: bool) -> None:
+    writer = None if as_json else csv.writer(sys.stdout)
+    if writer is not None:
+        writer.writerow(_BATCH_FIELDS)
+    offset = 0
+    try:
+        for columns in iter_loan_table(path):
+            result = loan_summary_batch(**columns)
+            for idx in range(len(result)):
+                codes = ";".join(item.code for item in result.warnings.get(idx, []))
+                values = [
+                    offset + idx,
+                    float(result.monthly_payment[idx]),
+                    float(result.total_interest[idx]),
+                    float(result.total_paid[idx]),
+                    float(result.years[idx]),
+                    codes,
+                ]
+                if writer is not None:
+                    writer.writerow(values)
+                else:
+                    sys.stdout.write(json.dumps(dict(zip(_BATCH_FIELDS, values))) + "\n")
+            sys.stdout.flush()
+            offset += len(result)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--batch") from exc
+
+
+def _stream_json_payload(summary: LoanResult, data: LoanInput) -> None:
+    out = sys.stdout
+    # Every value goes through json.dumps; only the fixed object and array delimiters are written literally.
+    out.write('{"summary": ' + json.dumps(summary.model_dump()) + ', "schedule": [')
+    for idx, row in enumerate(iter_amortization_rows(data)):
+        if idx:
+            out.write(",")
+        out.write("\n" + json.dumps(dict(zip(SCHEDULE_FIELDS, row))))
+    out.write("\n]}\n")
+    out.flush()
+
+
 def loan_command(
     amount: float | None = typer.Option(None, "--amount", help="Loan principal."),
     rate: float | None = typer.Option(None, "--rate", help="Annual interest rate (percent)."),
     years: int | None = typer.Option(None, "--years", help="Loan term in years."),
     extra: float = typer.Option(0.0, "--extra", help="Extra monthly payment."),
     schedule: bool = typer.Option(False, "--schedule", help="Show amortization schedule."),
+    schedule_format: str | None = typer.Option(None, "--schedule-format", help="Stream the schedule as ndjson or csv."),
+    output: Path | None = typer.Option(None, "--output", help="Write the streamed schedule to this file (format from --schedule-format, else .csv suffix or ndjson)."),
+    batch: Path | None = typer.Option(None, "--batch", help="CSV with principal, annual_rate, years[, extra_payment] columns; streams one result per row."),
     interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
     as_json: bool = typer.Option(False, "--json", help="Output JSON only."),
 ) -> None:
+    if batch is not None:
+        _stream_batch(batch, as_json)
+        return
     if interactive:
         amount = prompt_float("Loan principal", amount)
         rate = prompt_float("Annual interest rate (%)", rate)
@@ -33,14 +94,25 @@ def loan_command(
         years=years,
         extra_payment=extra,
     )
+    if output is not None and schedule_format is None:
+        schedule_format = "csv" if output.suffix.lower() == ".csv" else "ndjson"
+    if schedule_format is not None:
+        if schedule_format not in ("ndjson", "csv"):
+            raise typer.BadParameter("--schedule-format must be one of: ndjson, csv")
+        if output is None:
+            write_amortization_schedule(data, sys.stdout, schedule_format)
+        else:
+            with output.open("w", newline="", encoding="utf-8") as handle:
+                write_amortization_schedule(data, handle, schedule_format)
+        return
+
     summary = loan_summary(data)
 
     if as_json:
-        payload = {"summary": summary.model_dump()}
         if schedule:
-            rows = amortization_schedule(data)
-            payload["schedule"] = [row.model_dump() for row in rows]
-        typer.echo(json.dumps(payload, indent=2))
+            _stream_json_payload(summary, data)
+            return
+        typer.echo(json.dumps({"summary": summary.model_dump()}, indent=2))
         return
 
     render_loan_summary(summary)
@@ -3,17 +3,19 @@ from __future__ import annotations
 import json
 import typer
 
-from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, stress_test
+from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, monte_carlo_dcf, stress_test
 from qfinancetools.models.risk import (
     ScenarioInput,
     SensitivityInput,
     MonteCarloInput,
+    MonteCarloDcfInput,
     StressTestInput,
 )
 from qfinancetools.cli.renderers.risk import (
     render_scenario,
     render_sensitivity,
     render_monte_carlo,
+    render_monte_carlo_dcf,
     render_stress_test,
 )
 from qfinancetools.cli.prompts import prompt_float, prompt_int, prompt_list_float
@@ -72,6 +74,12 @@ def monte_carlo_command(
     years: int | None = typer.Option(None, "--years", help="Years to simulate."),
     simulations: int | None = typer.Option(None, "--sims", help="Number of simulations."),
     seed: int = typer.Option(0, "--seed", help="Random seed."),
+    engine: str = typer.Option("vectorized", "--engine", help="Simulation engine: vectorized | compat."),
+    workers: int = typer.Option(1, "--workers", help="Worker processes for the vectorized engine."),
+    chunk_size: int = typer.Option(100_000, "--chunk-size", help="Simulations per shard."),
+    summary: bool = typer.Option(False, "--summary", help="Stream summary statistics and histogram without per-simulation values."),
+    bins: int = typer.Option(35, "--bins", help="Histogram bins."),
+    paths_file: str | None = typer.Option(None, "--paths-file", help="Record the full path matrix to this .npy file."),
     interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
     as_json: bool = typer.Option(False, "--json"),
 ) -> None:
@@ -84,6 +92,11 @@ def monte_carlo_command(
         seed = prompt_int("Random seed", seed)
     if initial is None or mean is None or volatility is None or years is None or simulations is None:
         raise typer.BadParameter("--initial, --mean, --volatility, --years, and --sims are required unless --interactive is used")
+    engine = engine.strip().lower()
+    if engine not in {"vectorized", "compat"}:
+        raise typer.BadParameter("--engine must be one of: vectorized, compat", param_hint="--engine")
+    if engine == "compat" and workers > 1:
+        raise typer.BadParameter("the compat engine runs on a single worker; drop --workers or use --engine vectorized", param_hint="--workers")
 
     data = MonteCarloInput(
         initial_value=initial,
@@ -92,6 +105,12 @@ def monte_carlo_command(
         years=years,
         simulations=simulations,
         seed=seed,
+        engine=engine,
+        workers=workers,
+        chunk_size=chunk_size,
+        output="summary" if summary else "values",
+        histogram_bins=bins,
+        paths_file=paths_file,
     )
     result = monte_carlo(data)
     if as_json:
@@ -100,6 +119,63 @@ def monte_carlo_command(
     render_monte_carlo(result)
 
 
+@risk_app.command("dcf-montecarlo")
+def monte_carlo_dcf_command(
+    cash_flows: list[float] | None = typer.Option(None, "--cash-flow", help="Base-case cash flow (repeatable)."),
+    rate: float | None = typer.Option(None, "--rate", help="Discount rate (percent)."),
+    terminal_growth: float = typer.Option(0.0, "--terminal-growth", help="Terminal growth (decimal)."),
+    growth_vol: float = typer.Option(0.05, "--growth-vol", help="Yearly cash-flow growth shock (decimal)."),
+    margin_vol: float = typer.Option(0.03, "--margin-vol", help="Yearly margin shock (decimal)."),
+    rate_vol: float = typer.Option(1.0, "--rate-vol", help="Yearly discount-rate shock (percentage points)."),
+    corr_growth_margin: float = typer.Option(0.0, "--corr-growth-margin", help="Correlation of growth and margin shocks."),
+    corr_growth_rate: float = typer.Option(0.0, "--corr-growth-rate", help="Correlation of growth and rate shocks."),
+    corr_margin_rate: float = typer.Option(0.0, "--corr-margin-rate", help="Correlation of margin and rate shocks."),
+    simulations: int = typer.Option(10_000, "--sims", help="Number of simulations."),
+    seed: int = typer.Option(0, "--seed", help="Random seed."),
+    workers: int = typer.Option(1, "--workers", help="Worker processes."),
+    chunk_size: int = typer.Option(100_000, "--chunk-size", help="Simulations per shard."),
+    summary: bool = typer.Option(False, "--summary", help="Stream summary statistics and histogram without per-simulation values."),
+    bins: int = typer.Option(35, "--bins", help="Histogram bins."),
+    interactive: bool = typer.Option(False, "--interactive", help="Prompt for inputs."),
+    as_json: bool = typer.Option(False, "--json"),
+) -> None:
+    if interactive:
+        cash_flows = prompt_list_float("Cash flows (comma or space separated)")
+        rate = prompt_float("Discount rate (%)", rate)
+        terminal_growth = prompt_float("Terminal growth (decimal)", terminal_growth)
+        simulations = prompt_int("Number of simulations", simulations)
+    if rate is None or not cash_flows:
+        raise typer.BadParameter("--rate and --cash-flow are required unless --interactive is used")
+
+    try:
+        data = MonteCarloDcfInput(
+            cash_flows=cash_flows,
+            discount_rate=rate,
+            terminal_growth=terminal_growth,
+            growth_volatility=growth_vol,
+            margin_volatility=margin_vol,
+            rate_volatility=rate_vol,
+            correlation=[
+                [1.0, corr_growth_margin, corr_growth_rate],
+                [corr_growth_margin, 1.0, corr_margin_rate],
+                [corr_growth_rate, corr_margin_rate, 1.0],
+            ],
+            simulations=simulations,
+            seed=seed,
+            workers=workers,
+            chunk_size=chunk_size,
+            output="summary" if summary else "values",
+            histogram_bins=bins,
+        )
+        result = monte_carlo_dcf(data)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    if as_json:
+        typer.echo(json.dumps(result.model_dump(), indent=2))
+        return
+    render_monte_carlo_dcf(result)
+
+
 @risk_app.command("stress-test")
 def stress_test_command(
     base: float | None = typer.Option(None, "--base", help="Base value."),
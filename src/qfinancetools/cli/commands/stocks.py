@@ -35,6 +35,17 @@ def stocks_command(
     lump_sum: float = typer.Option(0.0, "--lump-sum", help="One-time investment at start (backtest)."),
     periodic_amount: float = typer.Option(0.0, "--periodic-amount", help="Recurring contribution amount (backtest)."),
     periodic_months: int = typer.Option(1, "--periodic-months", help="Recurring contribution period in months."),
+    provider: str = typer.Option(
+        "yahoo",
+        "--provider",
+        help="Market data provider (history/backtest): yahoo | csv | a plugin-provided name.",
+    ),
+    data_dir: str | None = typer.Option(None, "--data-dir", help="Directory of TICKER.csv/.parquet files for --provider csv."),
+    resolution: str = typer.Option(
+        "daily",
+        "--resolution",
+        help="Backtest timeline resolution: daily | weekly | monthly | none.",
+    ),
     as_json: bool = typer.Option(False, "--json"),
 ) -> None:
     normalized_mode = mode.strip().lower()
@@ -63,6 +74,8 @@ def stocks_command(
             end_date=end_date,
             period_years=period_years,
             weights=weight,
+            provider=provider,
+            data_dir=data_dir,
         )
         result = stock_history(data)
         if as_json:
@@ -72,6 +85,9 @@ def stocks_command(
         return
 
     if normalized_mode == "backtest":
+        normalized_resolution = resolution.strip().lower()
+        if normalized_resolution not in {"daily", "weekly", "monthly", "none"}:
+            raise typer.BadParameter("--resolution must be one of: daily, weekly, monthly, none")
         data = StockBacktestInput(
             tickers=ticker,
             start_date=start_date,
@@ -81,6 +97,9 @@ def stocks_command(
             periodic_amount=periodic_amount,
             periodic_months=periodic_months,
             weights=weight,
+            provider=provider,
+            data_dir=data_dir,
+            timeline_resolution=normalized_resolution,
         )
         result = stock_backtest(data)
         if as_json:
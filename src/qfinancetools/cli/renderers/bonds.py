@@ -8,7 +8,9 @@ from qfinancetools.models.bonds import (
     BondYtmResult,
     BondDurationResult,
     BondConvexityResult,
+    BondAnalyticsResult,
     BondLadderResult,
+    BondPortfolioResult,
 )
 
 
@@ -26,7 +28,14 @@ def render_bond_price(result: BondPriceResult) -> None:
 
 
 def render_bond_ytm(result: BondYtmResult) -> None:
-    _simple_table("Bond YTM", [("Yield", f"{result.yield_rate:.4f}%")])
+    _simple_table(
+        "Bond YTM",
+        [
+            ("Yield", f"{result.yield_rate:.4f}%"),
+            ("Solver", f"{result.method} ({result.iterations} iterations)"),
+            ("Converged", "yes" if result.converged else "no"),
+        ],
+    )
 
 
 def render_bond_duration(result: BondDurationResult) -> None:
@@ -43,6 +52,18 @@ def render_bond_convexity(result: BondConvexityResult) -> None:
     _simple_table("Bond Convexity", [("Convexity", f"{result.convexity:.6f}")])
 
 
+def render_bond_analytics(result: BondAnalyticsResult) -> None:
+    _simple_table(
+        "Bond Analytics",
+        [
+            ("Price", f"{result.price:,.2f}"),
+            ("Macaulay", f"{result.macaulay_duration:.4f}"),
+            ("Modified", f"{result.modified_duration:.4f}"),
+            ("Convexity", f"{result.convexity:.6f}"),
+        ],
+    )
+
+
 def render_bond_ladder(result: BondLadderResult) -> None:
     table = Table(title="Bond Ladder")
     table.add_column("Maturity (years)", justify="right")
@@ -58,3 +79,19 @@ def render_bond_ladder(result: BondLadderResult) -> None:
             ("Weighted Maturity", f"{result.weighted_maturity:.2f}"),
         ],
     )
+
+
+def render_bond_portfolio(result: BondPortfolioResult) -> None:
+    flagged = sum(1 for items in result.warnings.values() if items)
+    _simple_table(
+        "Bond Portfolio",
+        [
+            ("Bonds", f"{len(result):,}"),
+            ("Face Value", f"{result.face_value:,.2f}"),
+            ("Market Value", f"{result.market_value:,.2f}"),
+            ("Macaulay", f"{result.macaulay_duration_total:.4f}"),
+            ("Modified", f"{result.modified_duration_total:.4f}"),
+            ("Convexity", f"{result.convexity_total:.6f}"),
+            ("Bonds With Warnings", f"{flagged:,}"),
+        ],
+    )
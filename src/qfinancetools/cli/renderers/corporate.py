@@ -9,7 +9,9 @@ from qfinancetools.models.corporate import (
     NpvResult,
     IrrResult,
     DcfResult,
+    DcfGridResult,
     CompsResult,
+    CompsTableResult,
 )
 
 
@@ -35,7 +37,11 @@ def render_npv(result: NpvResult) -> None:
 
 
 def render_irr(result: IrrResult) -> None:
-    _simple_table("IRR", [("IRR", f"{result.irr:.4f}%")])
+    rows = [("IRR", "n/a" if result.irr is None else f"{result.irr:.4f}%")]
+    if len(result.roots) > 1:
+        rows.append(("All IRRs", ", ".join(f"{root:.4f}%" for root in result.roots)))
+    rows.append(("Converged", "yes" if result.converged else "no"))
+    _simple_table("IRR", rows)
 
 
 def render_dcf(result: DcfResult) -> None:
@@ -49,6 +55,16 @@ def render_dcf(result: DcfResult) -> None:
     )
 
 
+def render_dcf_grid(result: DcfGridResult) -> None:
+    table = Table(title="DCF Total Value (discount rate x terminal growth)")
+    table.add_column("Rate \\ Growth")
+    for growth in result.terminal_growths:
+        table.add_column(f"{growth:.2%}", justify="right")
+    for rate, row in zip(result.discount_rates, result.total_value):
+        table.add_row(f"{rate:.2f}%", *(f"{value:,.0f}" if value is not None else "-" for value in row))
+    Console().print(table)
+
+
 def render_comps(result: CompsResult) -> None:
     _simple_table(
         "Comps",
@@ -58,3 +74,25 @@ def render_comps(result: CompsResult) -> None:
             ("High", f"{result.high:,.2f}"),
         ],
     )
+
+
+def render_comps_table(result: CompsTableResult) -> None:
+    def fmt(value: float | None) -> str:
+        return "-" if value is None else f"{value:,.2f}"
+
+    table = Table(title=f"Comps ({result.peers:,} peers)")
+    for column in ("Multiple", "Count", "Low", "Median", "High", "Trimmed Mean", "Robust Range", "Outliers", "Implied Median"):
+        table.add_column(column, justify="left" if column == "Multiple" else "right")
+    for item in result.metrics:
+        table.add_row(
+            item.name,
+            f"{item.count:,}",
+            fmt(item.low),
+            fmt(item.median),
+            fmt(item.high),
+            fmt(item.trimmed_mean),
+            f"{fmt(item.robust_low)} - {fmt(item.robust_high)}",
+            str(item.outliers),
+            fmt(item.implied_median),
+        )
+    Console().print(table)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from rich.console import Console
 from rich.table import Table
 
-from qfinancetools.models.loans import LoanResult, AmortizationRow
+from qfinancetools.models.loans import LoanResult, AmortizationSchedule
 
 
 def render_loan_summary(result: LoanResult) -> None:
@@ -35,7 +35,7 @@ def render_loan_summary(result: LoanResult) -> None:
         Console().print(explain)
 
 
-def render_amortization(rows: list[AmortizationRow]) -> None:
+def render_amortization(rows: AmortizationSchedule) -> None:
     table = Table(title="Amortization Schedule")
     table.add_column("Month", justify="right")
     table.add_column("Payment", justify="right")
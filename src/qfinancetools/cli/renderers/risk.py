@@ -6,6 +6,9 @@ from rich.table import Table
 from qfinancetools.models.risk import (
     ScenarioResult,
     SensitivityResult,
+    MonteCarloDcfResult,
+    MonteCarloHistogram,
+    MonteCarloPaths,
     MonteCarloResult,
     StressTestResult,
 )
@@ -60,6 +63,39 @@ def render_sensitivity(result: SensitivityResult) -> None:
     _render_explain_and_warnings(result.warnings, result.explanation)
 
 
+def _render_histogram(histogram: MonteCarloHistogram) -> None:
+    table = Table(title="Distribution")
+    table.add_column("From", justify="right")
+    table.add_column("To", justify="right")
+    table.add_column("Count", justify="right")
+    table.add_column("")
+    peak = max(histogram.counts) or 1
+    for idx, count in enumerate(histogram.counts):
+        table.add_row(
+            f"{histogram.edges[idx]:,.2f}",
+            f"{histogram.edges[idx + 1]:,.2f}",
+            str(count),
+            "█" * round(30 * count / peak),
+        )
+    Console().print(table)
+
+
+def _render_path_bands(paths: MonteCarloPaths) -> None:
+    table = Table(title=f"Path Bands ({paths.file})")
+    table.add_column("Year", justify="right")
+    table.add_column("P5", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("P95", justify="right")
+    for year in range(paths.years):
+        table.add_row(
+            str(year + 1),
+            f"{paths.p5[year]:,.2f}",
+            f"{paths.median[year]:,.2f}",
+            f"{paths.p95[year]:,.2f}",
+        )
+    Console().print(table)
+
+
 def render_monte_carlo(result: MonteCarloResult) -> None:
     _simple_table(
         "Monte Carlo",
@@ -70,6 +106,26 @@ def render_monte_carlo(result: MonteCarloResult) -> None:
             ("P95", f"{result.p95:,.2f}"),
         ],
     )
+    if result.histogram:
+        _render_histogram(result.histogram)
+    if result.paths:
+        _render_path_bands(result.paths)
+    _render_explain_and_warnings(result.warnings, result.explanation)
+
+
+def render_monte_carlo_dcf(result: MonteCarloDcfResult) -> None:
+    _simple_table(
+        "Monte Carlo DCF",
+        [
+            ("Valid Simulations", f"{result.valid_simulations:,}"),
+            ("Mean Value", f"{result.mean:,.2f}"),
+            ("Median Value", f"{result.median:,.2f}"),
+            ("P5", f"{result.p5:,.2f}"),
+            ("P95", f"{result.p95:,.2f}"),
+        ],
+    )
+    if result.histogram is not None:
+        _render_histogram(result.histogram)
     _render_explain_and_warnings(result.warnings, result.explanation)
 
 
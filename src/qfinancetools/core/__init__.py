@@ -1,20 +1,36 @@
 from qfinancetools.core.loans import compute_monthly_payment, amortization_schedule, loan_summary
 from qfinancetools.core.investments import investment_growth
 from qfinancetools.core.afford import affordability
-from qfinancetools.core.corporate import wacc, capm, npv, irr, dcf, comps
+from qfinancetools.core.corporate import wacc, capm, npv, npv_batch, irr, irr_batch, dcf, dcf_grid, comps, comps_table
 from qfinancetools.core.bonds import (
     bond_price,
     bond_ytm,
     bond_duration,
     bond_convexity,
+    bond_analytics,
     bond_ladder,
+    bond_ladder_projection,
+    bond_portfolio,
+    bond_ytm_batch,
+    bond_price_curve,
+    bond_duration_curve,
 )
-from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, stress_test
+from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, monte_carlo_dcf, stress_test, load_monte_carlo_paths
 from qfinancetools.core.comparison import compare_scenarios
 from qfinancetools.core.timeline import build_unified_timeline
 from qfinancetools.core.goals import solve_investment_goal, solve_loan_payoff_goal
-from qfinancetools.core.plugins import discover_plugins
-from qfinancetools.core.stocks import stock_projection, stock_history, stock_backtest
+from qfinancetools.core.plugins import discover_plugins, discover_market_data_providers
+from qfinancetools.core.stocks import (
+    stock_projection,
+    stock_history,
+    stock_backtest,
+    YahooChartProvider,
+    CsvDirectoryProvider,
+    InMemoryProvider,
+    MarketDataProvider,
+    register_market_data_provider,
+    resolve_market_data_provider,
+)
 
 __all__ = [
     "compute_monthly_payment",
@@ -25,24 +41,43 @@ __all__ = [
     "wacc",
     "capm",
     "npv",
+    "npv_batch",
     "irr",
+    "irr_batch",
     "dcf",
+    "dcf_grid",
     "comps",
+    "comps_table",
     "bond_price",
     "bond_ytm",
     "bond_duration",
     "bond_convexity",
+    "bond_analytics",
     "bond_ladder",
+    "bond_ladder_projection",
+    "bond_portfolio",
+    "bond_ytm_batch",
+    "bond_price_curve",
+    "bond_duration_curve",
     "scenario",
     "sensitivity",
     "monte_carlo",
+    "monte_carlo_dcf",
+    "load_monte_carlo_paths",
     "stress_test",
     "compare_scenarios",
     "build_unified_timeline",
     "solve_investment_goal",
     "solve_loan_payoff_goal",
     "discover_plugins",
+    "discover_market_data_providers",
     "stock_projection",
     "stock_history",
     "stock_backtest",
+    "YahooChartProvider",
+    "CsvDirectoryProvider",
+    "InMemoryProvider",
+    "MarketDataProvider",
+    "register_market_data_provider",
+    "resolve_market_data_provider",
 ]
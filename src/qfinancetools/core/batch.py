@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def as_column(values: Sequence[float] | np.ndarray, name: str, size: int | None = None) -> np.ndarray:
+    column = np.asarray(values, dtype=np.float64).reshape(-1)
+    if size is not None and column.size != size:
+        raise ValueError(f"{name} must have {size} entries, got {column.size}")
+    return column
+
+
+def first_bad_row(mask: np.ndarray) -> int:
+    return int(np.flatnonzero(mask)[0])
@@ -1,99 +1,471 @@
 from __future__ import annotations
 
-from qfinancetools.core.guardrails import bonds_warnings
+import csv
+import math
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from qfinancetools.core.batch import as_column, first_bad_row
+from qfinancetools.core.guardrails import bonds_warnings, bonds_warnings_batch
+from qfinancetools.models.explain import WarningItem
 from qfinancetools.models.bonds import (
     BondPriceInput,
     BondPriceResult,
+    BondCurveInput,
+    YieldCurve,
     BondYtmInput,
     BondYtmResult,
+    BondYtmBatchResult,
     BondDurationInput,
     BondDurationResult,
     BondConvexityInput,
     BondConvexityResult,
+    BondAnalyticsInput,
+    BondAnalyticsResult,
     BondLadderInput,
     BondLadderResult,
+    BondLadderProjection,
+    BondLadderProjectionInput,
+    BondPortfolioResult,
 )
 
+# Caps the padded (bonds x periods) cash-flow block so large inventories are priced in bounded memory.
+_PORTFOLIO_BLOCK_CELLS = 2_000_000
 
-def bond_price(data: BondPriceInput) -> BondPriceResult:
-    periods = data.years * data.payments_per_year
-    rate = data.yield_rate / 100 / data.payments_per_year
-    coupon = data.face_value * data.coupon_rate / 100 / data.payments_per_year
+# Below this per-period rate the closed-form sums lose precision to cancellation; sum the cash flows directly.
+_CLOSED_FORM_MIN_RATE = 0.005
+
+
+def _discount_sums(rate: float, periods: int) -> tuple[float, float, float, float]:
+    # Sums of v^t, t*v^t and t*(t+1)*v^t over t = 1..periods with v = 1/(1+rate), plus v^periods.
+    if abs(rate) < _CLOSED_FORM_MIN_RATE:
+        t = np.arange(1, periods + 1, dtype=np.float64)
+        discount = (1 + rate) ** -t
+        return float(discount.sum()), float(t @ discount), float((t * (t + 1)) @ discount), float(discount[-1])
+
+    n = periods
+    v = 1 / (1 + rate)
+    vn = v**n
+    one_minus_v = rate / (1 + rate)
+    level = (1 - vn) / rate
+    weighted = v * (1 - (n + 1) * vn + n * vn * v) / one_minus_v**2
+    convex = 2 * v * (1 - vn * (n + 1) * (n + 2) / 2 + vn * v * n * (n + 2) - vn * v * v * n * (n + 1) / 2) / one_minus_v**3
+    return level, weighted, convex, vn
+
+
+def _bond_kernel(
+    face_value: float, coupon_rate: float, yield_rate: float, years: int, payments_per_year: int
+) -> tuple[float, float, float, float]:
+    periods = years * payments_per_year
+    rate = yield_rate / 100 / payments_per_year
+    coupon = face_value * coupon_rate / 100 / payments_per_year
+    level, weighted, convex, final_discount = _discount_sums(rate, periods)
 
-    price = 0.0
-    for t in range(1, periods + 1):
-        price += coupon / ((1 + rate) ** t)
-    price += data.face_value / ((1 + rate) ** periods)
+    price = coupon * level + face_value * final_discount
+    macaulay = (coupon * weighted + periods * face_value * final_discount) / price / payments_per_year
+    modified = macaulay / (1 + rate)
+    convexity_sum = coupon * convex + periods * (periods + 1) * face_value * final_discount
+    convexity = convexity_sum / (price * (1 + rate) ** 2) / (payments_per_year**2)
+    return price, macaulay, modified, convexity
 
+
+def bond_price(data: BondPriceInput) -> BondPriceResult:
+    price, _, _, _ = _bond_kernel(data.face_value, data.coupon_rate, data.yield_rate, data.years, data.payments_per_year)
     warnings = bonds_warnings(yield_rate=data.yield_rate, coupon_rate=data.coupon_rate, years=data.years)
     return BondPriceResult(price=price, warnings=warnings)
 
 
+def _curve_present_values(data: BondCurveInput) -> np.ndarray:
+    periods = data.years * data.payments_per_year
+    discount = data.curve.discount_factors(data.payments_per_year, periods)
+    cash_flows = np.full(periods, data.face_value * data.coupon_rate / 100 / data.payments_per_year)
+    cash_flows[-1] += data.face_value
+    return cash_flows * discount
+
+
+def bond_price_curve(data: BondCurveInput) -> BondPriceResult:
+    present_values = _curve_present_values(data)
+    warnings = bonds_warnings(yield_rate=max(data.curve.zero_rates), coupon_rate=data.coupon_rate, years=data.years)
+    return BondPriceResult(price=float(present_values.sum()), warnings=warnings)
+
+
+def bond_duration_curve(data: BondCurveInput) -> BondDurationResult:
+    present_values = _curve_present_values(data)
+    periods = present_values.size
+    k = np.arange(1, periods + 1, dtype=np.float64)
+    price = float(present_values.sum())
+    macaulay = float(k @ present_values) / price / data.payments_per_year
+    # Sensitivity to a parallel shift of the zero curve; equals modified duration on a flat curve.
+    growth = 1 + np.asarray(data.curve.zero_rate(k / data.payments_per_year)) / 100 / data.payments_per_year
+    modified = float((k / growth) @ present_values) / price / data.payments_per_year
+    warnings = bonds_warnings(yield_rate=max(data.curve.zero_rates), coupon_rate=data.coupon_rate, years=data.years)
+    return BondDurationResult(macaulay_duration=macaulay, modified_duration=modified, warnings=warnings)
+
+
+def _price_and_slope(face_value: float, coupon: float, rate: float, periods: int) -> tuple[float, float]:
+    try:
+        level, weighted, _, final_discount = _discount_sums(rate, periods)
+    except OverflowError:
+        return math.inf, -math.inf
+    price = coupon * level + face_value * final_discount
+    slope = -(coupon * weighted + periods * face_value * final_discount) / (1 + rate)
+    return price, slope
+
+
+def _brent(f: Callable[[float], float], low: float, high: float, f_low: float, f_high: float, tol: float, max_iter: int) -> tuple[float, int, bool]:
+    if not f_low * f_high <= 0:
+        # Without a sign change there is no root to converge on; report the endpoint as unconverged.
+        return (low if abs(f_low) < abs(f_high) else high), 0, False
+    a, b, fa, fb = low, high, f_low, f_high
+    c, fc = a, fa
+    d = e = b - a
+    for iteration in range(1, max_iter + 1):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2 * 2.2e-16 * abs(b) + tol / 2
+        midpoint = (c - b) / 2
+        if abs(midpoint) <= tol1 or fb == 0:
+            return b, iteration, True
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * midpoint * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * midpoint * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * midpoint * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = midpoint
+        else:
+            d = e = midpoint
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, midpoint)
+        fb = f(b)
+    return b, max_iter, False
+
+
 def bond_ytm(data: BondYtmInput) -> BondYtmResult:
     periods = data.years * data.payments_per_year
     coupon = data.face_value * data.coupon_rate / 100 / data.payments_per_year
+    price_tol = 1e-10 * data.price
 
-    low, high = 0.0, 1.0
-    for _ in range(100):
-        mid = (low + high) / 2
-        price = 0.0
-        for t in range(1, periods + 1):
-            price += coupon / ((1 + mid) ** t)
-        price += data.face_value / ((1 + mid) ** periods)
-        if abs(price - data.price) < 1e-8:
-            warnings = bonds_warnings(coupon_rate=data.coupon_rate, years=data.years)
-            return BondYtmResult(yield_rate=mid * data.payments_per_year * 100, warnings=warnings)
-        if price > data.price:
-            low = mid
+    def excess(rate: float) -> float:
+        return _price_and_slope(data.face_value, coupon, rate, periods)[0] - data.price
+
+    # Price falls monotonically as the yield rises, so any root is unique and a bracket always exists.
+    rate = max(data.guess / data.payments_per_year, -0.95)
+    low, high = -1.0, math.inf
+    converged = False
+    method = "newton"
+    iterations = 0
+    for iterations in range(1, 51):
+        price, slope = _price_and_slope(data.face_value, coupon, rate, periods)
+        diff = price - data.price
+        if abs(diff) <= price_tol:
+            converged = True
+            break
+        if diff > 0:
+            low = max(low, rate)
         else:
-            high = mid
+            high = min(high, rate)
+        step = diff / slope if slope != 0 and math.isfinite(slope) else 0.0
+        candidate = rate - step
+        if not (low < candidate < high) or step == 0:
+            break
+        if abs(step) <= 1e-14 * max(1.0, abs(candidate)):
+            rate = candidate
+            converged = True
+            break
+        rate = candidate
+
+    if not converged:
+        method = "brent"
+        if low <= -1.0:
+            low = min(rate, 0.0)
+            for _ in range(200):
+                if excess(low) >= 0:
+                    break
+                low = -1 + (low + 1) / 2
+        if not math.isfinite(high):
+            high = max(rate, 0.0) + 0.1
+            while excess(high) > 0 and high < 1e6:
+                high = high * 2 + 0.1
+        f_low, f_high = excess(low), excess(high)
+        # The expansions are capped, so the bracket can still miss the root; Brent only runs on a real sign change.
+        if f_low >= 0 >= f_high:
+            rate, brent_iterations, converged = _brent(excess, low, high, f_low, f_high, 1e-15, 200)
+            iterations += brent_iterations
 
     warnings = bonds_warnings(coupon_rate=data.coupon_rate, years=data.years)
-    return BondYtmResult(yield_rate=mid * data.payments_per_year * 100, warnings=warnings)
+    if not converged:
+        warnings.append(WarningItem(code="bonds.ytm_not_converged", message="Yield solver did not converge; result is the last iterate."))
+    return BondYtmResult(
+        yield_rate=rate * data.payments_per_year * 100,
+        iterations=iterations,
+        converged=converged,
+        method=method,
+        warnings=warnings,
+    )
 
 
-def bond_duration(data: BondDurationInput) -> BondDurationResult:
-    periods = data.years * data.payments_per_year
-    rate = data.yield_rate / 100 / data.payments_per_year
-    coupon = data.face_value * data.coupon_rate / 100 / data.payments_per_year
+def _price_and_slope_array(
+    face: np.ndarray, coupon: np.ndarray, rate: np.ndarray, periods: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    price = np.empty(rate.size)
+    weighted = np.empty(rate.size)
+    direct = np.abs(rate) < _CLOSED_FORM_MIN_RATE
+    if direct.any():
+        t = np.arange(1, int(periods[direct].max()) + 1, dtype=np.float64)
+        cash_flows = np.where(t <= periods[direct, None], coupon[direct, None], 0.0)
+        cash_flows[np.arange(int(direct.sum())), periods[direct].astype(np.int64) - 1] += face[direct]
+        cash_flows *= (1 + rate[direct, None]) ** -t
+        price[direct] = cash_flows.sum(axis=1)
+        weighted[direct] = cash_flows @ t
+    closed = ~direct
+    if closed.any():
+        r, n = rate[closed], periods[closed]
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            v = 1 / (1 + r)
+            vn = v**n
+            level = (1 - vn) / r
+            sums = v * (1 - (n + 1) * vn + n * vn * v) / (r / (1 + r)) ** 2
+            price[closed] = coupon[closed] * level + face[closed] * vn
+            weighted[closed] = coupon[closed] * sums + n * face[closed] * vn
+    with np.errstate(over="ignore", invalid="ignore"):
+        slope = -weighted / (1 + rate)
+    return price, slope
+
+
+def bond_ytm_batch(
+    face_value: Sequence[float] | np.ndarray,
+    coupon_rate: Sequence[float] | np.ndarray,
+    price: Sequence[float] | np.ndarray,
+    years: Sequence[int] | np.ndarray,
+    payments_per_year: Sequence[int] | np.ndarray | int = 2,
+    max_iter: int = 50,
+) -> BondYtmBatchResult:
+    face_col = as_column(face_value, "face_value")
+    size = face_col.size
+    coupon_col = as_column(coupon_rate, "coupon_rate", size)
+    price_col = as_column(price, "price", size)
+    years_col = as_column(years, "years", size)
+    freq_col = (
+        np.full(size, float(payments_per_year))
+        if np.isscalar(payments_per_year)
+        else as_column(payments_per_year, "payments_per_year", size)
+    )
+
+    for name, mask in (
+        ("face_value must be positive", ~(face_col > 0)),
+        ("coupon_rate must be non-negative", ~(coupon_col >= 0)),
+        ("price must be positive", ~(price_col > 0)),
+        ("years must be a positive integer", ~(years_col > 0) | (years_col != np.floor(years_col))),
+        ("payments_per_year must be a positive integer", ~(freq_col > 0) | (freq_col != np.floor(freq_col))),
+    ):
+        if mask.any():
+            raise ValueError(f"row {first_bad_row(mask)}: {name}")
 
-    pv_total = 0.0
-    weighted_sum = 0.0
-    for t in range(1, periods + 1):
-        cash = coupon
-        if t == periods:
-            cash += data.face_value
-        pv = cash / ((1 + rate) ** t)
-        pv_total += pv
-        weighted_sum += t * pv
+    periods = years_col * freq_col
+    coupon = face_col * coupon_col / 100 / freq_col
+    # Seed every bond from the textbook approximate yield, then iterate only the rows still unsolved.
+    rate = np.clip((coupon + (face_col - price_col) / periods) / ((face_col + price_col) / 2), -0.9, 10.0)
+    low = np.full(size, -1.0)
+    high = np.full(size, np.inf)
+    iterations = np.zeros(size, dtype=np.int64)
+    converged = np.zeros(size, dtype=bool)
+    active = np.arange(size)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        iterations[active] += 1
+        r = rate[active]
+        model_price, slope = _price_and_slope_array(face_col[active], coupon[active], r, periods[active])
+        diff = model_price - price_col[active]
+        solved = np.abs(diff) <= 1e-10 * price_col[active]
+        low[active] = np.where(diff > 0, np.maximum(low[active], r), low[active])
+        high[active] = np.where(diff < 0, np.minimum(high[active], r), high[active])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            candidate = r - diff / slope
+        lo, hi = low[active], high[active]
+        # Steps that leave the bracket (or are not finite) fall back to bisection, or bracket expansion when unbounded.
+        outside = ~((candidate > lo) & (candidate < hi))
+        fallback = np.where(np.isfinite(hi), (lo + hi) / 2, 2 * np.maximum(r, 0.0) + 0.1)
+        candidate = np.where(outside, fallback, candidate)
+        done = solved | (~outside & (np.abs(candidate - r) <= 1e-14 * np.maximum(1.0, np.abs(candidate))))
+        rate[active] = np.where(solved, r, candidate)
+        converged[active[done]] = True
+        active = active[~done]
+
+    method = np.full(size, "newton", dtype=object)
+    for idx in active.tolist():
+        single = bond_ytm(
+            BondYtmInput(
+                face_value=face_col[idx],
+                coupon_rate=coupon_col[idx],
+                price=price_col[idx],
+                years=int(years_col[idx]),
+                payments_per_year=int(freq_col[idx]),
+            )
+        )
+        rate[idx] = single.yield_rate / 100 / freq_col[idx]
+        iterations[idx] += single.iterations
+        converged[idx] = single.converged
+        method[idx] = single.method
+
+    warnings = bonds_warnings_batch(coupon_rate=coupon_col, years=years_col)
+    for idx in np.flatnonzero(~converged).tolist():
+        warnings.setdefault(idx, []).append(
+            WarningItem(code="bonds.ytm_not_converged", message="Yield solver did not converge; result is the last iterate.")
+        )
+
+    return BondYtmBatchResult(
+        yield_rate=rate * freq_col * 100,
+        iterations=iterations,
+        converged=converged,
+        method=method,
+        warnings=warnings,
+    )
 
-    macaulay = weighted_sum / pv_total / data.payments_per_year
-    modified = macaulay / (1 + data.yield_rate / 100 / data.payments_per_year)
 
+def bond_duration(data: BondDurationInput) -> BondDurationResult:
+    _, macaulay, modified, _ = _bond_kernel(data.face_value, data.coupon_rate, data.yield_rate, data.years, data.payments_per_year)
     warnings = bonds_warnings(yield_rate=data.yield_rate, coupon_rate=data.coupon_rate, years=data.years)
     return BondDurationResult(macaulay_duration=macaulay, modified_duration=modified, warnings=warnings)
 
 
 def bond_convexity(data: BondConvexityInput) -> BondConvexityResult:
-    periods = data.years * data.payments_per_year
-    rate = data.yield_rate / 100 / data.payments_per_year
-    coupon = data.face_value * data.coupon_rate / 100 / data.payments_per_year
-
-    pv_total = 0.0
-    convex_sum = 0.0
-    for t in range(1, periods + 1):
-        cash = coupon
-        if t == periods:
-            cash += data.face_value
-        discount = (1 + rate) ** t
-        pv = cash / discount
-        pv_total += pv
-        convex_sum += t * (t + 1) * cash / (discount * (1 + rate) ** 0)
+    _, _, _, convexity = _bond_kernel(data.face_value, data.coupon_rate, data.yield_rate, data.years, data.payments_per_year)
+    warnings = bonds_warnings(yield_rate=data.yield_rate, coupon_rate=data.coupon_rate, years=data.years)
+    return BondConvexityResult(convexity=convexity, warnings=warnings)
 
-    convexity = convex_sum / (pv_total * (1 + rate) ** 2) / (data.payments_per_year**2)
 
+def bond_analytics(data: BondAnalyticsInput) -> BondAnalyticsResult:
+    price, macaulay, modified, convexity = _bond_kernel(
+        data.face_value, data.coupon_rate, data.yield_rate, data.years, data.payments_per_year
+    )
     warnings = bonds_warnings(yield_rate=data.yield_rate, coupon_rate=data.coupon_rate, years=data.years)
-    return BondConvexityResult(convexity=convexity, warnings=warnings)
+    return BondAnalyticsResult(
+        price=price,
+        macaulay_duration=macaulay,
+        modified_duration=modified,
+        convexity=convexity,
+        warnings=warnings,
+    )
+
+
+def _portfolio_block(
+    face: np.ndarray, coupon: np.ndarray, rate: np.ndarray, periods: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Every bond shares one period axis padded to the longest maturity; cash flows past maturity are zero.
+    t = np.arange(1, int(periods.max()) + 1, dtype=np.float64)
+    cash_flows = np.where(t <= periods[:, None], coupon[:, None], 0.0)
+    cash_flows[np.arange(face.size), periods.astype(np.int64) - 1] += face
+    cash_flows *= (1 + rate[:, None]) ** -t
+    return cash_flows.sum(axis=1), cash_flows @ t, cash_flows @ (t * (t + 1))
+
+
+def bond_portfolio(
+    face_value: Sequence[float] | np.ndarray,
+    coupon_rate: Sequence[float] | np.ndarray,
+    yield_rate: Sequence[float] | np.ndarray,
+    years: Sequence[int] | np.ndarray,
+    payments_per_year: Sequence[int] | np.ndarray | int = 2,
+) -> BondPortfolioResult:
+    face_col = as_column(face_value, "face_value")
+    size = face_col.size
+    if size == 0:
+        raise ValueError("portfolio must contain at least one bond")
+    coupon_col = as_column(coupon_rate, "coupon_rate", size)
+    yield_col = as_column(yield_rate, "yield_rate", size)
+    years_col = as_column(years, "years", size)
+    freq_col = (
+        np.full(size, float(payments_per_year))
+        if np.isscalar(payments_per_year)
+        else as_column(payments_per_year, "payments_per_year", size)
+    )
+
+    for name, mask in (
+        ("face_value must be positive", ~(face_col > 0)),
+        ("coupon_rate must be non-negative", ~(coupon_col >= 0)),
+        ("yield_rate must be non-negative", ~(yield_col >= 0)),
+        ("years must be a positive integer", ~(years_col > 0) | (years_col != np.floor(years_col))),
+        ("payments_per_year must be a positive integer", ~(freq_col > 0) | (freq_col != np.floor(freq_col))),
+    ):
+        if mask.any():
+            raise ValueError(f"row {first_bad_row(mask)}: {name}")
+
+    periods = years_col * freq_col
+    rate = yield_col / 100 / freq_col
+    coupon = face_col * coupon_col / 100 / freq_col
+
+    price = np.empty(size)
+    weighted = np.empty(size)
+    convex = np.empty(size)
+    # Sorting by maturity keeps each block's padding close to its own longest bond.
+    order = np.argsort(periods, kind="stable")
+    block_rows = max(1, _PORTFOLIO_BLOCK_CELLS // int(periods.max()))
+    for start in range(0, size, block_rows):
+        idx = order[start : start + block_rows]
+        price[idx], weighted[idx], convex[idx] = _portfolio_block(face_col[idx], coupon[idx], rate[idx], periods[idx])
+
+    macaulay = weighted / price / freq_col
+    modified = macaulay / (1 + rate)
+    convexity = convex / (price * (1 + rate) ** 2) / freq_col**2
+
+    market_value = float(price.sum())
+    weights = price / market_value
+
+    return BondPortfolioResult(
+        price=price,
+        macaulay_duration=macaulay,
+        modified_duration=modified,
+        convexity=convexity,
+        market_value=market_value,
+        face_value=float(face_col.sum()),
+        macaulay_duration_total=float(weights @ macaulay),
+        modified_duration_total=float(weights @ modified),
+        convexity_total=float(weights @ convexity),
+        warnings=bonds_warnings_batch(yield_rate=yield_col, coupon_rate=coupon_col, years=years_col),
+    )
+
+
+def iter_bond_table(
+    path: str | Path, required: Sequence[str], chunk_rows: int = 50_000
+) -> Iterator[dict[str, np.ndarray]]:
+    with Path(path).open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        fieldnames = reader.fieldnames or []
+        missing = set(required) - set(fieldnames)
+        if missing:
+            raise ValueError(f"bond table is missing columns: {', '.join(sorted(missing))}")
+        columns = [*required, *(["payments_per_year"] if "payments_per_year" in fieldnames else [])]
+        rows: list[dict[str, str]] = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= chunk_rows:
+                yield _bond_columns(rows, columns)
+                rows = []
+        if rows:
+            yield _bond_columns(rows, columns)
+
+
+def _bond_columns(rows: list[dict[str, str]], columns: list[str]) -> dict[str, np.ndarray]:
+    table: dict[str, np.ndarray] = {}
+    for name in columns:
+        default = "2" if name == "payments_per_year" else ""
+        table[name] = np.array([row[name] or default for row in rows], dtype=np.float64)
+    return table
 
 
 def bond_ladder(data: BondLadderInput) -> BondLadderResult:
@@ -116,3 +488,114 @@ def bond_ladder(data: BondLadderInput) -> BondLadderResult:
         schedule=schedule,
         warnings=bonds_warnings(years=max(data.maturities)),
     )
+
+
+def _ladder_flows(
+    face: np.ndarray, coupon: np.ndarray, start: np.ndarray, end: np.ndarray, periods: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Coupons accrue over (start, end] as a difference array; principal returns at end and is repurchased at start.
+    stop = np.minimum(end, periods) + 1
+    steps = np.bincount(start + 1, weights=coupon, minlength=periods + 2) - np.bincount(stop, weights=coupon, minlength=periods + 2)
+    coupons = np.cumsum(steps)[1 : periods + 1]
+    matured = end <= periods
+    principal = np.bincount(end[matured], weights=face[matured], minlength=periods + 1)[1:].astype(np.float64)
+    bought = start > 0
+    repurchased = 0.0 - np.bincount(start[bought], weights=face[bought], minlength=periods + 1)[1:]
+    return coupons, principal, repurchased
+
+
+def _flat_rate(cash_flows: np.ndarray, cost: float, guess: float) -> tuple[float, float, bool]:
+    t = np.arange(1, cash_flows.size + 1, dtype=np.float64)
+
+    def excess(rate: float) -> float:
+        return float(cash_flows @ (1 + rate) ** -t) - cost
+
+    rate = guess
+    for _ in range(50):
+        discounted = cash_flows * (1 + rate) ** -t
+        diff = float(discounted.sum()) - cost
+        slope = -float(t @ discounted) / (1 + rate)
+        if slope == 0 or not math.isfinite(slope):
+            break
+        step = diff / slope
+        rate -= step
+        if not -1 < rate < 1e6:
+            break
+        if abs(step) <= 1e-14 * max(1.0, abs(rate)):
+            return rate, float(t @ (cash_flows * (1 + rate) ** -t)), True
+    low, high = -0.5, 0.5
+    for _ in range(200):
+        if excess(low) >= 0:
+            break
+        low = -1 + (low + 1) / 2
+    while excess(high) > 0 and high < 1e6:
+        high = high * 2
+    # Both expansions are capped like bond_ytm's, so a degenerate ladder ends unbracketed instead of spinning.
+    rate, _, converged = _brent(excess, low, high, excess(low), excess(high), 1e-15, 200)
+    return rate, float(t @ (cash_flows * (1 + rate) ** -t)), converged
+
+
+def bond_ladder_projection(data: BondLadderProjectionInput) -> BondLadderProjection:
+    ppy = data.payments_per_year
+    amounts = np.asarray(data.amounts, dtype=np.float64)
+    coupon_rates = np.asarray(data.coupon_rates, dtype=np.float64)
+    maturity = np.asarray(data.maturities, dtype=np.int64) * ppy
+    if data.yield_rates is None:
+        face = amounts
+    else:
+        unit = bond_portfolio(np.ones(amounts.size), coupon_rates, data.yield_rates, data.maturities, ppy)
+        face = amounts / unit.price
+
+    horizon_years = data.horizon_years or max(data.maturities)
+    periods = horizon_years * ppy
+    term = (data.reinvest_years or max(data.maturities)) * ppy
+    rung = np.arange(amounts.size)
+    generation = np.zeros(amounts.size, dtype=np.int64)
+    if data.reinvest:
+        # Each matured rung rolls into a new one of the reinvestment term until the horizon is reached.
+        rolls = np.maximum(0, -(-(periods - maturity) // term))
+        rung = np.repeat(rung, rolls + 1)
+        generation = np.arange(rung.size) - np.repeat(np.cumsum(rolls + 1) - (rolls + 1), rolls + 1)
+    end = maturity[rung] + generation * term
+    start = np.where(generation == 0, 0, end - term)
+    rates = coupon_rates[rung]
+    if data.reinvest_rate is not None:
+        rates = np.where(generation == 0, rates, data.reinvest_rate)
+    coupon_flows = face[rung] * rates / 100 / ppy
+    coupons, principal, reinvested = _ladder_flows(face[rung], coupon_flows, start, end, periods)
+
+    # Ladder yield and duration describe the purchased rungs held to maturity, before any reinvestment.
+    initial = generation == 0
+    held_coupons, held_principal, _ = _ladder_flows(
+        face[rung][initial], coupon_flows[initial], start[initial], end[initial], int(maturity.max())
+    )
+    held = held_coupons + held_principal
+    total = float(amounts.sum())
+    guess = float(coupon_rates @ amounts) / total / 100 / ppy
+    rate, weighted, converged = _flat_rate(held, total, guess)
+    macaulay = weighted / total / ppy
+
+    month = np.arange(1, periods + 1, dtype=np.int64) * (12 // ppy)
+    net = coupons + principal + reinvested
+    annual_income = coupons.reshape(horizon_years, ppy).sum(axis=1)
+    warnings = bonds_warnings(coupon_rate=float(coupon_rates.max()), years=max(data.maturities))
+    if not converged:
+        warnings.append(
+            WarningItem(
+                code="bonds.ladder_yield_not_converged",
+                message="Ladder yield solver found no bracketing rate; yield and duration are the closest iterate.",
+            )
+        )
+    return BondLadderProjection(
+        month=month,
+        coupon=coupons,
+        principal=principal,
+        reinvested=reinvested,
+        net=net,
+        annual_income=annual_income,
+        total_invested=total,
+        ladder_yield=rate * ppy * 100,
+        macaulay_duration=macaulay,
+        modified_duration=macaulay / (1 + rate),
+        warnings=warnings,
+    )
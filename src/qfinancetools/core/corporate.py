@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import csv
 import math
+from collections.abc import Iterator, Sequence
+from pathlib import Path
 
+import numpy as np
+
+from qfinancetools.models.explain import WarningItem
 from qfinancetools.models.corporate import (
     WaccInput,
     WaccResult,
@@ -11,10 +17,16 @@ from qfinancetools.models.corporate import (
     NpvResult,
     IrrInput,
     IrrResult,
+    IrrBatchResult,
     DcfInput,
     DcfResult,
+    DcfGridInput,
+    DcfGridResult,
     CompsInput,
     CompsResult,
+    CompsMetricStats,
+    CompsTableInput,
+    CompsTableResult,
 )
 
 
@@ -41,39 +53,284 @@ def npv(data: NpvInput) -> NpvResult:
     return NpvResult(npv=value)
 
 
-def _npv_for_rate(cash_flows: list[float], rate: float) -> float:
+def _irr_newton(cash_flows: np.ndarray, guess: float) -> tuple[float, int, bool]:
+    t = np.arange(cash_flows.size, dtype=np.float64)
+    weights = t * cash_flows
+    rate = guess
+    iterations = 0
+    with np.errstate(over="ignore", invalid="ignore"):
+        for iterations in range(1, 101):
+            discount = (1 + rate) ** -t
+            derivative = -float(weights @ discount) / (1 + rate)
+            if derivative == 0 or not math.isfinite(derivative):
+                break
+            next_rate = rate - float(cash_flows @ discount) / derivative
+            if not next_rate > -1:
+                break
+            if abs(next_rate - rate) < 1e-10:
+                return next_rate, iterations, True
+            rate = next_rate
+
+        low, high = -0.99, 10.0
+        for step in range(1, 201):
+            mid = (low + high) / 2
+            value = float(cash_flows @ (1 + mid) ** -t)
+            if abs(value) < 1e-8:
+                return mid, iterations + step, True
+            if value > 0:
+                low = mid
+            else:
+                high = mid
+    return rate, iterations + 200, False
+
+
+_ROOT_SCAN_POINTS = 1024
+
+
+def _horner(coefficients: list[float], x: float) -> float:
     value = 0.0
-    for idx, cash in enumerate(cash_flows):
-        value += cash / ((1 + rate) ** idx)
+    for coefficient in coefficients:
+        value = value * x + coefficient
     return value
 
 
+def _scan_positive_roots(cash_flows: np.ndarray, sign_changes: int) -> tuple[list[float], int] | None:
+    # Descartes' rule caps the positive roots at the coefficient sign changes, so a scan that sees that many sign
+    # flips has bracketed every root and the O(n^3) companion-matrix solve can be skipped.
+    nonzero = cash_flows[cash_flows != 0]
+    grid = np.arange(1, _ROOT_SCAN_POINTS + 1, dtype=np.float64) / _ROOT_SCAN_POINTS
+    # p(x) is sampled on (0, 1]; past x = 1 the sign comes from y**n * p(1 / y), which cannot overflow for y <= 1.
+    inverse = grid[-2::-1]
+    x = np.concatenate([grid, 1 / inverse])
+    values = np.concatenate([np.polyval(cash_flows[::-1], grid), np.polyval(cash_flows, inverse)])
+    signs = np.concatenate([np.sign(nonzero[:1]), np.sign(values), np.sign(nonzero[-1:])])
+    flips = np.flatnonzero(signs[1:] != signs[:-1])
+    # An exact zero, a root outside the sampled range or two roots between neighbours leaves it to the eigen-solve.
+    if not signs.all() or not flips.size or flips.size != sign_changes or flips[0] == 0 or flips[-1] == x.size:
+        return None
+    forward, backward = cash_flows[::-1].tolist(), cash_flows.tolist()
+    roots: list[float] = []
+    steps = 0
+    for idx in flips.tolist():
+        low, high = float(x[idx - 1]), float(x[idx])
+        inverted = high > 1
+        coefficients, a, b = (backward, 1 / high, 1 / low) if inverted else (forward, low, high)
+        f_a, f_b = _horner(coefficients, a), _horner(coefficients, b)
+        # Illinois regula falsi: superlinear inside the bracket, and halving the stale end keeps it from stalling.
+        root, side = a, 0
+        for _ in range(100):
+            steps += 1
+            previous, root = root, (a * f_b - b * f_a) / (f_b - f_a)
+            f_root = _horner(coefficients, root)
+            if f_root == 0 or abs(root - previous) <= 1e-15 * root:
+                break
+            if (f_root > 0) == (f_b > 0):
+                b, f_b = root, f_root
+                if side == -1:
+                    f_a /= 2
+                side = -1
+            else:
+                a, f_a = root, f_root
+                if side == 1:
+                    f_b /= 2
+                side = 1
+        roots.append(1 / root if inverted else root)
+    return roots, steps
+
+
+def _irr_roots(cash_flows: np.ndarray) -> tuple[list[float], int]:
+    # NPV is a polynomial in the discount factor x = 1 / (1 + r); its real roots with x > 0 are exactly the IRRs.
+    signs = np.sign(cash_flows[cash_flows != 0])
+    sign_changes = int(np.count_nonzero(signs[1:] != signs[:-1]))
+    if sign_changes == 0:
+        return [], 0
+    if sign_changes == 1:
+        # Descartes' rule: exactly one positive root, so the cheap solver suffices.
+        rate, iterations, converged = _irr_newton(cash_flows, 0.1)
+        if converged:
+            return [rate], iterations
+
+    coefficients = cash_flows[::-1]
+    scanned = _scan_positive_roots(cash_flows, sign_changes)
+    if scanned is None:
+        candidates = np.roots(coefficients)
+        real = candidates[np.abs(candidates.imag) <= 1e-7 * np.maximum(1.0, np.abs(candidates))].real
+        positive, polish_steps = real[real > 0].tolist(), 0
+    else:
+        positive, polish_steps = scanned
+    polynomial, derivative = coefficients.tolist(), np.polyder(coefficients).tolist()
+    factors: list[float] = []
+    for x in positive:
+        # A few Newton steps on the polynomial recover digits the eigenvalue solve loses on long series.
+        for _ in range(5):
+            slope = _horner(derivative, x)
+            if slope == 0:
+                break
+            step = _horner(polynomial, x) / slope
+            polish_steps += 1
+            if not x - step > 0:
+                break
+            x -= step
+            if abs(step) <= 1e-15 * x:
+                break
+        factors.append(x)
+    rates: list[float] = []
+    for rate in sorted(1 / x - 1 for x in factors):
+        if not rates or rate - rates[-1] > 1e-8 * max(1.0, abs(rate)):
+            rates.append(rate)
+    return rates, polish_steps
+
+
+def _relative_residual(cash_flows: np.ndarray, rate: float) -> float:
+    t = np.arange(cash_flows.size, dtype=np.float64)
+    with np.errstate(over="ignore", invalid="ignore"):
+        discounted = cash_flows * (1 + rate) ** -t
+        scale = float(np.abs(discounted).sum())
+    return abs(float(discounted.sum())) / scale if scale else 0.0
+
+
 def irr(data: IrrInput) -> IrrResult:
-    cash_flows = data.cash_flows
-    rate = data.guess
-    for _ in range(100):
-        f = _npv_for_rate(cash_flows, rate)
-        derivative = 0.0
-        for idx, cash in enumerate(cash_flows[1:], start=1):
-            derivative -= idx * cash / ((1 + rate) ** (idx + 1))
-        if derivative == 0:
-            break
-        next_rate = rate - f / derivative
-        if abs(next_rate - rate) < 1e-10:
-            return IrrResult(irr=next_rate * 100)
-        rate = next_rate
-
-    low, high = -0.99, 10.0
-    for _ in range(200):
-        mid = (low + high) / 2
-        value = _npv_for_rate(cash_flows, mid)
-        if abs(value) < 1e-8:
-            return IrrResult(irr=mid * 100)
-        if value > 0:
-            low = mid
+    cash_flows = np.asarray(data.cash_flows, dtype=np.float64)
+    warnings: list[WarningItem] = []
+    if data.method == "roots":
+        roots, iterations = _irr_roots(cash_flows)
+        if roots:
+            rate = min(roots, key=lambda root: abs(root - data.guess))
+            residual = max(_relative_residual(cash_flows, root) for root in roots)
         else:
-            high = mid
-    return IrrResult(irr=rate * 100)
+            rate = residual = None
+        converged = residual is not None and residual <= 1e-9
+        if len(roots) > 1:
+            warnings.append(
+                WarningItem(
+                    code="corporate.multiple_irr",
+                    message=f"Cash flows have {len(roots)} IRRs; the reported rate is the one closest to the guess.",
+                )
+            )
+    else:
+        rate, iterations, converged = _irr_newton(cash_flows, data.guess)
+        roots = [rate] if converged else []
+        residual = _relative_residual(cash_flows, rate)
+
+    if not converged:
+        if data.method == "roots" and not roots:
+            message = "Cash flows have no IRR above -100%."
+        else:
+            message = "IRR solver did not converge; result is the last iterate."
+        warnings.append(WarningItem(code="corporate.irr_not_converged", message=message))
+    return IrrResult(
+        irr=None if rate is None else rate * 100,
+        roots=[root * 100 for root in roots],
+        converged=converged,
+        iterations=iterations,
+        residual=residual,
+        method=data.method,
+        warnings=warnings,
+    )
+
+
+def _cash_flow_matrix(cash_flows: Sequence[Sequence[float]] | np.ndarray, min_length: int) -> np.ndarray:
+    # Ragged rows are right-padded with zeros (trailing NaN padding is accepted too); trailing zeros leave NPV unchanged.
+    if isinstance(cash_flows, np.ndarray):
+        matrix = np.array(cash_flows, dtype=np.float64, ndmin=2)
+    else:
+        rows = [np.asarray(row, dtype=np.float64).reshape(-1) for row in cash_flows]
+        matrix = np.zeros((len(rows), max((row.size for row in rows), default=0)))
+        for idx, row in enumerate(rows):
+            matrix[idx, : row.size] = row
+    if matrix.ndim != 2 or matrix.shape[0] == 0:
+        raise ValueError("cash_flows must be a non-empty 2-D matrix or list of rows")
+    padding = np.isnan(matrix)
+    lengths = matrix.shape[1] - np.argmin(padding[:, ::-1], axis=1)
+    lengths[padding.all(axis=1)] = 0
+    short = lengths < min_length
+    if short.any():
+        raise ValueError(f"row {int(np.flatnonzero(short)[0])}: needs at least {min_length} cash flows")
+    padding &= np.arange(matrix.shape[1]) >= lengths[:, None]
+    bad = ~(np.isfinite(matrix) | padding).all(axis=1)
+    if bad.any():
+        raise ValueError(f"row {int(np.flatnonzero(bad)[0])}: cash flows must be finite")
+    return np.where(padding, 0.0, matrix)
+
+
+def npv_batch(
+    cash_flows: Sequence[Sequence[float]] | np.ndarray, discount_rate: float | Sequence[float] | np.ndarray
+) -> np.ndarray:
+    matrix = _cash_flow_matrix(cash_flows, 1)
+    rates = np.broadcast_to(np.asarray(discount_rate, dtype=np.float64), (matrix.shape[0],)) / 100
+    if (rates < 0).any():
+        raise ValueError(f"row {int(np.flatnonzero(rates < 0)[0])}: discount_rate must be non-negative")
+    t = np.arange(matrix.shape[1], dtype=np.float64)
+    return (matrix / (1 + rates[:, None]) ** t).sum(axis=1)
+
+
+def irr_batch(
+    cash_flows: Sequence[Sequence[float]] | np.ndarray, guess: float = 0.1, max_iter: int = 100
+) -> IrrBatchResult:
+    if guess < -0.99:
+        raise ValueError("guess must be at least -0.99")
+    matrix = _cash_flow_matrix(cash_flows, 2)
+    size = matrix.shape[0]
+    t = np.arange(matrix.shape[1], dtype=np.float64)
+    rate = np.full(size, guess)
+    iterations = np.zeros(size, dtype=np.int64)
+    converged = np.zeros(size, dtype=bool)
+    active = np.arange(size)
+    # Every unsolved project takes its Newton step together; rows leave the active set as they converge.
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        iterations[active] += 1
+        r = rate[active]
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            discounted = matrix[active] * (1 + r[:, None]) ** -t
+            f = discounted.sum(axis=1)
+            derivative = -(discounted @ t) / (1 + r)
+            candidate = r - f / derivative
+        failed = (derivative == 0) | ~np.isfinite(candidate) | (candidate <= -1)
+        done = ~failed & (np.abs(candidate - r) < 1e-10)
+        rate[active] = np.where(failed, r, candidate)
+        converged[active[done]] = True
+        active = active[~(done | failed)]
+
+    # Rows Newton could not settle fall back to a simultaneous bisection on [-0.99, 10].
+    pending = np.flatnonzero(~converged)
+    if pending.size:
+        low = np.full(pending.size, -0.99)
+        high = np.full(pending.size, 10.0)
+        rows = matrix[pending]
+        for _ in range(200):
+            mid = (low + high) / 2
+            value = (rows * (1 + mid[:, None]) ** -t).sum(axis=1)
+            hit = np.abs(value) < 1e-8
+            iterations[pending] += ~converged[pending]
+            rate[pending] = np.where(hit & ~converged[pending], mid, rate[pending])
+            converged[pending] |= hit
+            low = np.where(value > 0, mid, low)
+            high = np.where(value > 0, high, mid)
+            if converged[pending].all():
+                break
+
+    # Unlike the scalar solver, rows without a root report NaN rather than the last iterate.
+    return IrrBatchResult(irr=np.where(converged, rate * 100, np.nan), iterations=iterations, converged=converged)
+
+
+def iter_cash_flow_rows(path: str | Path, chunk_rows: int = 10_000) -> Iterator[list[list[float]]]:
+    with Path(path).open(newline="", encoding="utf-8") as handle:
+        chunk: list[list[float]] = []
+        for line_no, cells in enumerate(csv.reader(handle), start=1):
+            values = [cell.strip() for cell in cells if cell.strip()]
+            if not values:
+                continue
+            try:
+                chunk.append([float(value) for value in values])
+            except ValueError as exc:
+                raise ValueError(f"line {line_no}: {exc}") from exc
+            if len(chunk) >= chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
 
 def dcf(data: DcfInput) -> DcfResult:
@@ -96,10 +353,168 @@ def dcf(data: DcfInput) -> DcfResult:
     return DcfResult(present_value=pv, terminal_value=terminal_value, total_value=total_value)
 
 
+def dcf_grid(data: DcfGridInput) -> DcfGridResult:
+    rates = np.asarray(data.discount_rates, dtype=np.float64) / 100
+    growths = np.asarray(data.terminal_growths, dtype=np.float64)
+    if (rates < 0).any():
+        raise ValueError("discount_rates must be non-negative")
+    if (growths < -0.99).any():
+        raise ValueError("terminal_growths must be at least -0.99")
+    cash_flows = np.asarray(data.cash_flows, dtype=np.float64)
+    t = np.arange(1, cash_flows.size + 1, dtype=np.float64)
+
+    # Discount powers depend only on the rate axis, so they are built once and shared by every growth column.
+    discount = (1 + rates[:, None]) ** -t
+    present_value = discount @ cash_flows
+    spread = rates[:, None] - growths[None, :]
+    valid = spread > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terminal = np.where(valid, cash_flows[-1] * (1 + growths[None, :]) / spread, np.nan)
+    total = present_value[:, None] + terminal * discount[:, -1:]
+
+    warnings: list[WarningItem] = []
+    if not valid.all():
+        warnings.append(
+            WarningItem(
+                code="corporate.dcf_grid_invalid_cells",
+                message=f"{int((~valid).sum())} cells have terminal growth at or above the discount rate and are left empty.",
+            )
+        )
+
+    def cells(matrix: np.ndarray) -> list[list[float | None]]:
+        return [[value if valid_cell else None for value, valid_cell in zip(row, mask)] for row, mask in zip(matrix.tolist(), valid.tolist())]
+
+    return DcfGridResult(
+        discount_rates=list(data.discount_rates),
+        terminal_growths=list(data.terminal_growths),
+        present_value=present_value.tolist(),
+        terminal_value=cells(terminal),
+        total_value=cells(total),
+        warnings=warnings,
+    )
+
+
 def comps(data: CompsInput) -> CompsResult:
     multiples = sorted(data.multiples)
     low = multiples[0] * data.metric
     high = multiples[-1] * data.metric
-    mid = multiples[len(multiples) // 2]
+    half = len(multiples) // 2
+    mid = multiples[half] if len(multiples) % 2 else (multiples[half - 1] + multiples[half]) / 2
     median = mid * data.metric
     return CompsResult(low=low, high=high, median=median)
+
+
+def _ranked(partitioned: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    return np.take_along_axis(partitioned, np.maximum(ranks, 0)[None, :], axis=0)[0]
+
+
+def _quantile_ranks(counts: np.ndarray, q: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    position = q * (counts - 1)
+    below = np.floor(position).astype(np.int64)
+    return below, np.minimum(below + 1, np.maximum(counts - 1, 0)), position - below
+
+
+def comps_table(data: CompsTableInput) -> CompsTableResult:
+    names = list(data.multiples)
+    matrix = np.column_stack([np.array(data.multiples[name], dtype=np.float64) for name in names])
+    keep = np.ones(matrix.shape[0], dtype=bool)
+    if data.sectors is not None:
+        keep &= np.isin(np.asarray(data.sector, dtype=object), data.sectors)
+    if data.size is not None:
+        size = np.asarray(data.size, dtype=np.float64)
+        if data.min_size is not None:
+            keep &= size >= data.min_size
+        if data.max_size is not None:
+            keep &= size <= data.max_size
+    matrix = matrix[keep]
+    if matrix.shape[0] == 0:
+        raise ValueError("no peers match the filters")
+    matrix[~np.isfinite(matrix)] = np.nan
+    counts = np.count_nonzero(~np.isnan(matrix), axis=0)
+
+    # Every order statistic needed for every metric is gathered up front, so one partition (not a sort) serves them all.
+    trimmed = np.floor(data.trim * counts).astype(np.int64)
+    levels = sorted({*data.quantiles, 0.25, 0.5, 0.75})
+    quantile_ranks = {q: _quantile_ranks(counts, q) for q in levels}
+    rank_sets = [np.zeros_like(counts), counts - 1, trimmed, counts - trimmed - 1]
+    for below, above, _ in quantile_ranks.values():
+        rank_sets.extend([below, above])
+    ranks = np.concatenate(rank_sets)
+    kth = np.unique(ranks[ranks >= 0])
+    partitioned = np.partition(matrix, kth, axis=0)
+
+    def quantile(q: float) -> np.ndarray:
+        below, above, weight = quantile_ranks[q]
+        return _ranked(partitioned, below) * (1 - weight) + _ranked(partitioned, above) * weight
+
+    # Positions trimmed..count-trimmed-1 hold exactly the middle order statistics once both boundaries are partitioned.
+    running = np.vstack([np.zeros(matrix.shape[1]), np.nancumsum(partitioned, axis=0)])
+    upper = counts - trimmed
+    middle = np.take_along_axis(running, upper[None, :], axis=0)[0] - np.take_along_axis(running, trimmed[None, :], axis=0)[0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trimmed_mean = middle / (upper - trimmed)
+        mean = running[-1] / counts
+
+    q1, q3 = quantile(0.25), quantile(0.75)
+    spread = data.outlier_fence * (q3 - q1)
+    inside = (matrix >= q1 - spread) & (matrix <= q3 + spread)
+    robust_low = np.where(inside, matrix, np.inf).min(axis=0)
+    robust_high = np.where(inside, matrix, -np.inf).max(axis=0)
+    outliers = counts - np.count_nonzero(inside, axis=0)
+
+    low, high, median = _ranked(partitioned, np.zeros_like(counts)), _ranked(partitioned, counts - 1), quantile(0.5)
+    requested = {q: quantile(q) for q in data.quantiles}
+
+    def cell(values: np.ndarray, idx: int) -> float | None:
+        return float(values[idx]) if counts[idx] else None
+
+    metrics: list[CompsMetricStats] = []
+    warnings: list[WarningItem] = []
+    for idx, name in enumerate(names):
+        implied: dict[str, float | None] = {}
+        if name in data.subject and counts[idx]:
+            factor = data.subject[name]
+            implied = {
+                "implied_low": float(low[idx]) * factor,
+                "implied_median": float(median[idx]) * factor,
+                "implied_high": float(high[idx]) * factor,
+            }
+        if not counts[idx]:
+            warnings.append(WarningItem(code="corporate.comps_empty_metric", message=f"No peer reports {name} after filtering."))
+        metrics.append(
+            CompsMetricStats(
+                name=name,
+                count=int(counts[idx]),
+                low=cell(low, idx),
+                high=cell(high, idx),
+                median=cell(median, idx),
+                mean=cell(mean, idx),
+                trimmed_mean=cell(trimmed_mean, idx),
+                quantiles={f"p{q * 100:g}": cell(values, idx) for q, values in requested.items()},
+                robust_low=cell(robust_low, idx),
+                robust_high=cell(robust_high, idx),
+                outliers=int(outliers[idx]),
+                **implied,
+            )
+        )
+    return CompsTableResult(peers=int(matrix.shape[0]), metrics=metrics, warnings=warnings)
+
+
+def load_peer_table(
+    path: str | Path, columns: Sequence[str], sector_column: str = "sector", size_column: str = "market_cap"
+) -> dict[str, object]:
+    with Path(path).open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        fieldnames = reader.fieldnames or []
+        missing = set(columns) - set(fieldnames)
+        if missing:
+            raise ValueError(f"peer table is missing columns: {', '.join(sorted(missing))}")
+        rows = list(reader)
+    table: dict[str, object] = {
+        "multiples": {name: [float(row[name]) if row[name].strip() else None for row in rows] for name in columns}
+    }
+    if sector_column in fieldnames:
+        table["sector"] = [row[sector_column] for row in rows]
+    if size_column in fieldnames:
+        table["size"] = [float(row[size_column]) if row[size_column].strip() else float("nan") for row in rows]
+    return table
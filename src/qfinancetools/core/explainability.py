@@ -28,9 +28,12 @@ def investment_explanation(initial: float, monthly: float, annual_rate: float, y
     )
 
 
-def monte_carlo_explanation(mean: float, median: float, p5: float, p95: float) -> ExplanationBlock:
+def monte_carlo_explanation(mean: float, median: float, p5: float, p95: float, approximate: bool = False) -> ExplanationBlock:
+    summary = "Distribution statistics are computed from sorted simulation outcomes."
+    if approximate:
+        summary = "Distribution statistics are streamed through a quantile sketch (0.1% relative accuracy)."
     return ExplanationBlock(
-        summary="Distribution statistics are computed from sorted simulation outcomes.",
+        summary=summary,
         steps=[
             FormulaStep(name="Mean", formula="sum(values) / count(values)", value=mean),
             FormulaStep(name="Median", formula="middle(sorted(values))", value=median),
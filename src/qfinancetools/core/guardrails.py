@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import numpy as np
+
 from qfinancetools.models.explain import WarningItem
 
+_LOAN_MAX_RATE = 20
+_LOAN_MAX_YEARS = 40
+_LOAN_MAX_EXTRA_SHARE = 0.1
+
 
 def loan_warnings(principal: float, annual_rate: float, years: int, extra_payment: float) -> list[WarningItem]:
     warnings: list[WarningItem] = []
-    if annual_rate > 20:
-        warnings.append(WarningItem(code="loan.high_rate", message="Annual rate is unusually high (>20%)."))
-    if years > 40:
-        warnings.append(WarningItem(code="loan.long_term", message="Loan term is unusually long (>40 years)."))
-    if extra_payment > principal * 0.1:
+    if annual_rate > _LOAN_MAX_RATE:
+        warnings.append(WarningItem(code="loan.high_rate", message=f"Annual rate is unusually high (>{_LOAN_MAX_RATE}%)."))
+    if years > _LOAN_MAX_YEARS:
+        warnings.append(WarningItem(code="loan.long_term", message=f"Loan term is unusually long (>{_LOAN_MAX_YEARS} years)."))
+    if extra_payment > principal * _LOAN_MAX_EXTRA_SHARE:
         warnings.append(WarningItem(code="loan.large_extra", message="Extra payment is unusually large relative to principal."))
     return warnings
 
 
+def loan_warnings_batch(
+    principal: np.ndarray, annual_rate: np.ndarray, years: np.ndarray, extra_payment: np.ndarray
+) -> dict[int, list[WarningItem]]:
+    # The mask only selects rows; messages still come from loan_warnings so both paths share one rule set.
+    flagged = (annual_rate > _LOAN_MAX_RATE) | (years > _LOAN_MAX_YEARS) | (extra_payment > principal * _LOAN_MAX_EXTRA_SHARE)
+    return {
+        idx: loan_warnings(float(principal[idx]), float(annual_rate[idx]), int(years[idx]), float(extra_payment[idx]))
+        for idx in np.flatnonzero(flagged).tolist()
+    }
+
+
 def invest_warnings(initial: float, monthly: float, annual_rate: float, years: int) -> list[WarningItem]:
     warnings: list[WarningItem] = []
     if annual_rate > 25:
@@ -36,12 +53,60 @@ def risk_warnings(mean_return: float | None = None, volatility: float | None = N
     return warnings
 
 
+_DCF_MAX_GROWTH_VOL = 0.5
+_DCF_MAX_RATE_VOL = 5
+
+
+def dcf_risk_warnings(growth_volatility: float, rate_volatility: float, simulations: int) -> list[WarningItem]:
+    warnings: list[WarningItem] = []
+    if growth_volatility > _DCF_MAX_GROWTH_VOL:
+        warnings.append(
+            WarningItem(
+                code="risk.dcf_high_growth_vol",
+                message=f"Cash-flow growth volatility is unusually high (>{_DCF_MAX_GROWTH_VOL:.0%} per year).",
+            )
+        )
+    if rate_volatility > _DCF_MAX_RATE_VOL:
+        warnings.append(
+            WarningItem(
+                code="risk.dcf_high_rate_vol",
+                message=f"Discount rate volatility is unusually high (>{_DCF_MAX_RATE_VOL} percentage points).",
+            )
+        )
+    return warnings + risk_warnings(simulations=simulations)
+
+
+_BONDS_MAX_YIELD = 20
+_BONDS_MAX_COUPON = 20
+_BONDS_MAX_YEARS = 50
+
+
 def bonds_warnings(yield_rate: float | None = None, coupon_rate: float | None = None, years: int | None = None) -> list[WarningItem]:
     warnings: list[WarningItem] = []
-    if yield_rate is not None and yield_rate > 20:
-        warnings.append(WarningItem(code="bonds.high_yield", message="Yield input is unusually high (>20%)."))
-    if coupon_rate is not None and coupon_rate > 20:
-        warnings.append(WarningItem(code="bonds.high_coupon", message="Coupon input is unusually high (>20%)."))
-    if years is not None and years > 50:
-        warnings.append(WarningItem(code="bonds.long_maturity", message="Bond maturity is unusually long (>50 years)."))
+    if yield_rate is not None and yield_rate > _BONDS_MAX_YIELD:
+        warnings.append(WarningItem(code="bonds.high_yield", message=f"Yield input is unusually high (>{_BONDS_MAX_YIELD}%)."))
+    if coupon_rate is not None and coupon_rate > _BONDS_MAX_COUPON:
+        warnings.append(WarningItem(code="bonds.high_coupon", message=f"Coupon input is unusually high (>{_BONDS_MAX_COUPON}%)."))
+    if years is not None and years > _BONDS_MAX_YEARS:
+        warnings.append(WarningItem(code="bonds.long_maturity", message=f"Bond maturity is unusually long (>{_BONDS_MAX_YEARS} years)."))
     return warnings
+
+
+def bonds_warnings_batch(
+    yield_rate: np.ndarray | None = None, coupon_rate: np.ndarray | None = None, years: np.ndarray | None = None
+) -> dict[int, list[WarningItem]]:
+    columns = [column for column in (yield_rate, coupon_rate, years) if column is not None]
+    if not columns:
+        return {}
+    flagged = np.zeros(columns[0].size, dtype=bool)
+    for column, limit in ((yield_rate, _BONDS_MAX_YIELD), (coupon_rate, _BONDS_MAX_COUPON), (years, _BONDS_MAX_YEARS)):
+        if column is not None:
+            flagged |= column > limit
+    return {
+        idx: bonds_warnings(
+            yield_rate=None if yield_rate is None else float(yield_rate[idx]),
+            coupon_rate=None if coupon_rate is None else float(coupon_rate[idx]),
+            years=None if years is None else int(years[idx]),
+        )
+        for idx in np.flatnonzero(flagged).tolist()
+    }
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from qfinancetools.models.loans import LoanInput, LoanResult, AmortizationRow
+import csv
+import json
+import math
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+
+from qfinancetools.models.loans import LoanInput, LoanResult, AmortizationSchedule, LoanBatchResult
+from qfinancetools.core.batch import as_column, first_bad_row
 from qfinancetools.core.explainability import loan_explanation
-from qfinancetools.core.guardrails import loan_warnings
+from qfinancetools.core.guardrails import loan_warnings, loan_warnings_batch
+
+SCHEDULE_FIELDS = ("month", "payment", "principal", "interest", "balance")
 
 
 def compute_monthly_payment(loan: LoanInput) -> float:
@@ -17,13 +29,38 @@ def compute_monthly_payment(loan: LoanInput) -> float:
     return loan.principal * monthly_rate * factor / (factor - 1)
 
 
-def amortization_schedule(loan: LoanInput) -> list[AmortizationRow]:
+def _level_payment_schedule(
+    loan: LoanInput, payment: float, first_month: int = 1, last_month: int | None = None
+) -> AmortizationSchedule:
+    months = loan.years * 12
+    last_month = months if last_month is None else min(last_month, months)
+    monthly_rate = loan.annual_rate / 100 / 12
+    elapsed = np.arange(first_month - 1, last_month + 1, dtype=np.float64)
+    if monthly_rate == 0:
+        balance = loan.principal - payment * elapsed
+    else:
+        growth = (1 + monthly_rate) ** elapsed
+        balance = loan.principal * growth - payment * (growth - 1) / monthly_rate
+    if last_month == months:
+        balance[-1] = 0.0
+    np.maximum(balance, 0.0, out=balance)
+
+    interest = balance[:-1] * monthly_rate
+    principal = balance[:-1] - balance[1:]
+    return AmortizationSchedule(
+        month=np.arange(first_month, last_month + 1),
+        payment=principal + interest,
+        principal=principal,
+        interest=interest,
+        balance=balance[1:],
+    )
+
+
+def _extra_payment_rows(loan: LoanInput, base_payment: float) -> Iterator[tuple[int, float, float, float, float]]:
     monthly_rate = loan.annual_rate / 100 / 12
-    base_payment = compute_monthly_payment(loan)
     balance = loan.principal
-    schedule: list[AmortizationRow] = []
-    month = 0
     max_months = loan.years * 12 * 2
+    month = 0
 
     while balance > 1e-8:
         month += 1
@@ -40,26 +77,98 @@ def amortization_schedule(loan: LoanInput) -> list[AmortizationRow]:
             total_payment = interest + principal_paid
 
         balance = balance - principal_paid
+        yield month, total_payment, principal_paid, interest, balance
 
-        schedule.append(
-            AmortizationRow(
-                month=month,
-                payment=total_payment,
-                principal=principal_paid,
-                interest=interest,
-                balance=balance,
-            )
+
+def _extra_payment_schedule(loan: LoanInput, base_payment: float) -> AmortizationSchedule:
+    rows = list(_extra_payment_rows(loan, base_payment))
+    columns = np.array(rows, dtype=np.float64).reshape(-1, 5)
+    return AmortizationSchedule(
+        month=columns[:, 0].astype(np.int64),
+        payment=columns[:, 1],
+        principal=columns[:, 2],
+        interest=columns[:, 3],
+        balance=columns[:, 4],
+    )
+
+
+def amortization_schedule(loan: LoanInput) -> AmortizationSchedule:
+    base_payment = compute_monthly_payment(loan)
+    if loan.extra_payment == 0:
+        return _level_payment_schedule(loan, base_payment)
+    return _extra_payment_schedule(loan, base_payment)
+
+
+def iter_amortization_rows(loan: LoanInput, chunk_months: int = 120) -> Iterator[tuple[int, float, float, float, float]]:
+    base_payment = compute_monthly_payment(loan)
+    if loan.extra_payment != 0:
+        yield from _extra_payment_rows(loan, base_payment)
+        return
+    for first_month in range(1, loan.years * 12 + 1, chunk_months):
+        chunk = _level_payment_schedule(loan, base_payment, first_month, first_month + chunk_months - 1)
+        yield from zip(
+            chunk.month.tolist(),
+            chunk.payment.tolist(),
+            chunk.principal.tolist(),
+            chunk.interest.tolist(),
+            chunk.balance.tolist(),
         )
 
-    return schedule
+
+
+def write_amortization_schedule(loan: LoanInput, handle: TextIO, fmt: str = "ndjson") -> int:
+    if fmt not in ("ndjson", "csv"):
+        raise ValueError("fmt must be 'ndjson' or 'csv'")
+    writer = csv.writer(handle) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(SCHEDULE_FIELDS)
+    count = 0
+    for row in iter_amortization_rows(loan):
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            handle.write(json.dumps(dict(zip(SCHEDULE_FIELDS, row))) + "\n")
+        count += 1
+    return count
+
+
+def _analytic_totals(loan: LoanInput, monthly_payment: float) -> tuple[float, float, int] | None:
+    months = loan.years * 12
+    if loan.extra_payment == 0:
+        total_paid = monthly_payment * months
+        return total_paid, total_paid - loan.principal, months
+
+    monthly_rate = loan.annual_rate / 100 / 12
+    payment = monthly_payment + loan.extra_payment
+    if monthly_rate == 0:
+        exact_months = loan.principal / payment
+    else:
+        exact_months = -math.log1p(-monthly_rate * loan.principal / payment) / math.log1p(monthly_rate)
+
+    payoff_months = math.ceil(exact_months)
+    # Near-integer payoffs hinge on the schedule's 1e-8 balance cutoff, so leave those to the schedule.
+    if min(payoff_months - exact_months, exact_months - (payoff_months - 1)) < 1e-6:
+        return None
+
+    full_payments = payoff_months - 1
+    if monthly_rate == 0:
+        final_payment = loan.principal - payment * full_payments
+    else:
+        growth = (1 + monthly_rate) ** full_payments
+        remaining = loan.principal * growth - payment * (growth - 1) / monthly_rate
+        final_payment = remaining * (1 + monthly_rate)
+    total_paid = payment * full_payments + final_payment
+    return total_paid, total_paid - loan.principal, payoff_months
 
 
 def loan_summary(loan: LoanInput) -> LoanResult:
-    schedule = amortization_schedule(loan)
-    total_paid = sum(row.payment for row in schedule)
-    total_interest = sum(row.interest for row in schedule)
-    years = len(schedule) / 12
     monthly_payment = compute_monthly_payment(loan)
+    totals = _analytic_totals(loan, monthly_payment)
+    if totals is None:
+        schedule = amortization_schedule(loan)
+        totals = schedule.total_paid, schedule.total_interest, len(schedule)
+    total_paid, total_interest, payoff_months = totals
+    years = payoff_months / 12
     warnings = loan_warnings(loan.principal, loan.annual_rate, loan.years, loan.extra_payment)
     explanation = loan_explanation(loan.principal, loan.annual_rate, loan.years, monthly_payment)
 
@@ -71,3 +180,109 @@ def loan_summary(loan: LoanInput) -> LoanResult:
         warnings=warnings,
         explanation=explanation,
     )
+
+
+def loan_summary_batch(
+    principal: Sequence[float] | np.ndarray,
+    annual_rate: Sequence[float] | np.ndarray,
+    years: Sequence[int] | np.ndarray,
+    extra_payment: Sequence[float] | np.ndarray | None = None,
+) -> LoanBatchResult:
+    principal_col = as_column(principal, "principal")
+    size = principal_col.size
+    rate_col = as_column(annual_rate, "annual_rate", size)
+    years_col = as_column(years, "years", size)
+    extra_col = np.zeros(size) if extra_payment is None else as_column(extra_payment, "extra_payment", size)
+
+    for name, mask in (
+        ("principal must be positive", ~(principal_col > 0)),
+        ("annual_rate must be non-negative", ~(rate_col >= 0)),
+        ("years must be a positive integer", ~(years_col > 0) | (years_col != np.floor(years_col))),
+        ("extra_payment must be non-negative", ~(extra_col >= 0)),
+    ):
+        if mask.any():
+            raise ValueError(f"row {first_bad_row(mask)}: {name}")
+
+    months = years_col * 12
+    monthly_rate = rate_col / 100 / 12
+    zero_rate = monthly_rate == 0
+    safe_rate = np.where(zero_rate, 1.0, monthly_rate)
+    factor = (1 + monthly_rate) ** months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monthly_payment = np.where(
+            zero_rate,
+            principal_col / months,
+            principal_col * monthly_rate * factor / (factor - 1),
+        )
+
+        payment = monthly_payment + extra_col
+        exact_months = np.where(
+            zero_rate,
+            principal_col / payment,
+            -np.log1p(-monthly_rate * principal_col / payment) / np.log1p(monthly_rate),
+        )
+        payoff_months = np.ceil(exact_months)
+        full_payments = payoff_months - 1
+        growth = (1 + monthly_rate) ** full_payments
+        final_payment = np.where(
+            zero_rate,
+            principal_col - payment * full_payments,
+            (principal_col * growth - payment * (growth - 1) / safe_rate) * (1 + monthly_rate),
+        )
+
+    has_extra = extra_col > 0
+    total_paid = np.where(has_extra, payment * full_payments + final_payment, monthly_payment * months)
+    payoff_months = np.where(has_extra, payoff_months, months)
+
+    # Rows the closed form cannot settle (near-integer payoffs, degenerate rates) go through loan_summary.
+    unresolved = has_extra & (np.minimum(payoff_months - exact_months, exact_months - full_payments) < 1e-6)
+    unresolved |= ~np.isfinite(total_paid)
+    for idx in np.flatnonzero(unresolved).tolist():
+        single = loan_summary(
+            LoanInput(
+                principal=principal_col[idx],
+                annual_rate=rate_col[idx],
+                years=int(years_col[idx]),
+                extra_payment=extra_col[idx],
+            )
+        )
+        monthly_payment[idx] = single.monthly_payment
+        total_paid[idx] = single.total_paid
+        payoff_months[idx] = single.years * 12
+
+    return LoanBatchResult(
+        monthly_payment=monthly_payment,
+        total_interest=total_paid - principal_col,
+        total_paid=total_paid,
+        years=payoff_months / 12,
+        warnings=loan_warnings_batch(principal_col, rate_col, years_col, extra_col),
+    )
+
+
+def iter_loan_table(path: str | Path, chunk_rows: int = 50_000) -> Iterator[dict[str, np.ndarray]]:
+    with Path(path).open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        required = {"principal", "annual_rate", "years"}
+        missing = required - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"loan table is missing columns: {', '.join(sorted(missing))}")
+        has_extra = "extra_payment" in (reader.fieldnames or [])
+        rows: list[dict[str, str]] = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= chunk_rows:
+                yield _loan_columns(rows, has_extra)
+                rows = []
+        if rows:
+            yield _loan_columns(rows, has_extra)
+
+
+def _loan_columns(rows: list[dict[str, str]], has_extra: bool) -> dict[str, np.ndarray]:
+    columns = {
+        "principal": np.array([row["principal"] for row in rows], dtype=np.float64),
+        "annual_rate": np.array([row["annual_rate"] for row in rows], dtype=np.float64),
+        "years": np.array([row["years"] for row in rows], dtype=np.float64),
+    }
+    if has_extra:
+        columns["extra_payment"] = np.array([row["extra_payment"] or 0 for row in rows], dtype=np.float64)
+    return columns
@@ -41,3 +41,19 @@ def discover_plugins() -> PluginRegistrySnapshot:
                 )
             )
     return PluginRegistrySnapshot(plugins=plugins)
+
+
+def discover_market_data_providers() -> dict[str, object]:
+    providers: dict[str, object] = {}
+    entry_points = importlib.metadata.entry_points(group="qfinance.plugins")
+    for entry_point in entry_points:
+        try:
+            loaded = entry_point.load()
+            plugin = loaded() if callable(loaded) else loaded
+            offered = dict(getattr(plugin, "market_data_providers", {}) or {})
+        except Exception:
+            # Broken plugins are already reported with their error by discover_plugins.
+            continue
+        for key, provider in offered.items():
+            providers[str(key).strip().lower()] = provider
+    return providers
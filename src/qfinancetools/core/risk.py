@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import math
 import random
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
 
 from qfinancetools.core.explainability import monte_carlo_explanation
-from qfinancetools.core.guardrails import risk_warnings
+from qfinancetools.core.guardrails import dcf_risk_warnings, risk_warnings
+from qfinancetools.models.explain import WarningItem
 from qfinancetools.models.risk import (
     ScenarioInput,
     ScenarioResult,
     SensitivityInput,
     SensitivityResult,
+    MonteCarloDcfInput,
+    MonteCarloDcfResult,
+    MonteCarloHistogram,
     MonteCarloInput,
+    MonteCarloPaths,
     MonteCarloResult,
     StressTestInput,
     StressTestResult,
@@ -29,42 +41,325 @@ def sensitivity(data: SensitivityInput) -> SensitivityResult:
     return SensitivityResult(new_value=new_value, percent_change=percent_change, warnings=warnings)
 
 
-def monte_carlo(data: MonteCarloInput) -> MonteCarloResult:
+def _compat_growth(data: MonteCarloInput) -> np.ndarray:
+    # Same draw order as the original per-simulation loop, so seeded results are unchanged.
     rng = random.Random(data.seed)
-    steps = data.years
-    values: list[float] = []
+    draws = [rng.gauss(data.mean_return, data.volatility) for _ in range(data.simulations * data.years)]
+    growth = np.array(draws, dtype=np.float64).reshape(data.simulations, data.years)
+    return 1 + growth / 100
+
+
+def _year_end_values(initial_value: float, growth: np.ndarray) -> np.ndarray:
+    # Leading column holds the initial value so cumprod multiplies in the same order as the scalar loop.
+    paths = np.empty((growth.shape[0], growth.shape[1] + 1), dtype=np.float64)
+    paths[:, 0] = initial_value
+    paths[:, 1:] = growth
+    np.cumprod(paths, axis=1, out=paths)
+    return paths[:, 1:]
+
+
+def _vectorized_shard(
+    initial_value: float,
+    mean_return: float,
+    volatility: float,
+    years: int,
+    size: int,
+    seed: np.random.SeedSequence,
+    record_paths: bool = False,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    growth = rng.normal(mean_return, volatility, size=(size, years))
+    growth /= 100
+    growth += 1
+    paths = _year_end_values(initial_value, growth)
+    return paths if record_paths else paths[:, -1].copy()
+
+
+def _run_shards(shard: Callable[..., np.ndarray], shard_args: list[tuple], workers: int) -> Iterator[np.ndarray]:
+    if workers <= 1 or len(shard_args) <= 1:
+        for args in shard_args:
+            yield shard(*args)
+        return
+
+    # Keep a bounded window of shards in flight so streaming consumers never hold every shard at once.
+    window = 2 * workers
+    with ProcessPoolExecutor(max_workers=min(workers, len(shard_args))) as pool:
+        pending: deque[Future[np.ndarray]] = deque()
+        for args in shard_args:
+            pending.append(pool.submit(shard, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _shard_seeds(simulations: int, chunk_size: int, seed: int) -> list[tuple[int, np.random.SeedSequence]]:
+    # Shards depend only on seed and chunk_size, so the merged values are identical for any worker count.
+    sizes = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+    return list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+
+def _vectorized_shards(data: MonteCarloInput) -> Iterator[np.ndarray]:
+    shard_args = [
+        (data.initial_value, data.mean_return, data.volatility, data.years, size, shard_seed, data.paths_file is not None)
+        for size, shard_seed in _shard_seeds(data.simulations, data.chunk_size, data.seed)
+    ]
+    return _run_shards(_vectorized_shard, shard_args, data.workers)
+
+
+def _rank_indices(count: int) -> tuple[int, int, int, int]:
+    mid = count // 2
+    low_mid = mid - 1 if count % 2 == 0 else mid
+    return low_mid, mid, int(0.05 * (count - 1)), int(0.95 * (count - 1))
+
+
+def _order_statistics(values: np.ndarray) -> tuple[float, float, float]:
+    low_mid, mid, p5_idx, p95_idx = _rank_indices(values.size)
+    selected = np.partition(values, sorted({low_mid, mid, p5_idx, p95_idx}))
+    median = float((selected[low_mid] + selected[mid]) / 2)
+    return median, float(selected[p5_idx]), float(selected[p95_idx])
+
+
+class _QuantileSketch:
+    # Log-bucketed sketch (DDSketch-style): every quantile is within relative_accuracy of the exact order statistic.
+    def __init__(self, relative_accuracy: float = 0.001) -> None:
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.total += float(values.sum())
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        self.zeros += int(np.count_nonzero(values == 0))
+        self._add(self.positive, values[values > 0])
+        self._add(self.negative, -values[values < 0])
+
+    def _add(self, store: dict[int, int], magnitudes: np.ndarray) -> None:
+        if magnitudes.size == 0:
+            return
+        keys = np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+        offset = int(keys.min())
+        counts = np.bincount(keys - offset)
+        for idx in np.flatnonzero(counts).tolist():
+            store[idx + offset] = store.get(idx + offset, 0) + int(counts[idx])
+
+    def _representative(self, key: int) -> float:
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+    def _buckets(self) -> tuple[np.ndarray, np.ndarray]:
+        negative_keys = sorted(self.negative, reverse=True)
+        positive_keys = sorted(self.positive)
+        values = [-self._representative(key) for key in negative_keys]
+        counts = [self.negative[key] for key in negative_keys]
+        if self.zeros:
+            values.append(0.0)
+            counts.append(self.zeros)
+        values.extend(self._representative(key) for key in positive_keys)
+        counts.extend(self.positive[key] for key in positive_keys)
+        return np.clip(np.array(values), self.minimum, self.maximum), np.array(counts, dtype=np.int64)
+
+    def order_statistics(self) -> tuple[float, float, float]:
+        values, counts = self._buckets()
+        low_mid, mid, p5_idx, p95_idx = _rank_indices(self.count)
+        positions = np.searchsorted(np.cumsum(counts), [low_mid, mid, p5_idx, p95_idx], side="right")
+        low, high, p5, p95 = (float(values[pos]) for pos in positions)
+        return (low + high) / 2, p5, p95
+
+    def histogram(self, bins: int) -> tuple[list[float], list[int]]:
+        values, counts = self._buckets()
+        low, high = (self.minimum - 0.5, self.maximum + 0.5) if self.minimum == self.maximum else (self.minimum, self.maximum)
+        edges = np.linspace(low, high, bins + 1)
+        positions = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, bins - 1)
+        binned = np.bincount(positions, weights=counts, minlength=bins)
+        return edges.tolist(), binned.astype(np.int64).tolist()
+
+
+class _PathRecorder:
+    def __init__(self, data: MonteCarloInput) -> None:
+        self.file = Path(data.paths_file)
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.matrix = np.lib.format.open_memmap(
+            self.file, mode="w+", dtype=np.float64, shape=(data.simulations, data.years)
+        )
+        self.bands = [_QuantileSketch() for _ in range(data.years)]
+        self.row = 0
+
+    def write(self, block: np.ndarray) -> None:
+        self.matrix[self.row : self.row + block.shape[0]] = block
+        self.row += block.shape[0]
+        for year, sketch in enumerate(self.bands):
+            sketch.update(block[:, year])
 
-    for _ in range(data.simulations):
-        value = data.initial_value
-        for _ in range(steps):
-            draw = rng.gauss(data.mean_return, data.volatility)
-            value *= 1 + draw / 100
-        values.append(value)
-
-    values.sort()
-    mean = sum(values) / len(values)
-    mid = len(values) // 2
-    if len(values) % 2 == 0:
-        median = (values[mid - 1] + values[mid]) / 2
+    def finish(self) -> MonteCarloPaths:
+        self.matrix.flush()
+        simulations, years = self.matrix.shape
+        del self.matrix
+        stats = [sketch.order_statistics() for sketch in self.bands]
+        return MonteCarloPaths(
+            file=str(self.file),
+            simulations=simulations,
+            years=years,
+            median=[item[0] for item in stats],
+            p5=[item[1] for item in stats],
+            p95=[item[2] for item in stats],
+        )
+
+
+def load_monte_carlo_paths(paths: MonteCarloPaths) -> np.memmap:
+    matrix = np.load(paths.file, mmap_mode="r")
+    if matrix.shape != (paths.simulations, paths.years):
+        raise ValueError(f"path file {paths.file} does not match the recorded shape")
+    return matrix
+
+
+def _exact_summary(values: np.ndarray, bins: int) -> tuple[float, float, float, MonteCarloHistogram]:
+    median, p5, p95 = _order_statistics(values)
+    counts, edges = np.histogram(values, bins=bins)
+    return median, p5, p95, MonteCarloHistogram(edges=edges.tolist(), counts=counts.tolist())
+
+
+def _sketch_summary(sketch: _QuantileSketch, bins: int) -> tuple[float, float, float, float, MonteCarloHistogram]:
+    median, p5, p95 = sketch.order_statistics()
+    edges, counts = sketch.histogram(bins)
+    return sketch.total / sketch.count, median, p5, p95, MonteCarloHistogram(edges=edges, counts=counts)
+
+
+def monte_carlo(data: MonteCarloInput) -> MonteCarloResult:
+    if data.engine == "compat":
+        if data.workers > 1:
+            raise ValueError("compat engine runs on a single worker")
+        blocks: Iterator[np.ndarray] = iter([_year_end_values(data.initial_value, _compat_growth(data))])
     else:
-        median = values[mid]
+        blocks = _vectorized_shards(data)
 
-    p5 = values[int(0.05 * (len(values) - 1))]
-    p95 = values[int(0.95 * (len(values) - 1))]
+    recorder = _PathRecorder(data) if data.paths_file is not None else None
+    # Compat results stay exact; only the vectorized engine streams through a sketch.
+    sketch = _QuantileSketch() if data.output == "summary" and data.engine == "vectorized" else None
+    collected: list[np.ndarray] = []
+    for block in blocks:
+        if block.ndim == 2:
+            if recorder is not None:
+                recorder.write(block)
+            block = block[:, -1]
+        if sketch is not None:
+            sketch.update(block)
+        else:
+            collected.append(block)
+    paths = recorder.finish() if recorder is not None else None
+
+    values: list[float] = []
+    if sketch is None:
+        terminal = np.concatenate(collected)
+        # Both engines honour the baseline contract of ascending terminal values.
+        terminal.sort()
+        ordered = terminal.tolist()
+        mean = sum(ordered) / len(ordered) if data.engine == "compat" else float(terminal.mean())
+        if data.output == "values":
+            values = ordered
+        median, p5, p95, histogram = _exact_summary(terminal, data.histogram_bins)
+    else:
+        mean, median, p5, p95, histogram = _sketch_summary(sketch, data.histogram_bins)
 
     warnings = risk_warnings(mean_return=data.mean_return, volatility=data.volatility, simulations=data.simulations)
-    explanation = monte_carlo_explanation(mean, median, p5, p95)
+    explanation = monte_carlo_explanation(mean, median, p5, p95, approximate=sketch is not None)
     return MonteCarloResult(
         mean=mean,
         median=median,
         p5=p5,
         p95=p95,
         values=values,
+        histogram=histogram,
+        paths=paths,
         warnings=warnings,
         explanation=explanation,
     )
 
 
+def _dcf_shard(
+    cash_flows: np.ndarray,
+    discount_rate: float,
+    terminal_growth: float,
+    scales: np.ndarray,
+    cholesky: np.ndarray,
+    size: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    # Correlated standard normals per simulation and year, ordered growth, margin, rate.
+    shocks = rng.standard_normal((size, cash_flows.size, 3)) @ (cholesky.T * scales)
+    flows = cash_flows * np.cumprod(1 + shocks[..., 0], axis=1) * (1 + shocks[..., 1])
+    rates = discount_rate + shocks[..., 2]
+    valid = (rates > -1).all(axis=1) & (rates[:, -1] > terminal_growth)
+    flows, rates = flows[valid], rates[valid]
+    discount = np.cumprod(1 / (1 + rates), axis=1)
+    terminal = flows[:, -1] * (1 + terminal_growth) / (rates[:, -1] - terminal_growth)
+    return (flows * discount).sum(axis=1) + terminal * discount[:, -1]
+
+
+def monte_carlo_dcf(data: MonteCarloDcfInput) -> MonteCarloDcfResult:
+    correlation = np.eye(3) if data.correlation is None else np.asarray(data.correlation, dtype=np.float64)
+    try:
+        cholesky = np.linalg.cholesky(correlation + 1e-12 * np.eye(3))
+    except np.linalg.LinAlgError as exc:
+        raise ValueError("correlation must be positive semi-definite") from exc
+    scales = np.array([data.growth_volatility, data.margin_volatility, data.rate_volatility / 100])
+    cash_flows = np.asarray(data.cash_flows, dtype=np.float64)
+    shard_args = [
+        (cash_flows, data.discount_rate / 100, data.terminal_growth, scales, cholesky, size, shard_seed)
+        for size, shard_seed in _shard_seeds(data.simulations, data.chunk_size, data.seed)
+    ]
+
+    sketch = _QuantileSketch() if data.output == "summary" else None
+    collected: list[np.ndarray] = []
+    for block in _run_shards(_dcf_shard, shard_args, data.workers):
+        if sketch is not None:
+            sketch.update(block)
+        else:
+            collected.append(block)
+
+    valid = sketch.count if sketch is not None else sum(block.size for block in collected)
+    if valid == 0:
+        raise ValueError("no simulation kept the discount rate above terminal_growth")
+    values: list[float] = []
+    if sketch is None:
+        totals = np.concatenate(collected)
+        mean = float(totals.mean())
+        median, p5, p95, histogram = _exact_summary(totals, data.histogram_bins)
+        values = totals.tolist()
+    else:
+        mean, median, p5, p95, histogram = _sketch_summary(sketch, data.histogram_bins)
+
+    warnings = dcf_risk_warnings(data.growth_volatility, data.rate_volatility, data.simulations)
+    if valid < data.simulations:
+        warnings.append(
+            WarningItem(
+                code="risk.dcf_invalid_paths",
+                message=f"{data.simulations - valid} simulations drew a discount rate at or below terminal growth and were dropped.",
+            )
+        )
+    return MonteCarloDcfResult(
+        mean=mean,
+        median=median,
+        p5=p5,
+        p95=p95,
+        valid_simulations=valid,
+        values=values,
+        histogram=histogram,
+        warnings=warnings,
+        explanation=monte_carlo_explanation(mean, median, p5, p95, approximate=sketch is not None),
+    )
+
+
 def stress_test(data: StressTestInput) -> StressTestResult:
     stressed = data.base_value * (1 - data.drawdown)
     warnings = risk_warnings(volatility=data.drawdown * 100)
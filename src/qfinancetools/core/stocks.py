@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import base64
+import csv
 import datetime as dt
+import functools
+import gzip
+import http.client
 import json
+import sqlite3
+import threading
 import time
 import urllib.parse
-import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
+from typing import Iterable, Mapping, Protocol, runtime_checkable
+
+import numpy as np
 
 from qfinancetools.core.explainability import investment_explanation
 from qfinancetools.core.guardrails import invest_warnings
+from qfinancetools.core.plugins import discover_market_data_providers
 from qfinancetools.models.explain import WarningItem
 from qfinancetools.models.stocks import (
+    PriceSeries,
     StockBacktestInput,
     StockBacktestPoint,
     StockBacktestResult,
@@ -83,6 +96,109 @@ def _normalize_weights(tickers: list[str], weights: list[float] | None) -> dict[
     return {ticker: value / total for ticker, value in zip(tickers, weights)}
 
 
+_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+_YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
+# Every ticker hits the same host, so the pool size doubles as the per-host concurrency limit.
+_FETCH_WORKERS = 8
+# Stored closes are split/dividend adjusted, so covered ranges are refetched once they reach this age.
+_STORE_MAX_AGE_DAYS = 30
+
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    if not proxy.username:
+        return {}
+    credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+
+class _HttpSession:
+    # Keep-alive connections are pooled per host, so repeated chart requests skip the TCP and TLS handshakes.
+    def __init__(self, max_idle: int) -> None:
+        self._max_idle = max_idle
+        self._idle: dict[tuple[str, str, int | None, str | None], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _checkout(
+        self, key: tuple[str, str, int | None, str | None], timeout: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host, port, proxy_url = key
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        if proxy_url is None:
+            return factory(host, port, timeout=timeout), False
+        proxy = urllib.parse.urlsplit(proxy_url)
+        proxy_port = proxy.port or (443 if proxy.scheme == "https" else 80)
+        if scheme == "https":
+            # HTTPS goes through a CONNECT tunnel, so TLS still runs end to end with the origin host.
+            connection = factory(proxy.hostname or "", proxy_port, timeout=timeout)
+            connection.set_tunnel(host, port, headers=_proxy_headers(proxy))
+            return connection, False
+        return http.client.HTTPConnection(proxy.hostname or "", proxy_port, timeout=timeout), False
+
+    def _checkin(self, key: tuple[str, str, int | None, str | None], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _request(self, url: str, headers: dict[str, str], timeout: float) -> tuple[http.client.HTTPResponse, bytes]:
+        parts = urllib.parse.urlsplit(url)
+        host = parts.hostname or ""
+        # Same environment lookup as urllib: HTTPS_PROXY/HTTP_PROXY (either case), honouring NO_PROXY.
+        proxy_url = None if urllib.request.proxy_bypass(host) else urllib.request.getproxies().get(parts.scheme)
+        if proxy_url is not None and "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        key = (parts.scheme, host, parts.port, proxy_url)
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        if proxy_url is not None and parts.scheme == "http":
+            # A plain HTTP proxy takes the absolute URL and its credentials on every request.
+            target = urllib.parse.urlunsplit(parts._replace(fragment=""))
+            headers = {**headers, **_proxy_headers(urllib.parse.urlsplit(proxy_url))}
+        while True:
+            connection, reused = self._checkout(key, timeout)
+            response = None
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                # A pooled connection the server has since dropped fails before any response bytes arrive
+                # (RemoteDisconnected is a ConnectionResetError). Timeouts and cut-off bodies are not retried here,
+                # because the request may already have reached the server.
+                if reused and response is None and isinstance(exc, (ConnectionResetError, BrokenPipeError)):
+                    continue
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(key, connection)
+            return response, body
+
+    def get(self, url: str, headers: dict[str, str], timeout: float) -> tuple[int, str, bytes]:
+        for _ in range(_MAX_REDIRECTS + 1):
+            response, body = self._request(url, headers, timeout)
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            url = urllib.parse.urljoin(url, location)
+        if response.getheader("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return response.status, response.reason, body
+
+
+_HTTP_SESSION = _HttpSession(max_idle=_FETCH_WORKERS)
+
+
 def _fetch_history_yahoo(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
     period1 = int(dt.datetime.combine(start, dt.time.min).timestamp())
     # period2 is exclusive in Yahoo chart API.
@@ -96,34 +212,28 @@ def _fetch_history_yahoo(ticker: str, start: dt.date, end: dt.date) -> list[tupl
             "includeAdjustedClose": "true",
         }
     )
-    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?{params}"
-    last_error: Exception | None = None
+    url = f"{_YAHOO_CHART_URL}/{urllib.parse.quote(ticker)}?{params}"
+    headers = {
+        "User-Agent": "qFinanceTools/1.0 (+https://github.com/qfinancetools)",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+    }
     for attempt in range(4):
         try:
-            request = urllib.request.Request(
-                url,
-                headers={
-                    "User-Agent": "qFinanceTools/1.0 (+https://github.com/qfinancetools)",
-                    "Accept": "application/json",
-                },
-            )
-            with urllib.request.urlopen(request, timeout=15) as response:
-                payload = json.loads(response.read().decode("utf-8"))
-            break
-        except urllib.error.HTTPError as exc:
-            last_error = exc
-            if exc.code == 429 and attempt < 3:
-                time.sleep(0.8 * (2**attempt))
-                continue
-            raise ValueError(f"HTTP Error {exc.code}: {exc.reason}") from exc
-        except urllib.error.URLError as exc:
-            last_error = exc
+            status, reason, body = _HTTP_SESSION.get(url, headers, timeout=15)
+        except (OSError, http.client.HTTPException) as exc:
             if attempt < 3:
                 time.sleep(0.8 * (2**attempt))
                 continue
-            raise ValueError(f"Network error while fetching {ticker}: {exc.reason}") from exc
-    else:
-        raise ValueError(f"Failed to fetch {ticker}: {last_error}")
+            raise ValueError(f"Network error while fetching {ticker}: {exc}") from exc
+        if status == 429 and attempt < 3:
+            time.sleep(0.8 * (2**attempt))
+            continue
+        # Redirects are followed by the session, so any 3xx left here is a loop or a redirect without a Location.
+        if status >= 300:
+            raise ValueError(f"HTTP Error {status}: {reason}")
+        payload = json.loads(body.decode("utf-8"))
+        break
 
     chart = payload.get("chart", {})
     error = chart.get("error")
@@ -150,71 +260,323 @@ def _fetch_history_yahoo(ticker: str, start: dt.date, end: dt.date) -> list[tupl
     return points
 
 
+def _as_date(value: object) -> dt.date:
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    return dt.date.fromisoformat(str(value).strip()[:10])
+
+
+def _price_column_names(path: Path, names: list[str]) -> tuple[str, str]:
+    normalized = {name.strip().lower().replace(" ", "_"): name for name in names}
+    close = normalized.get("adj_close") or normalized.get("adjclose") or normalized.get("close")
+    if "date" not in normalized or close is None:
+        raise ValueError(f"{path}: price files need a date column and a close or adj_close column")
+    return normalized["date"], close
+
+
+def _read_price_csv(path: Path) -> list[tuple[dt.date, float]]:
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        date_column, close_column = _price_column_names(path, list(reader.fieldnames or []))
+        points: list[tuple[dt.date, float]] = []
+        for line, row in enumerate(reader, start=2):
+            raw = (row.get(close_column) or "").strip()
+            if not raw or raw.lower() in {"null", "nan"}:
+                continue
+            try:
+                points.append((_as_date(row[date_column]), float(raw)))
+            except ValueError as exc:
+                raise ValueError(f"{path}: line {line}: {exc}") from exc
+    return points
+
+
+def _read_price_parquet(path: Path) -> list[tuple[dt.date, float]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ValueError(f"{path}: reading parquet price files requires pyarrow") from exc
+    table = pq.read_table(path)
+    date_column, close_column = _price_column_names(path, table.column_names)
+    return [
+        (_as_date(date_value), float(close))
+        for date_value, close in zip(table.column(date_column).to_pylist(), table.column(close_column).to_pylist())
+        if close is not None
+    ]
+
+
+@runtime_checkable
+class MarketDataProvider(Protocol):
+    name: str
+    # Cached providers go through the local price store, which only asks for date ranges it has never seen.
+    cached: bool
+
+    def fetch(self, ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]: ...
+
+
+class YahooChartProvider:
+    name = "yahoo_chart"
+    cached = True
+
+    def fetch(self, ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        return _fetch_history_yahoo(ticker, start, end)
+
+
+class CsvDirectoryProvider:
+    name = "csv_directory"
+    cached = False
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        if not self.root.is_dir():
+            raise ValueError(f"Price data directory not found: {self.root}")
+
+    def fetch(self, ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        for stem in dict.fromkeys((ticker, ticker.lower())):
+            csv_path = self.root / f"{stem}.csv"
+            if csv_path.is_file():
+                points = _read_price_csv(csv_path)
+                break
+            parquet_path = self.root / f"{stem}.parquet"
+            if parquet_path.is_file():
+                points = _read_price_parquet(parquet_path)
+                break
+        else:
+            raise ValueError(f"No price file for {ticker} in {self.root} (expected {ticker}.csv or {ticker}.parquet)")
+        return sorted(point for point in points if start <= point[0] <= end and point[1] > 0)
+
+
+class InMemoryProvider:
+    name = "memory"
+    cached = False
+
+    def __init__(self, histories: Mapping[str, Iterable[tuple[dt.date, float]]]) -> None:
+        self.histories = {ticker.upper(): sorted(points) for ticker, points in histories.items()}
+
+    def fetch(self, ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        if ticker not in self.histories:
+            raise ValueError(f"No in-memory prices for {ticker}")
+        return [point for point in self.histories[ticker] if start <= point[0] <= end]
+
+
+_REGISTERED_PROVIDERS: dict[str, MarketDataProvider] = {}
+
+
+def register_market_data_provider(key: str, provider: MarketDataProvider) -> None:
+    _REGISTERED_PROVIDERS[key.strip().lower()] = provider
+
+
+@functools.lru_cache(maxsize=1)
+def _plugin_providers() -> dict[str, object]:
+    # Entry point scanning walks every installed distribution, so it runs once per process.
+    return discover_market_data_providers()
+
+
+def resolve_market_data_provider(key: str, data_dir: str | None = None) -> MarketDataProvider:
+    normalized = key.strip().lower()
+    if normalized == "yahoo":
+        return YahooChartProvider()
+    if normalized == "csv":
+        if not data_dir:
+            raise ValueError("provider 'csv' requires data_dir")
+        return CsvDirectoryProvider(data_dir)
+    if normalized in _REGISTERED_PROVIDERS:
+        return _REGISTERED_PROVIDERS[normalized]
+    offered = _plugin_providers().get(normalized)
+    if offered is None:
+        raise ValueError(f"Unknown market data provider: {key}")
+    # Plugins may expose the provider class rather than an instance.
+    provider = offered() if isinstance(offered, type) else offered
+    if not isinstance(provider, MarketDataProvider):
+        raise ValueError(f"Market data provider {key} must define name, cached and fetch(ticker, start, end)")
+    return provider
+
+
 def _cache_dir() -> Path:
     root = Path.home() / ".cache" / "qfinancetools" / "stocks"
     root.mkdir(parents=True, exist_ok=True)
     return root
 
 
-def _cache_path(ticker: str, start: dt.date, end: dt.date) -> Path:
-    key = f"{ticker}_{start.isoformat()}_{end.isoformat()}".replace("-", "")
-    return _cache_dir() / f"{key}.json"
+def _store_path() -> Path:
+    return _cache_dir() / "prices.sqlite3"
 
 
-def _save_cached_history(ticker: str, start: dt.date, end: dt.date, points: list[tuple[dt.date, float]]) -> None:
-    path = _cache_path(ticker, start, end)
-    payload = {
-        "fetched_at": dt.date.today().isoformat(),
-        "points": [[point_date.isoformat(), price] for point_date, price in points],
-    }
-    path.write_text(json.dumps(payload), encoding="utf-8")
+def _connect_store() -> sqlite3.Connection:
+    connection = sqlite3.connect(_store_path(), timeout=30)
+    # (ticker, day) is the clustered key, so any date window is a single contiguous range scan.
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS prices ("
+        "ticker TEXT NOT NULL, day INTEGER NOT NULL, close REAL NOT NULL, PRIMARY KEY (ticker, day)"
+        ") WITHOUT ROWID"
+    )
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS coverage ("
+        "ticker TEXT NOT NULL, first_day INTEGER NOT NULL, last_day INTEGER NOT NULL, fetched_at INTEGER NOT NULL"
+        ")"
+    )
+    return connection
 
 
-def _load_cached_history(ticker: str, start: dt.date, end: dt.date) -> tuple[list[tuple[dt.date, float]] | None, dt.date | None]:
-    path = _cache_path(ticker, start, end)
-    if not path.exists():
-        return None, None
+def _covered_ranges(connection: sqlite3.Connection, ticker: str, first_day: int, last_day: int) -> list[tuple[int, int, int]]:
+    return connection.execute(
+        "SELECT first_day, last_day, fetched_at FROM coverage WHERE ticker = ? AND first_day <= ? AND last_day >= ? "
+        "ORDER BY first_day",
+        (ticker, last_day, first_day),
+    ).fetchall()
+
+
+def _missing_ranges(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, dt.date]]:
+    gaps: list[tuple[int, int]] = []
+    cursor = start.toordinal()
+    expired = dt.date.today().toordinal() - _STORE_MAX_AGE_DAYS
+    with closing(_connect_store()) as connection:
+        for first_day, last_day, fetched_at in _covered_ranges(connection, ticker, start.toordinal(), end.toordinal()):
+            if fetched_at < expired:
+                continue
+            if first_day > cursor:
+                gaps.append((cursor, first_day - 1))
+            cursor = max(cursor, last_day + 1)
+        if cursor <= end.toordinal():
+            gaps.append((cursor, end.toordinal()))
+        anchors = {
+            gap_start: connection.execute(
+                "SELECT MAX(day) FROM prices WHERE ticker = ? AND day < ?", (ticker, gap_start)
+            ).fetchone()[0]
+            for gap_start, _ in gaps
+        }
+
+    ranges: list[tuple[dt.date, dt.date]] = []
+    for gap_start, gap_end in gaps:
+        # A short gap (a weekend, a holiday) may hold no trading days; overlapping into covered days keeps it non-empty.
+        if gap_start > start.toordinal():
+            anchor = anchors.get(gap_start)
+            # Restarting at the last stored bar re-validates it and asks only for the days after it.
+            gap_start = anchor if anchor is not None and anchor >= gap_start - 7 else min(gap_start, gap_end - 7)
+        elif gap_end < end.toordinal():
+            gap_end = max(gap_end, gap_start + 7)
+        ranges.append((dt.date.fromordinal(gap_start), dt.date.fromordinal(gap_end)))
+    return ranges
+
+
+def _save_cached_history(ticker: str, start: dt.date, end: dt.date, points: list[tuple[dt.date, float]]) -> bool:
+    first_day, last_day = start.toordinal(), end.toordinal()
+    today = dt.date.today().toordinal()
+    rows = [(ticker, point_date.toordinal(), price) for point_date, price in points]
+    fetched = {day: close for _, day, close in rows}
+    with closing(_connect_store()) as connection, connection:
+        stored = connection.execute(
+            "SELECT day, close FROM prices WHERE ticker = ? AND day BETWEEN ? AND ? AND EXISTS ("
+            "SELECT 1 FROM coverage WHERE coverage.ticker = prices.ticker AND prices.day BETWEEN first_day AND last_day)",
+            (ticker, first_day, last_day),
+        ).fetchall()
+        # A split or dividend re-adjusts every earlier close, so one disagreeing overlap bar means the stored
+        # history is on an old basis; it is dropped rather than mixed with the new one.
+        rebased = any(day in fetched and abs(fetched[day] - close) > 1e-6 * abs(close) for day, close in stored)
+        if rebased:
+            connection.execute("DELETE FROM prices WHERE ticker = ?", (ticker,))
+            connection.execute("DELETE FROM coverage WHERE ticker = ?", (ticker,))
+        connection.executemany(
+            "INSERT OR REPLACE INTO prices (ticker, day, close) VALUES (?, ?, ?)",
+            [row for row in rows if first_day <= row[1] <= last_day],
+        )
+        # Today's bar is still moving, so it is stored but never marked as covered.
+        last_day = min(last_day, today - 1)
+        if last_day < first_day:
+            return rebased
+        merged = _covered_ranges(connection, ticker, first_day - 1, last_day + 1)
+        # A merged range ages with its oldest piece that this fetch did not replace, so it is refreshed as a whole.
+        fetched_at = min([today] + [item[2] for item in merged if item[0] < first_day or item[1] > last_day])
+        if merged:
+            first_day = min(first_day, merged[0][0])
+            last_day = max(last_day, max(item[1] for item in merged))
+            connection.execute(
+                "DELETE FROM coverage WHERE ticker = ? AND first_day <= ? AND last_day >= ?",
+                (ticker, last_day, first_day),
+            )
+        connection.execute(
+            "INSERT INTO coverage (ticker, first_day, last_day, fetched_at) VALUES (?, ?, ?, ?)",
+            (ticker, first_day, last_day, fetched_at),
+        )
+    return rebased
+
+
+def _load_cached_history(ticker: str, start: dt.date, end: dt.date) -> tuple[PriceSeries | None, dt.date | None]:
+    first_day, last_day = start.toordinal(), end.toordinal()
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        points = [
-            (dt.date.fromisoformat(item[0]), float(item[1]))
-            for item in payload.get("points", [])
-            if isinstance(item, list) and len(item) == 2
-        ]
-        fetched_at_raw = payload.get("fetched_at")
-        fetched_at = dt.date.fromisoformat(fetched_at_raw) if fetched_at_raw else None
-        if not points:
-            return None, fetched_at
-        return points, fetched_at
-    except Exception:
+        with closing(_connect_store()) as connection:
+            rows = connection.execute(
+                "SELECT day, close FROM prices WHERE ticker = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (ticker, first_day, last_day),
+            ).fetchall()
+            covered = _covered_ranges(connection, ticker, first_day, last_day)
+    except sqlite3.Error:
         return None, None
+    fetched_at = dt.date.fromordinal(max(item[2] for item in covered)) if covered else None
+    if not rows:
+        return None, fetched_at
+    table = np.array(rows, dtype=np.float64)
+    return PriceSeries(days=table[:, 0].astype(np.int32), closes=table[:, 1]), fetched_at
+
+
+def _load_ticker(
+    provider: MarketDataProvider, ticker: str, start: dt.date, end: dt.date
+) -> tuple[PriceSeries, WarningItem | None]:
+    if not provider.cached:
+        history = PriceSeries.from_points(provider.fetch(ticker, start, end))
+        if not history:
+            raise ValueError(f"No usable close prices for {ticker}")
+        return history, None
+
+    failure: Exception | None = None
+    try:
+        # Only the parts of the window the store has never seen go over the network.
+        for fetch_start, fetch_end in _missing_ranges(ticker, start, end):
+            if _save_cached_history(ticker, fetch_start, fetch_end, provider.fetch(ticker, fetch_start, fetch_end)):
+                # The provider re-adjusted its history, so the whole window is fetched again on the new basis.
+                if (fetch_start, fetch_end) != (start, end):
+                    _save_cached_history(ticker, start, end, provider.fetch(ticker, start, end))
+                break
+    except Exception as exc:
+        failure = exc
+    history, cached_at = _load_cached_history(ticker, start, end)
+    if failure is not None:
+        if not history:
+            raise failure
+        message = f"Using cached data for {ticker} after fetch failure: {failure}"
+        if cached_at:
+            message += f" (cached on {cached_at.isoformat()})"
+        return history, WarningItem(code="stocks.cache_fallback", message=message)
+    if history is None or not history:
+        raise ValueError(f"No usable close prices for {ticker}")
+    return history, None
 
 
 def _load_histories(
-    tickers: list[str], start: dt.date, end: dt.date
-) -> tuple[dict[str, list[tuple[dt.date, float]]], dt.date, list[WarningItem]]:
-    histories: dict[str, list[tuple[dt.date, float]]] = {}
+    tickers: list[str],
+    start: dt.date,
+    end: dt.date,
+    provider: MarketDataProvider | None = None,
+    workers: int = _FETCH_WORKERS,
+) -> tuple[dict[str, PriceSeries], dt.date, list[WarningItem]]:
+    provider = provider if provider is not None else YahooChartProvider()
+    unique = list(dict.fromkeys(raw.upper() for raw in tickers))
+    if workers <= 1 or len(unique) <= 1:
+        loaded = [_load_ticker(provider, ticker, start, end) for ticker in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as pool:
+            # map yields in submission order, so warnings and the first raised error match a sequential run.
+            loaded = list(pool.map(lambda ticker: _load_ticker(provider, ticker, start, end), unique))
+
+    histories: dict[str, PriceSeries] = {}
     warnings: list[WarningItem] = []
     last_updated = start
-    for raw in tickers:
-        ticker = raw.upper()
-        try:
-            history = _fetch_history_yahoo(ticker, start, end)
-            _save_cached_history(ticker, start, end, history)
-        except Exception as exc:
-            cached, cached_at = _load_cached_history(ticker, start, end)
-            if cached:
-                history = cached
-                message = f"Using cached data for {ticker} after fetch failure: {exc}"
-                if cached_at:
-                    message += f" (cached on {cached_at.isoformat()})"
-                warnings.append(WarningItem(code="stocks.cache_fallback", message=message))
-            else:
-                raise
+    for ticker, (history, warning) in zip(unique, loaded):
         histories[ticker] = history
-        last_date = history[-1][0]
-        if last_date > last_updated:
-            last_updated = last_date
+        if warning is not None:
+            warnings.append(warning)
+        last_updated = max(last_updated, history.last_date)
     stale_days = (dt.date.today() - last_updated).days
     if stale_days > 5:
         warnings.append(
@@ -226,45 +588,59 @@ def _load_histories(
     return histories, last_updated, warnings
 
 
+def _iso_dates(days: np.ndarray) -> list[str]:
+    return (days.astype(np.int64) - _EPOCH_ORDINAL).astype("datetime64[D]").astype(str).tolist()
+
+
+def _align(series: list[PriceSeries]) -> tuple[np.ndarray, np.ndarray]:
+    low = min(int(item.days[0]) for item in series)
+    span = max(int(item.days[-1]) for item in series) - low + 1
+    # Day ordinals sit on a dense calendar grid, so a presence count joins every series in one linear pass.
+    present = np.zeros(span, dtype=np.int32)
+    for item in series:
+        present[item.days - low] += 1
+    common = np.flatnonzero(present == len(series))
+    if common.size == 0:
+        raise ValueError("No overlapping dates across requested tickers")
+    prices = np.empty((common.size, len(series)))
+    slot = np.empty(span, dtype=np.intp)
+    for column, item in enumerate(series):
+        slot[item.days - low] = np.arange(item.days.size)
+        prices[:, column] = item.closes[slot[common]]
+    return (common + low).astype(np.int32), prices
+
+
 def stock_history(data: StockHistoryInput) -> StockHistoryResult:
     tickers = [ticker.upper() for ticker in data.tickers]
     start, end = _resolve_window(data.start_date, data.end_date, data.period_years)
     weights = _normalize_weights(tickers, data.weights)
-    histories, last_updated, warnings = _load_histories(tickers, start, end)
+    provider = resolve_market_data_provider(data.provider, data.data_dir)
+    histories, last_updated, warnings = _load_histories(tickers, start, end, provider)
 
     series: list[StockHistorySeries] = []
     for ticker in tickers:
-        points_raw = histories[ticker]
-        start_price = points_raw[0][1]
+        history = histories[ticker]
+        normalized = history.closes / history.closes[0] * 100
         points = [
-            StockHistoryPoint(
-                date=point_date.isoformat(),
-                price=price,
-                normalized=(price / start_price) * 100,
-            )
-            for point_date, price in points_raw
+            StockHistoryPoint(date=date_value, price=price, normalized=value)
+            for date_value, price, value in zip(_iso_dates(history.days), history.closes.tolist(), normalized.tolist())
         ]
         series.append(
             StockHistorySeries(
                 name=ticker,
                 points=points,
-                last_updated=points_raw[-1][0].isoformat(),
-                stale=(dt.date.today() - points_raw[-1][0]).days > 5,
+                last_updated=history.last_date.isoformat(),
+                stale=(dt.date.today() - history.last_date).days > 5,
             )
         )
 
-    common_dates = sorted(set.intersection(*(set(point[0] for point in histories[ticker]) for ticker in tickers)))
-    if not common_dates:
-        raise ValueError("No overlapping dates across requested tickers")
-    price_maps = {ticker: {date_value: price for date_value, price in histories[ticker]} for ticker in tickers}
-    base_date = common_dates[0]
-    base_prices = {ticker: price_maps[ticker][base_date] for ticker in tickers}
-    portfolio_points = []
-    for date_value in common_dates:
-        normalized = 0.0
-        for ticker in tickers:
-            normalized += weights[ticker] * ((price_maps[ticker][date_value] / base_prices[ticker]) * 100)
-        portfolio_points.append(StockHistoryPoint(date=date_value.isoformat(), price=None, normalized=normalized))
+    common_days, prices = _align([histories[ticker] for ticker in tickers])
+    weight_vector = np.array([weights[ticker] for ticker in tickers])
+    portfolio = (prices / prices[0]) @ weight_vector * 100
+    portfolio_points = [
+        StockHistoryPoint(date=date_value, price=None, normalized=value)
+        for date_value, value in zip(_iso_dates(common_days), portfolio.tolist())
+    ]
     series.append(
         StockHistorySeries(
             name="PORTFOLIO",
@@ -275,7 +651,7 @@ def stock_history(data: StockHistoryInput) -> StockHistoryResult:
     )
 
     return StockHistoryResult(
-        source="yahoo_chart",
+        source=provider.name,
         start_date=start.isoformat(),
         end_date=end.isoformat(),
         series=series,
@@ -283,21 +659,25 @@ def stock_history(data: StockHistoryInput) -> StockHistoryResult:
     )
 
 
-def _contribution_dates(common_dates: list[dt.date], periodic_months: int) -> set[dt.date]:
-    if not common_dates:
-        return set()
-    base = common_dates[0]
-    seen_months: set[tuple[int, int]] = set()
-    dates: set[dt.date] = set()
-    for current in common_dates:
-        key = (current.year, current.month)
-        if key in seen_months:
-            continue
-        seen_months.add(key)
-        month_delta = (current.year - base.year) * 12 + (current.month - base.month)
-        if month_delta % periodic_months == 0:
-            dates.add(current)
-    return dates
+def _month_index(days: np.ndarray) -> np.ndarray:
+    return (days.astype(np.int64) - _EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+
+
+def _contribution_mask(days: np.ndarray, periodic_months: int) -> np.ndarray:
+    months = _month_index(days)
+    # The first trading day of every periodic_months-th month, counted from the first month of the window.
+    first_in_month = np.concatenate(([True], months[1:] != months[:-1]))
+    return first_in_month & ((months - months[0]) % periodic_months == 0)
+
+
+def _resolution_mask(days: np.ndarray, resolution: str) -> np.ndarray:
+    if resolution == "none":
+        return np.zeros(days.size, dtype=bool)
+    if resolution == "daily":
+        return np.ones(days.size, dtype=bool)
+    # Ordinal 1 is a Monday, so (day - 1) // 7 numbers Monday-based weeks.
+    periods = _month_index(days) if resolution == "monthly" else (days.astype(np.int64) - 1) // 7
+    return np.concatenate((periods[1:] != periods[:-1], [True]))
 
 
 def stock_backtest(data: StockBacktestInput) -> StockBacktestResult:
@@ -307,50 +687,41 @@ def stock_backtest(data: StockBacktestInput) -> StockBacktestResult:
     tickers = [ticker.upper() for ticker in data.tickers]
     start, end = _resolve_window(data.start_date, data.end_date, data.period_years)
     weights = _normalize_weights(tickers, data.weights)
-    histories, last_updated, warnings = _load_histories(tickers, start, end)
-
-    common_dates = sorted(set.intersection(*(set(point[0] for point in histories[ticker]) for ticker in tickers)))
-    if not common_dates:
-        raise ValueError("No overlapping dates across requested tickers")
-
-    contribution_dates = _contribution_dates(common_dates, data.periodic_months)
-    price_maps = {ticker: {date_value: price for date_value, price in histories[ticker]} for ticker in tickers}
-    shares = {ticker: 0.0 for ticker in tickers}
-    invested = 0.0
-    timeline: list[StockBacktestPoint] = []
-
-    for idx, date_value in enumerate(common_dates):
-        contribution = 0.0
-        if idx == 0 and data.lump_sum > 0:
-            contribution += data.lump_sum
-        if date_value in contribution_dates and data.periodic_amount > 0:
-            contribution += data.periodic_amount
-        if contribution > 0:
-            invested += contribution
-            for ticker in tickers:
-                allocation = contribution * weights[ticker]
-                shares[ticker] += allocation / price_maps[ticker][date_value]
-
-        value = sum(shares[ticker] * price_maps[ticker][date_value] for ticker in tickers)
-        revenue = value - invested
-        timeline.append(
-            StockBacktestPoint(
-                date=date_value.isoformat(),
-                invested=invested,
-                value=value,
-                revenue=revenue,
-            )
+    provider = resolve_market_data_provider(data.provider, data.data_dir)
+    histories, last_updated, warnings = _load_histories(tickers, start, end, provider)
+
+    common_days, prices = _align([histories[ticker] for ticker in tickers])
+    weight_vector = np.array([weights[ticker] for ticker in tickers])
+    contributions = np.where(_contribution_mask(common_days, data.periodic_months), data.periodic_amount, 0.0)
+    contributions[0] += data.lump_sum
+    invested = np.cumsum(contributions)
+    buying = contributions > 0
+    bought = np.zeros_like(prices)
+    bought[buying] = contributions[buying, None] * weight_vector / prices[buying]
+    # Holdings are the running sum of shares bought; value is the row-wise holdings-price product.
+    shares = np.cumsum(bought, axis=0)
+    value = np.einsum("ij,ij->i", shares, prices)
+
+    keep = np.flatnonzero(_resolution_mask(common_days, data.timeline_resolution))
+    timeline = [
+        StockBacktestPoint(date=date_value, invested=paid, value=worth, revenue=worth - paid)
+        for date_value, paid, worth in zip(
+            _iso_dates(common_days[keep]), invested[keep].tolist(), value[keep].tolist()
         )
+    ]
 
-    final = timeline[-1]
-    final_return_percent = (final.revenue / final.invested * 100) if final.invested > 0 else 0.0
+    final_invested = float(invested[-1])
+    final_value = float(value[-1])
+    final_revenue = final_value - final_invested
+    final_return_percent = (final_revenue / final_invested * 100) if final_invested > 0 else 0.0
+    start_date, end_date = _iso_dates(common_days[[0, -1]])
     return StockBacktestResult(
-        source="yahoo_chart",
-        start_date=common_dates[0].isoformat(),
-        end_date=common_dates[-1].isoformat(),
-        final_invested=final.invested,
-        final_value=final.value,
-        final_revenue=final.revenue,
+        source=provider.name,
+        start_date=start_date,
+        end_date=end_date,
+        final_invested=final_invested,
+        final_value=final_value,
+        final_revenue=final_revenue,
         final_return_percent=final_return_percent,
         timeline=timeline,
         last_updated=last_updated.isoformat(),
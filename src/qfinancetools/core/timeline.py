@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from qfinancetools.core.bonds import bond_price
+from qfinancetools.core.bonds import bond_ladder_projection, bond_price
 from qfinancetools.core.guardrails import bonds_warnings, invest_warnings, loan_warnings
 from qfinancetools.core.investments import investment_growth
 from qfinancetools.core.loans import loan_summary
 from qfinancetools.core.stocks import stock_projection
-from qfinancetools.models.bonds import BondPriceInput
+from qfinancetools.models.bonds import BondLadderProjectionInput, BondPriceInput
 from qfinancetools.models.investments import InvestmentInput
 from qfinancetools.models.loans import LoanInput
 from qfinancetools.models.stocks import StockProjectionInput
@@ -27,6 +27,7 @@ def build_unified_timeline(
     invest_input: InvestmentInput | None = None,
     bond_input: BondPriceInput | None = None,
     stock_input: StockProjectionInput | None = None,
+    ladder_input: BondLadderProjectionInput | None = None,
 ) -> TimelineResult:
     loan_flows = [0.0] * request.months
     invest_flows = [0.0] * request.months
@@ -60,6 +61,13 @@ def build_unified_timeline(
         _ = bond_price(bond_input)
         warnings.extend(bonds_warnings(bond_input.yield_rate, bond_input.coupon_rate, bond_input.years))
 
+    if request.include_bonds and ladder_input is not None:
+        ladder = bond_ladder_projection(ladder_input)
+        within = ladder.month <= request.months
+        for month, amount in zip(ladder.month[within].tolist(), ladder.net[within].tolist()):
+            bond_flows[month - 1] += amount
+        warnings.extend(ladder.warnings)
+
     if request.include_stocks and stock_input is not None:
         months = min(stock_input.years * 12, request.months)
         for month_idx in range(months):
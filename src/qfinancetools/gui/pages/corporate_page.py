@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import numpy as np
 from PySide6 import QtWidgets
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
-from qfinancetools.core.corporate import wacc, capm, npv, irr, dcf, comps
+from qfinancetools.core.corporate import wacc, capm, npv, irr, dcf, dcf_grid, comps
 from qfinancetools.models.corporate import (
     WaccInput,
     CapmInput,
     NpvInput,
     IrrInput,
     DcfInput,
+    DcfGridInput,
     CompsInput,
 )
 from qfinancetools.gui.widgets import (
@@ -351,7 +353,7 @@ class CorporatePage(QtWidgets.QWidget):
             except Exception as exc:
                 show_error(error, str(exc))
                 return
-            card.set_value(f"{result.irr:.3f}%")
+            card.set_value("n/a" if result.irr is None else f"{result.irr:.3f}%")
             figure.clear()
             ax = figure.add_subplot(111)
             colors = ["#f97316" if val < 0 else "#0ea5e9" for val in flows]
@@ -428,8 +430,38 @@ class CorporatePage(QtWidgets.QWidget):
         canvas = FigureCanvas(figure)
         canvas.setMinimumHeight(240)
         right.addWidget(canvas, 2)
+        grid_figure = Figure(figsize=(5, 3))
+        grid_canvas = FigureCanvas(grid_figure)
+        grid_canvas.setMinimumHeight(260)
+        right.addWidget(grid_canvas, 2)
         right.addStretch(1)
 
+        def draw_grid(flows: list[float], multiple: float | None) -> None:
+            # Steps near the spin box limits clamp onto the same value, so duplicates are dropped.
+            rates = sorted({max(0.0, rate.value() + step) for step in (-2, -1, -0.5, 0, 0.5, 1, 2)})
+            growths = sorted({max(-0.99, terminal_growth.value() + step) for step in (-0.01, -0.005, 0, 0.005, 0.01)})
+            grid = dcf_grid(DcfGridInput(cash_flows=flows, discount_rates=rates, terminal_growths=growths))
+            values = np.array([[np.nan if value is None else value for value in row] for row in grid.total_value])
+            grid_figure.clear()
+            ax = grid_figure.add_subplot(111)
+            ax.imshow(values, cmap="Blues", aspect="auto")
+            ax.set_xticks(range(len(growths)), [f"{growth:.2%}" for growth in growths])
+            ax.set_yticks(range(len(rates)), [f"{value:.2f}%" for value in rates])
+            ax.set_xlabel("Terminal growth")
+            ax.set_ylabel("Discount rate")
+            finite = values[np.isfinite(values)]
+            midpoint = (finite.min() + finite.max()) / 2 if finite.size else 0.0
+            for (row, col), value in np.ndenumerate(values):
+                if np.isfinite(value):
+                    ax.text(col, row, f"${value:,.0f}", ha="center", va="center", fontsize=7,
+                            color="white" if value > midpoint else "#0f172a")
+            title = "Total value sensitivity"
+            if multiple is not None:
+                title += " (growth model; terminal multiple not applied)"
+            apply_chart_theme(ax, title)
+            grid_figure.tight_layout()
+            grid_canvas.draw()
+
         def calculate() -> None:
             try:
                 flows = parse_list_floats(cash_flows.text())
@@ -442,6 +474,7 @@ class CorporatePage(QtWidgets.QWidget):
                     terminal_multiple=multiple,
                 )
                 result = dcf(data)
+                draw_grid(flows, multiple)
                 show_error(error, None)
             except Exception as exc:
                 show_error(error, str(exc))
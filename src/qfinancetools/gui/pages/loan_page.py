@@ -149,8 +149,8 @@ class LoanPage(QtWidgets.QWidget):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         if rows:
-            months = [row.month for row in rows]
-            balances = [row.balance for row in rows]
+            months = rows.month
+            balances = rows.balance
             ax.plot(months, balances, color="#0ea5e9", linewidth=2)
             ax.fill_between(months, balances, color="#bae6fd", alpha=0.6)
             ax.set_xlabel("Month")
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import tempfile
+from pathlib import Path
+
+import numpy as np
 from PySide6 import QtWidgets
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
-from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, stress_test
+from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, stress_test, load_monte_carlo_paths
 from qfinancetools.models.risk import (
     ScenarioInput,
     SensitivityInput,
@@ -253,7 +257,20 @@ class RiskPage(QtWidgets.QWidget):
         canvas = FigureCanvas(figure)
         canvas.setMinimumHeight(240)
         right.addWidget(canvas, 2)
+        fan_figure = Figure(figsize=(5, 3))
+        fan_canvas = FigureCanvas(fan_figure)
+        fan_canvas.setMinimumHeight(240)
+        right.addWidget(fan_canvas, 2)
         right.addStretch(1)
+        # One private file per page instance, so concurrent GUI sessions never share or race on the path matrix.
+        with tempfile.NamedTemporaryFile(prefix="qfinancetools-paths-", suffix=".npy", delete=False) as handle:
+            paths_file = Path(handle.name)
+
+        def remove_paths_file() -> None:
+            paths_file.unlink(missing_ok=True)
+
+        widget.destroyed.connect(remove_paths_file)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(remove_paths_file)
 
         def calculate() -> None:
             try:
@@ -264,6 +281,8 @@ class RiskPage(QtWidgets.QWidget):
                     years=years.value(),
                     simulations=sims.value(),
                     seed=seed.value(),
+                    output="summary",
+                    paths_file=str(paths_file),
                 )
                 result = monte_carlo(data)
                 show_error(error, None)
@@ -276,7 +295,8 @@ class RiskPage(QtWidgets.QWidget):
             card_p95.set_value(f"${result.p95:,.2f}")
             figure.clear()
             ax = figure.add_subplot(111)
-            ax.hist(result.values, bins=35, color="#0ea5e9", alpha=0.85, edgecolor="#ffffff")
+            edges = result.histogram.edges
+            ax.hist(edges[:-1], bins=edges, weights=result.histogram.counts, color="#0ea5e9", alpha=0.85, edgecolor="#ffffff")
             ax.axvspan(result.p5, result.p95, color="#bae6fd", alpha=0.35, label="P5–P95")
             ax.axvline(result.p5, color="#94a3b8", linestyle="--", linewidth=1)
             ax.axvline(result.median, color="#0f172a", linestyle="-", linewidth=1.2, label="Median")
@@ -290,6 +310,23 @@ class RiskPage(QtWidgets.QWidget):
             figure.tight_layout()
             canvas.draw()
 
+            bands = result.paths
+            year_axis = np.arange(1, bands.years + 1)
+            # Copy the sample out so no memmap keeps the file open between runs.
+            sample = np.array(load_monte_carlo_paths(bands)[:25])
+            fan_figure.clear()
+            fan_ax = fan_figure.add_subplot(111)
+            fan_ax.plot(year_axis, sample.T, color="#94a3b8", linewidth=0.6, alpha=0.5)
+            fan_ax.fill_between(year_axis, bands.p5, bands.p95, color="#bae6fd", alpha=0.5, label="P5–P95")
+            fan_ax.plot(year_axis, bands.median, color="#0f172a", linewidth=1.4, label="Median")
+            fan_ax.set_xlabel("Year")
+            fan_ax.set_ylabel("Value")
+            fan_ax.legend(frameon=False, fontsize=9)
+            apply_chart_theme(fan_ax)
+            format_currency_axis(fan_ax, "y")
+            fan_figure.tight_layout()
+            fan_canvas.draw()
+
         left.addWidget(make_primary_button("Calculate", calculate))
         calculate()
 
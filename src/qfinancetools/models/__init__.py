@@ -1,4 +1,10 @@
-from qfinancetools.models.loans import LoanInput, LoanResult, AmortizationRow
+from qfinancetools.models.loans import (
+    LoanInput,
+    LoanResult,
+    AmortizationRow,
+    AmortizationSchedule,
+    LoanBatchResult,
+)
 from qfinancetools.models.investments import InvestmentInput, InvestmentResult
 from qfinancetools.models.afford import AffordInput, AffordResult
 from qfinancetools.models.corporate import (
@@ -10,22 +16,36 @@ from qfinancetools.models.corporate import (
     NpvResult,
     IrrInput,
     IrrResult,
+    IrrBatchResult,
     DcfInput,
     DcfResult,
+    DcfGridInput,
+    DcfGridResult,
     CompsInput,
     CompsResult,
+    CompsTableInput,
+    CompsTableResult,
+    CompsMetricStats,
 )
 from qfinancetools.models.bonds import (
     BondPriceInput,
     BondPriceResult,
     BondYtmInput,
     BondYtmResult,
+    BondYtmBatchResult,
     BondDurationInput,
     BondDurationResult,
     BondConvexityInput,
     BondConvexityResult,
+    BondAnalyticsInput,
+    BondAnalyticsResult,
     BondLadderInput,
     BondLadderResult,
+    BondLadderProjectionInput,
+    BondLadderProjection,
+    BondPortfolioResult,
+    BondCurveInput,
+    YieldCurve,
 )
 from qfinancetools.models.risk import (
     ScenarioInput,
@@ -33,7 +53,11 @@ from qfinancetools.models.risk import (
     SensitivityInput,
     SensitivityResult,
     MonteCarloInput,
+    MonteCarloHistogram,
+    MonteCarloPaths,
     MonteCarloResult,
+    MonteCarloDcfInput,
+    MonteCarloDcfResult,
     StressTestInput,
     StressTestResult,
 )
@@ -64,6 +88,7 @@ from qfinancetools.models.plugins import (
 from qfinancetools.models.stocks import (
     StockProjectionInput,
     StockProjectionResult,
+    PriceSeries,
     StockHistoryInput,
     StockHistoryPoint,
     StockHistorySeries,
@@ -77,6 +102,8 @@ __all__ = [
     "LoanInput",
     "LoanResult",
     "AmortizationRow",
+    "AmortizationSchedule",
+    "LoanBatchResult",
     "InvestmentInput",
     "InvestmentResult",
     "AffordInput",
@@ -89,26 +116,44 @@ __all__ = [
     "NpvResult",
     "IrrInput",
     "IrrResult",
+    "IrrBatchResult",
     "DcfInput",
     "DcfResult",
+    "DcfGridInput",
+    "DcfGridResult",
     "CompsInput",
     "CompsResult",
+    "CompsTableInput",
+    "CompsTableResult",
+    "CompsMetricStats",
     "BondPriceInput",
     "BondPriceResult",
     "BondYtmInput",
     "BondYtmResult",
+    "BondYtmBatchResult",
     "BondDurationInput",
     "BondDurationResult",
     "BondConvexityInput",
     "BondConvexityResult",
+    "BondAnalyticsInput",
+    "BondAnalyticsResult",
     "BondLadderInput",
     "BondLadderResult",
+    "BondLadderProjectionInput",
+    "BondLadderProjection",
+    "BondPortfolioResult",
+    "BondCurveInput",
+    "YieldCurve",
     "ScenarioInput",
     "ScenarioResult",
     "SensitivityInput",
     "SensitivityResult",
     "MonteCarloInput",
+    "MonteCarloHistogram",
+    "MonteCarloPaths",
     "MonteCarloResult",
+    "MonteCarloDcfInput",
+    "MonteCarloDcfResult",
     "StressTestInput",
     "StressTestResult",
     "WarningItem",
@@ -131,6 +176,7 @@ __all__ = [
     "PluginRegistrySnapshot",
     "StockProjectionInput",
     "StockProjectionResult",
+    "PriceSeries",
     "StockHistoryInput",
     "StockHistoryPoint",
     "StockHistorySeries",
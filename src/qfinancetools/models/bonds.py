@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass, field
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from qfinancetools.models.explain import ExplanationBlock, WarningItem
 
@@ -23,6 +26,51 @@ class BondPriceResult(BaseModel):
     explanation: ExplanationBlock | None = None
 
 
+class YieldCurve(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    tenors: list[float] = Field(..., min_length=1)
+    zero_rates: list[float] = Field(..., min_length=1)
+
+    _grids: dict[int, np.ndarray] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _check_points(self) -> YieldCurve:
+        if len(self.tenors) != len(self.zero_rates):
+            raise ValueError("tenors and zero_rates must have the same length")
+        if self.tenors[0] <= 0 or any(b <= a for a, b in zip(self.tenors, self.tenors[1:])):
+            raise ValueError("tenors must be positive and strictly increasing")
+        return self
+
+    def zero_rate(self, years: float | np.ndarray) -> float | np.ndarray:
+        # Linear in the zero rate between tenors, flat beyond the first and last points.
+        return np.interp(years, self.tenors, self.zero_rates)
+
+    def discount_factors(self, payments_per_year: int, periods: int) -> np.ndarray:
+        # Factors on the k / payments_per_year grid, compounded at the pricing frequency and cached per frequency.
+        grid = self._grids.get(payments_per_year)
+        if grid is None or grid.size < periods:
+            size = max(periods, 2 * grid.size if grid is not None else periods)
+            k = np.arange(1, size + 1, dtype=np.float64)
+            grid = (1 + np.asarray(self.zero_rate(k / payments_per_year)) / 100 / payments_per_year) ** -k
+            grid.flags.writeable = False
+            self._grids[payments_per_year] = grid
+        return grid[:periods]
+
+    def shifted(self, basis_points: float) -> YieldCurve:
+        return YieldCurve(tenors=self.tenors, zero_rates=[rate + basis_points / 100 for rate in self.zero_rates])
+
+
+class BondCurveInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    face_value: float = Field(..., gt=0)
+    coupon_rate: float = Field(..., ge=0)
+    curve: YieldCurve
+    years: int = Field(..., gt=0)
+    payments_per_year: int = Field(2, gt=0)
+
+
 class BondYtmInput(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -31,17 +79,32 @@ class BondYtmInput(BaseModel):
     price: float = Field(..., gt=0)
     years: int = Field(..., gt=0)
     payments_per_year: int = Field(2, gt=0)
-    guess: float = Field(0.05, ge=0)
+    guess: float = Field(0.05, ge=-0.99)
 
 
 class BondYtmResult(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     yield_rate: float
+    iterations: int = 0
+    converged: bool = True
+    method: str = "newton"
     warnings: list[WarningItem] = Field(default_factory=list)
     explanation: ExplanationBlock | None = None
 
 
+@dataclass(frozen=True, eq=False)
+class BondYtmBatchResult:
+    yield_rate: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+    method: np.ndarray
+    warnings: dict[int, list[WarningItem]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.yield_rate.size)
+
+
 class BondDurationInput(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -79,6 +142,27 @@ class BondConvexityResult(BaseModel):
     explanation: ExplanationBlock | None = None
 
 
+class BondAnalyticsInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    face_value: float = Field(..., gt=0)
+    coupon_rate: float = Field(..., ge=0)
+    yield_rate: float = Field(..., ge=0)
+    years: int = Field(..., gt=0)
+    payments_per_year: int = Field(2, gt=0)
+
+
+class BondAnalyticsResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    price: float
+    macaulay_duration: float
+    modified_duration: float
+    convexity: float
+    warnings: list[WarningItem] = Field(default_factory=list)
+    explanation: ExplanationBlock | None = None
+
+
 class BondLadderInput(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -94,3 +178,65 @@ class BondLadderResult(BaseModel):
     schedule: list[tuple[int, float]]
     warnings: list[WarningItem] = Field(default_factory=list)
     explanation: ExplanationBlock | None = None
+
+
+@dataclass(frozen=True, eq=False)
+class BondPortfolioResult:
+    price: np.ndarray
+    macaulay_duration: np.ndarray
+    modified_duration: np.ndarray
+    convexity: np.ndarray
+    market_value: float
+    face_value: float
+    macaulay_duration_total: float
+    modified_duration_total: float
+    convexity_total: float
+    warnings: dict[int, list[WarningItem]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.price.size)
+
+
+class BondLadderProjectionInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    maturities: list[int] = Field(..., min_length=1)
+    amounts: list[float] = Field(..., min_length=1)
+    coupon_rates: list[float] = Field(..., min_length=1)
+    yield_rates: list[float] | None = None
+    payments_per_year: int = Field(2, gt=0)
+    horizon_years: int | None = Field(None, gt=0)
+    reinvest: bool = False
+    reinvest_years: int | None = Field(None, gt=0)
+    reinvest_rate: float | None = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def _check_rungs(self) -> BondLadderProjectionInput:
+        size = len(self.maturities)
+        if len(self.amounts) != size or len(self.coupon_rates) != size:
+            raise ValueError("maturities, amounts and coupon_rates must have the same length")
+        if self.yield_rates is not None and len(self.yield_rates) != size:
+            raise ValueError("yield_rates must have one entry per rung")
+        if min(self.maturities) <= 0 or min(self.amounts) <= 0 or min(self.coupon_rates) < 0:
+            raise ValueError("maturities and amounts must be positive and coupon_rates non-negative")
+        if 12 % self.payments_per_year:
+            raise ValueError("payments_per_year must divide 12")
+        return self
+
+
+@dataclass(frozen=True, eq=False)
+class BondLadderProjection:
+    month: np.ndarray
+    coupon: np.ndarray
+    principal: np.ndarray
+    reinvested: np.ndarray
+    net: np.ndarray
+    annual_income: np.ndarray
+    total_invested: float
+    ladder_yield: float
+    macaulay_duration: float
+    modified_duration: float
+    warnings: list[WarningItem] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return int(self.month.size)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from qfinancetools.models.explain import ExplanationBlock, WarningItem
 
@@ -58,15 +62,38 @@ class IrrInput(BaseModel):
 
     cash_flows: list[float] = Field(..., min_length=2)
     guess: float = Field(0.1, ge=-0.99)
+    method: Literal["newton", "roots"] = "newton"
 
 
 class IrrResult(BaseModel):
     model_config = ConfigDict(frozen=True)
 
-    irr: float
+    # None only when the roots method finds no IRR above -100%; Newton always reports its last iterate.
+    irr: float | None
+    roots: list[float] = Field(default_factory=list)
+    converged: bool = True
+    iterations: int = 0
+    residual: float | None = 0.0
+    method: str = "newton"
     warnings: list[WarningItem] = Field(default_factory=list)
     explanation: ExplanationBlock | None = None
 
+    @model_validator(mode="after")
+    def _check_missing_root(self) -> IrrResult:
+        if (self.irr is None or self.residual is None) and (self.method != "roots" or self.roots):
+            raise ValueError("irr and residual may only be None when the roots method finds no root")
+        return self
+
+
+@dataclass(frozen=True, eq=False)
+class IrrBatchResult:
+    irr: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.irr.size)
+
 
 class DcfInput(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -87,6 +114,26 @@ class DcfResult(BaseModel):
     explanation: ExplanationBlock | None = None
 
 
+class DcfGridInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    cash_flows: list[float] = Field(..., min_length=1)
+    discount_rates: list[float] = Field(..., min_length=1)
+    terminal_growths: list[float] = Field(..., min_length=1)
+
+
+class DcfGridResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    discount_rates: list[float]
+    terminal_growths: list[float]
+    present_value: list[float]
+    terminal_value: list[list[float | None]]
+    total_value: list[list[float | None]]
+    warnings: list[WarningItem] = Field(default_factory=list)
+    explanation: ExplanationBlock | None = None
+
+
 class CompsInput(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -102,3 +149,67 @@ class CompsResult(BaseModel):
     median: float
     warnings: list[WarningItem] = Field(default_factory=list)
     explanation: ExplanationBlock | None = None
+
+
+class CompsTableInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    multiples: dict[str, list[float | None]] = Field(..., min_length=1)
+    sector: list[str] | None = None
+    size: list[float] | None = None
+    sectors: list[str] | None = None
+    min_size: float | None = None
+    max_size: float | None = None
+    quantiles: list[float] = Field(default_factory=lambda: [0.25, 0.5, 0.75])
+    trim: float = Field(0.1, ge=0, lt=0.5)
+    outlier_fence: float = Field(1.5, gt=0)
+    subject: dict[str, float] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _check_columns(self) -> CompsTableInput:
+        lengths = {len(column) for column in self.multiples.values()}
+        if len(lengths) != 1:
+            raise ValueError("all multiple columns must have the same length")
+        size = lengths.pop()
+        if self.sector is not None and len(self.sector) != size:
+            raise ValueError("sector must have one entry per peer")
+        if self.size is not None and len(self.size) != size:
+            raise ValueError("size must have one entry per peer")
+        if self.sectors is not None and self.sector is None:
+            raise ValueError("sector column is required to filter by sectors")
+        if (self.min_size is not None or self.max_size is not None) and self.size is None:
+            raise ValueError("size column is required to filter by size")
+        if any(not 0 <= q <= 1 for q in self.quantiles):
+            raise ValueError("quantiles must be between 0 and 1")
+        unknown = set(self.subject) - set(self.multiples)
+        if unknown:
+            raise ValueError(f"subject metrics without a multiple column: {', '.join(sorted(unknown))}")
+        return self
+
+
+class CompsMetricStats(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    count: int
+    low: float | None
+    high: float | None
+    median: float | None
+    mean: float | None
+    trimmed_mean: float | None
+    quantiles: dict[str, float | None]
+    robust_low: float | None
+    robust_high: float | None
+    outliers: int
+    implied_low: float | None = None
+    implied_median: float | None = None
+    implied_high: float | None = None
+
+
+class CompsTableResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    peers: int
+    metrics: list[CompsMetricStats]
+    warnings: list[WarningItem] = Field(default_factory=list)
+    explanation: ExplanationBlock | None = None
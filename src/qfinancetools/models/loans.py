@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import overload
+
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from qfinancetools.models.explain import ExplanationBlock, WarningItem
@@ -40,3 +45,60 @@ class AmortizationRow(BaseModel):
         if value <= 0:
             raise ValueError("month must be positive")
         return value
+
+
+@dataclass(frozen=True, eq=False)
+class AmortizationSchedule:
+    month: np.ndarray
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    balance: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.month.size)
+
+    @overload
+    def __getitem__(self, idx: int) -> AmortizationRow: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[AmortizationRow]: ...
+
+    def __getitem__(self, idx: int | slice) -> AmortizationRow | list[AmortizationRow]:
+        # Slices keep the list behaviour the schedule had before it became columnar.
+        if isinstance(idx, slice):
+            return [self[pos] for pos in range(*idx.indices(len(self)))]
+        return AmortizationRow(
+            month=int(self.month[idx]),
+            payment=float(self.payment[idx]),
+            principal=float(self.principal[idx]),
+            interest=float(self.interest[idx]),
+            balance=float(self.balance[idx]),
+        )
+
+    def __iter__(self) -> Iterator[AmortizationRow]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def total_paid(self) -> float:
+        return float(self.payment.sum())
+
+    @property
+    def total_interest(self) -> float:
+        return float(self.interest.sum())
+
+    def rows(self) -> list[AmortizationRow]:
+        return list(self)
+
+
+@dataclass(frozen=True, eq=False)
+class LoanBatchResult:
+    monthly_payment: np.ndarray
+    total_interest: np.ndarray
+    total_paid: np.ndarray
+    years: np.ndarray
+    warnings: dict[int, list[WarningItem]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.monthly_payment.size)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from qfinancetools.models.explain import ExplanationBlock, WarningItem
 
@@ -45,6 +47,30 @@ class MonteCarloInput(BaseModel):
     years: int = Field(..., gt=0)
     simulations: int = Field(..., gt=0)
     seed: int = Field(0, ge=0)
+    engine: Literal["vectorized", "compat"] = "vectorized"
+    workers: int = Field(1, gt=0)
+    chunk_size: int = Field(100_000, gt=0)
+    output: Literal["values", "summary"] = "values"
+    histogram_bins: int = Field(35, gt=0)
+    paths_file: str | None = None
+
+
+class MonteCarloHistogram(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    edges: list[float]
+    counts: list[int]
+
+
+class MonteCarloPaths(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    file: str
+    simulations: int
+    years: int
+    median: list[float]
+    p5: list[float]
+    p95: list[float]
 
 
 class MonteCarloResult(BaseModel):
@@ -54,7 +80,56 @@ class MonteCarloResult(BaseModel):
     median: float
     p5: float
     p95: float
-    values: list[float]
+    values: list[float] = Field(default_factory=list)
+    histogram: MonteCarloHistogram | None = None
+    paths: MonteCarloPaths | None = None
+    warnings: list[WarningItem] = Field(default_factory=list)
+    explanation: ExplanationBlock | None = None
+
+
+class MonteCarloDcfInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    cash_flows: list[float] = Field(..., min_length=1)
+    discount_rate: float = Field(..., ge=0)
+    terminal_growth: float = Field(0.0, ge=-0.99)
+    growth_volatility: float = Field(0.05, ge=0)
+    margin_volatility: float = Field(0.03, ge=0)
+    rate_volatility: float = Field(1.0, ge=0)
+    correlation: list[list[float]] | None = None
+    simulations: int = Field(..., gt=0)
+    seed: int = Field(0, ge=0)
+    workers: int = Field(1, gt=0)
+    chunk_size: int = Field(100_000, gt=0)
+    output: Literal["values", "summary"] = "values"
+    histogram_bins: int = Field(35, gt=0)
+
+    @field_validator("correlation")
+    @classmethod
+    def _check_correlation(cls, value: list[list[float]] | None) -> list[list[float]] | None:
+        if value is None:
+            return value
+        if len(value) != 3 or any(len(row) != 3 for row in value):
+            raise ValueError("correlation must be a 3x3 matrix ordered growth, margin, rate")
+        for i in range(3):
+            if value[i][i] != 1:
+                raise ValueError("correlation diagonal must be 1")
+            for j in range(3):
+                if value[i][j] != value[j][i] or not -1 <= value[i][j] <= 1:
+                    raise ValueError("correlation must be symmetric with entries in [-1, 1]")
+        return value
+
+
+class MonteCarloDcfResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    mean: float
+    median: float
+    p5: float
+    p95: float
+    valid_simulations: int
+    values: list[float] = Field(default_factory=list)
+    histogram: MonteCarloHistogram | None = None
     warnings: list[WarningItem] = Field(default_factory=list)
     explanation: ExplanationBlock | None = None
 
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import datetime as dt
+from dataclasses import dataclass
+from typing import Iterable, Literal
+
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from qfinancetools.models.explain import ExplanationBlock, WarningItem
@@ -28,6 +33,35 @@ class StockProjectionResult(BaseModel):
     explanation: ExplanationBlock | None = None
 
 
+@dataclass(frozen=True, eq=False)
+class PriceSeries:
+    days: np.ndarray
+    closes: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.days.size)
+
+    @classmethod
+    def from_points(cls, points: Iterable[tuple[dt.date, float]]) -> PriceSeries:
+        pairs = list(points)
+        days = np.fromiter((point_date.toordinal() for point_date, _ in pairs), dtype=np.int32, count=len(pairs))
+        closes = np.fromiter((price for _, price in pairs), dtype=np.float64, count=len(pairs))
+        # unique sorts by day and keeps one close per day.
+        days, index = np.unique(days, return_index=True)
+        return cls(days=days, closes=closes[index])
+
+    @property
+    def first_date(self) -> dt.date:
+        return dt.date.fromordinal(int(self.days[0]))
+
+    @property
+    def last_date(self) -> dt.date:
+        return dt.date.fromordinal(int(self.days[-1]))
+
+    def points(self) -> list[tuple[dt.date, float]]:
+        return [(dt.date.fromordinal(day), price) for day, price in zip(self.days.tolist(), self.closes.tolist())]
+
+
 class StockHistoryInput(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -36,6 +70,8 @@ class StockHistoryInput(BaseModel):
     end_date: str | None = None
     period_years: int = Field(5, gt=0)
     weights: list[float] | None = None
+    provider: str = Field("yahoo", min_length=1)
+    data_dir: str | None = None
 
 
 class StockHistoryPoint(BaseModel):
@@ -76,6 +112,9 @@ class StockBacktestInput(BaseModel):
     periodic_amount: float = Field(0.0, ge=0)
     periodic_months: int = Field(1, gt=0)
     weights: list[float] | None = None
+    provider: str = Field("yahoo", min_length=1)
+    data_dir: str | None = None
+    timeline_resolution: Literal["daily", "weekly", "monthly", "none"] = "daily"
 
 
 class StockBacktestPoint(BaseModel):
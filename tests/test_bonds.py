@@ -1,12 +1,31 @@
+import numpy as np
 import pytest
 
-from qfinancetools.core.bonds import bond_price, bond_ytm, bond_duration, bond_convexity, bond_ladder
+import qfinancetools.core.bonds as bonds_core
+from qfinancetools.core.bonds import (
+    bond_price,
+    bond_ytm,
+    bond_duration,
+    bond_convexity,
+    bond_analytics,
+    bond_ladder,
+    bond_ladder_projection,
+    bond_portfolio,
+    bond_ytm_batch,
+    bond_price_curve,
+    bond_duration_curve,
+)
 from qfinancetools.models.bonds import (
     BondPriceInput,
     BondYtmInput,
+    BondYtmResult,
     BondDurationInput,
     BondConvexityInput,
+    BondAnalyticsInput,
     BondLadderInput,
+    BondLadderProjectionInput,
+    BondCurveInput,
+    YieldCurve,
 )
 
 
@@ -39,3 +58,182 @@ def test_bond_ladder() -> None:
     result = bond_ladder(data)
     assert result.total_invested == 4000
     assert result.weighted_maturity == pytest.approx((1*1000 + 3*1000 + 5*2000) / 4000)
+
+
+def _loop_analytics(face, coupon_rate, yield_rate, years, freq):
+    periods = years * freq
+    rate = yield_rate / 100 / freq
+    coupon = face * coupon_rate / 100 / freq
+    price = weighted = convex = 0.0
+    for t in range(1, periods + 1):
+        cash = coupon + (face if t == periods else 0.0)
+        pv = cash / (1 + rate) ** t
+        price += pv
+        weighted += t * pv
+        convex += t * (t + 1) * pv
+    macaulay = weighted / price / freq
+    return price, macaulay, macaulay / (1 + rate), convex / (price * (1 + rate) ** 2) / freq**2
+
+
+@pytest.mark.parametrize(
+    "coupon,yield_rate,years,freq",
+    [(5, 4.5, 10, 2), (0, 5, 2, 1), (7, 0, 30, 2), (3, 0.4, 20, 12), (6, 1.2, 5, 4), (12, 18, 40, 2)],
+)
+def test_bond_analytics_matches_cash_flow_loop(coupon, yield_rate, years, freq) -> None:
+    result = bond_analytics(
+        BondAnalyticsInput(face_value=1000, coupon_rate=coupon, yield_rate=yield_rate, years=years, payments_per_year=freq)
+    )
+    price, macaulay, modified, convexity = _loop_analytics(1000, coupon, yield_rate, years, freq)
+    assert result.price == pytest.approx(price, rel=1e-10)
+    assert result.macaulay_duration == pytest.approx(macaulay, rel=1e-10)
+    assert result.modified_duration == pytest.approx(modified, rel=1e-10)
+    assert result.convexity == pytest.approx(convexity, rel=1e-9)
+
+
+@pytest.mark.parametrize("yield_rate,freq", [(4, 2), (0.3, 12), (0, 1), (35, 2), (9.5, 4)])
+def test_bond_ytm_newton_roundtrip(yield_rate, freq) -> None:
+    price = bond_price(BondPriceInput(face_value=1000, coupon_rate=5, yield_rate=yield_rate, years=12, payments_per_year=freq)).price
+    result = bond_ytm(BondYtmInput(face_value=1000, coupon_rate=5, price=price, years=12, payments_per_year=freq))
+    assert result.converged
+    assert result.method == "newton"
+    assert result.iterations < 15
+    assert result.yield_rate == pytest.approx(yield_rate, abs=1e-9)
+
+
+def test_bond_ytm_negative_and_extreme_yields() -> None:
+    negative = bond_ytm(BondYtmInput(face_value=1000, coupon_rate=0, price=1020, years=5, payments_per_year=1))
+    assert negative.converged
+    assert negative.yield_rate == pytest.approx(((1000 / 1020) ** (1 / 5) - 1) * 100, rel=1e-10)
+
+    extreme = bond_ytm(BondYtmInput(face_value=1000, coupon_rate=0, price=0.001, years=10, payments_per_year=1))
+    assert extreme.converged
+    assert extreme.yield_rate == pytest.approx((1e6 ** 0.1 - 1) * 100, rel=1e-10)
+
+
+def test_bond_ytm_reports_unbracketed_root_as_not_converged() -> None:
+    # The upper bracket search stops at 1e6 per period; a price this small needs a larger yield.
+    result = bond_ytm(BondYtmInput(face_value=1000, coupon_rate=5, price=1e-30, years=1, payments_per_year=1))
+    assert not result.converged
+    assert result.method == "brent"
+    assert any(item.code == "bonds.ytm_not_converged" for item in result.warnings)
+    assert BondYtmResult(yield_rate=5.0).converged
+
+
+def test_bond_ytm_falls_back_to_brent_from_poor_guess() -> None:
+    result = bond_ytm(BondYtmInput(face_value=1000, coupon_rate=6, price=950, years=30, payments_per_year=2, guess=50))
+    assert result.converged
+    assert result.method == "brent"
+    repriced = bond_price(
+        BondPriceInput(face_value=1000, coupon_rate=6, yield_rate=result.yield_rate, years=30, payments_per_year=2)
+    ).price
+    assert repriced == pytest.approx(950, rel=1e-10)
+
+
+def test_bond_portfolio_matches_single_bond_analytics() -> None:
+    bonds = [(1000, 5, 4.5, 10, 2), (250000, 0, 3, 60, 1), (50000, 7.5, 0, 5, 12), (1e6, 25, 22, 1, 4)]
+    face, coupon, ytm, years, freq = (list(column) for column in zip(*bonds))
+    result = bond_portfolio(face, coupon, ytm, years, freq)
+    singles = [
+        bond_analytics(BondAnalyticsInput(face_value=f, coupon_rate=c, yield_rate=y, years=n, payments_per_year=p))
+        for f, c, y, n, p in bonds
+    ]
+    for idx, single in enumerate(singles):
+        assert result.price[idx] == pytest.approx(single.price, rel=1e-12)
+        assert result.macaulay_duration[idx] == pytest.approx(single.macaulay_duration, rel=1e-12)
+        assert result.modified_duration[idx] == pytest.approx(single.modified_duration, rel=1e-12)
+        assert result.convexity[idx] == pytest.approx(single.convexity, rel=1e-9)
+        assert [item.code for item in result.warnings.get(idx, [])] == [item.code for item in single.warnings]
+    market_value = sum(single.price for single in singles)
+    assert result.market_value == pytest.approx(market_value)
+    assert result.modified_duration_total == pytest.approx(
+        sum(single.price * single.modified_duration for single in singles) / market_value
+    )
+
+
+def test_bond_portfolio_reports_bad_row() -> None:
+    with pytest.raises(ValueError, match="row 1: years"):
+        bond_portfolio([1000, 1000], [5, 5], [4, 4], [10, 0])
+
+
+def test_bond_ytm_batch_matches_scalar_solver() -> None:
+    face, coupon, ytm, years, freq = [1000, 5000, 1000, 1000], [22, 0, 8, 3], [4, 6.5, 0.1, 25], [10, 60, 2, 7], [2, 1, 12, 4]
+    prices = bond_portfolio(face, coupon, ytm, years, freq).price
+    result = bond_ytm_batch(face, coupon, prices, years, freq)
+    assert result.converged.all()
+    assert result.yield_rate == pytest.approx(ytm, abs=1e-9)
+    for idx in range(len(result)):
+        single = bond_ytm(
+            BondYtmInput(face_value=face[idx], coupon_rate=coupon[idx], price=prices[idx], years=years[idx], payments_per_year=freq[idx])
+        )
+        assert result.yield_rate[idx] == pytest.approx(single.yield_rate, abs=1e-6)
+        assert [item.code for item in result.warnings.get(idx, [])] == [item.code for item in single.warnings]
+
+
+def test_bond_ytm_batch_handles_premium_and_deep_discount() -> None:
+    result = bond_ytm_batch([1000, 1000], [5, 0], [2000, 1], [10, 30], 2)
+    assert result.converged.all()
+    assert result.yield_rate[0] < 0
+    assert result.yield_rate[1] > 20
+
+
+def test_flat_curve_matches_flat_yield_pricing() -> None:
+    curve = YieldCurve(tenors=[1, 30], zero_rates=[4.5, 4.5])
+    data = BondCurveInput(face_value=1000, coupon_rate=5, curve=curve, years=10, payments_per_year=2)
+    flat = bond_analytics(BondAnalyticsInput(face_value=1000, coupon_rate=5, yield_rate=4.5, years=10, payments_per_year=2))
+    assert bond_price_curve(data).price == pytest.approx(flat.price, rel=1e-12)
+    duration = bond_duration_curve(data)
+    assert duration.macaulay_duration == pytest.approx(flat.macaulay_duration, rel=1e-12)
+    assert duration.modified_duration == pytest.approx(flat.modified_duration, rel=1e-12)
+
+
+def test_curve_duration_matches_parallel_shift() -> None:
+    curve = YieldCurve(tenors=[0.5, 2, 5, 10, 30], zero_rates=[4.0, 4.2, 4.5, 4.7, 5.0])
+    data = BondCurveInput(face_value=1000, coupon_rate=5, curve=curve, years=20, payments_per_year=2)
+    price = bond_price_curve(data).price
+    up = bond_price_curve(data.model_copy(update={"curve": curve.shifted(1)})).price
+    down = bond_price_curve(data.model_copy(update={"curve": curve.shifted(-1)})).price
+    assert bond_duration_curve(data).modified_duration == pytest.approx((down - up) / (2 * price * 1e-4), rel=1e-5)
+
+
+def test_yield_curve_caches_discount_grid() -> None:
+    curve = YieldCurve(tenors=[1, 10], zero_rates=[3, 5])
+    long_grid = curve.discount_factors(2, 40)
+    assert curve.discount_factors(2, 10).base is long_grid.base
+    with pytest.raises(ValueError):
+        YieldCurve(tenors=[5, 1], zero_rates=[3, 4])
+
+
+def test_ladder_projection_at_par_yields_coupon() -> None:
+    data = BondLadderProjectionInput(maturities=[1, 2, 3], amounts=[1000, 1000, 1000], coupon_rates=[4, 4, 4])
+    result = bond_ladder_projection(data)
+    assert result.month.tolist() == [6, 12, 18, 24, 30, 36]
+    assert result.coupon.tolist() == pytest.approx([60, 60, 40, 40, 20, 20])
+    assert result.principal.sum() == pytest.approx(3000)
+    assert result.annual_income.tolist() == pytest.approx([120, 80, 40])
+    assert result.ladder_yield == pytest.approx(4.0)
+    assert 1 < result.macaulay_duration < 2
+
+
+def test_ladder_flat_rate_gives_up_without_a_bracket() -> None:
+    # No rate can discount these flows to the cost, so both bracket expansions must stop at their caps.
+    for flows, cost in ((np.zeros(3), -1.0), (np.array([-1.0, -1.0]), 1.0)):
+        _, _, converged = bonds_core._flat_rate(flows, cost, 0.02)
+        assert not converged
+    rate, _, converged = bonds_core._flat_rate(np.array([40.0, 1040.0]), 1000.0, 0.02)
+    assert converged and rate == pytest.approx(0.04)
+
+
+def test_ladder_projection_rolls_matured_rungs() -> None:
+    data = BondLadderProjectionInput(
+        maturities=[1, 2, 3],
+        amounts=[1000, 1000, 1000],
+        coupon_rates=[3, 4, 5],
+        payments_per_year=1,
+        horizon_years=7,
+        reinvest=True,
+        reinvest_rate=6,
+    )
+    result = bond_ladder_projection(data)
+    assert result.annual_income.tolist() == pytest.approx([120, 150, 170, 180, 180, 180, 180])
+    assert result.reinvested.tolist() == pytest.approx([-1000] * 6 + [0])
+    assert result.net.tolist() == pytest.approx([120, 150, 170, 180, 180, 180, 1180])
@@ -1,6 +1,7 @@
 import json
 import datetime as dt
 
+import pytest
 from typer.testing import CliRunner
 
 from qfinancetools.cli.main import app
@@ -81,7 +82,7 @@ def test_cli_stocks_json() -> None:
     assert payload["ticker"] == "VOO"
 
 
-def test_cli_stocks_history_json(monkeypatch) -> None:
+def test_cli_stocks_history_json(monkeypatch, tmp_path) -> None:
     def fake_fetch(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
         _ = ticker, start, end
         return [
@@ -90,6 +91,7 @@ def test_cli_stocks_history_json(monkeypatch) -> None:
         ]
 
     monkeypatch.setattr(stocks_core, "_fetch_history_yahoo", fake_fetch)
+    monkeypatch.setattr(stocks_core, "_cache_dir", lambda: tmp_path)
     result = runner.invoke(
         app,
         [
@@ -109,3 +111,171 @@ def test_cli_stocks_history_json(monkeypatch) -> None:
     payload = json.loads(result.stdout)
     assert payload["source"] == "yahoo_chart"
     assert payload["series"][0]["name"] == "VOO"
+
+
+def test_cli_stocks_backtest_local_provider_monthly(tmp_path) -> None:
+    (tmp_path / "AAA.csv").write_text(
+        "date,close\n2024-01-02,100\n2024-01-15,101\n2024-02-01,105\n2024-02-20,104\n2024-03-01,110\n",
+        encoding="utf-8",
+    )
+    result = runner.invoke(
+        app,
+        [
+            "stocks",
+            "--mode",
+            "backtest",
+            "--ticker",
+            "AAA",
+            "--provider",
+            "csv",
+            "--data-dir",
+            str(tmp_path),
+            "--start-date",
+            "2024-01-01",
+            "--end-date",
+            "2024-03-10",
+            "--lump-sum",
+            "1000",
+            "--resolution",
+            "monthly",
+            "--json",
+        ],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["source"] == "csv_directory"
+    assert [point["date"] for point in payload["timeline"]] == ["2024-01-15", "2024-02-20", "2024-03-01"]
+    assert payload["final_value"] == pytest.approx(1100)
+
+
+def test_cli_loan_batch_streams_rows(tmp_path) -> None:
+    table = tmp_path / "loans.csv"
+    table.write_text("principal,annual_rate,years,extra_payment\n100000,6,30,0\n250000,5.4,30,150\n", encoding="utf-8")
+    result = runner.invoke(app, ["loan", "--batch", str(table), "--json"])
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [row["row"] for row in rows] == [0, 1]
+    assert rows[0]["monthly_payment"] == pytest.approx(599.55, rel=1e-3)
+
+
+def test_cli_loan_schedule_json_is_streamed_document() -> None:
+    result = runner.invoke(app, ["loan", "--amount", "10000", "--rate", "5", "--years", "2", "--schedule", "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert len(payload["schedule"]) == 24
+    assert payload["schedule"][-1]["balance"] == pytest.approx(0, abs=1e-8)
+    assert payload["summary"]["years"] == 2
+
+
+def test_cli_loan_schedule_csv_to_file(tmp_path) -> None:
+    target = tmp_path / "schedule.csv"
+    result = runner.invoke(
+        app,
+        ["loan", "--amount", "10000", "--rate", "5", "--years", "30", "--extra", "50", "--schedule-format", "csv", "--output", str(target)],
+    )
+    assert result.exit_code == 0
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "month,payment,principal,interest,balance"
+    assert lines[1].startswith("1,")
+
+
+def test_cli_loan_output_without_format_streams_schedule(tmp_path) -> None:
+    target = tmp_path / "schedule.ndjson"
+    result = runner.invoke(app, ["loan", "--amount", "10000", "--rate", "5", "--years", "2", "--output", str(target)])
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 24 and rows[0]["month"] == 1
+
+
+def test_cli_bonds_portfolio_file(tmp_path) -> None:
+    table = tmp_path / "bonds.csv"
+    table.write_text("face_value,coupon_rate,yield_rate,years,payments_per_year\n1000,5,5,10,2\n2000,4,4,5,\n", encoding="utf-8")
+    result = runner.invoke(app, ["bonds", "portfolio", "--file", str(table), "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert [row["price"] for row in payload["bonds"]] == pytest.approx([1000, 2000])
+    assert payload["portfolio"]["market_value"] == pytest.approx(3000)
+
+
+def test_cli_bonds_ytm_file_streams_rows(tmp_path) -> None:
+    quotes = tmp_path / "quotes.csv"
+    quotes.write_text("face_value,coupon_rate,price,years\n1000,5,1000,10\n1000,4,1000,5\n", encoding="utf-8")
+    result = runner.invoke(app, ["bonds", "ytm", "--file", str(quotes)])
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[0] == "row,yield_rate,iterations,converged,method,warnings"
+    rows = [line.split(",") for line in lines[1:]]
+    assert [float(row[1]) for row in rows] == pytest.approx([5, 4])
+    assert all(row[3] == "True" for row in rows)
+
+
+def test_cli_corporate_irr_file_streams_rows(tmp_path) -> None:
+    projects = tmp_path / "projects.csv"
+    projects.write_text("-1000,1100\n-1000,400,400,400\n-5,-5\n", encoding="utf-8")
+    result = runner.invoke(app, ["corporate", "irr", "--file", str(projects), "--json"])
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert rows[0]["irr"] == pytest.approx(10.0)
+    assert [row["converged"] for row in rows] == [True, True, False]
+    assert rows[2]["irr"] is None
+
+
+def test_cli_corporate_irr_roots_without_root_emits_valid_json() -> None:
+    result = runner.invoke(app, ["corporate", "irr", "--cash-flow", "100", "--cash-flow", "100", "--method", "roots", "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout, parse_constant=lambda name: pytest.fail(f"non-standard JSON constant {name}"))
+    assert payload["irr"] is None
+    assert payload["residual"] is None
+    assert payload["converged"] is False
+    plain = runner.invoke(app, ["corporate", "irr", "--cash-flow", "100", "--cash-flow", "100", "--method", "roots"])
+    assert plain.exit_code == 0
+    assert "n/a" in plain.stdout
+
+
+def test_cli_corporate_dcf_grid_json() -> None:
+    result = runner.invoke(
+        app,
+        ["corporate", "dcf-grid", "--cash-flow", "100", "--cash-flow", "110", "--rate", "9", "--rate", "10", "--growth", "0.02", "--json"],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert len(payload["total_value"]) == 2
+    assert len(payload["total_value"][0]) == 1
+
+
+def test_cli_corporate_comps_table(tmp_path) -> None:
+    peers = tmp_path / "peers.csv"
+    peers.write_text(
+        "name,sector,market_cap,ev_ebitda\nA,Tech,500,8\nB,Tech,900,10\nC,Energy,700,4\nD,Tech,800,12\nE,Tech,600,\n",
+        encoding="utf-8",
+    )
+    result = runner.invoke(
+        app,
+        ["corporate", "comps-table", "--file", str(peers), "--column", "ev_ebitda", "--sector", "Tech", "--subject", "ev_ebitda=100", "--json"],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    stats = payload["metrics"][0]
+    assert payload["peers"] == 4
+    assert stats["count"] == 3
+    assert stats["median"] == pytest.approx(10)
+    assert stats["implied_median"] == pytest.approx(1000)
+
+
+def test_cli_risk_montecarlo_rejects_compat_workers() -> None:
+    result = runner.invoke(
+        app,
+        ["risk", "montecarlo", "--initial", "1000", "--mean", "7", "--volatility", "15", "--years", "5", "--sims", "100"]
+        + ["--engine", "compat", "--workers", "2", "--json"],
+    )
+    assert result.exit_code == 2
+    assert "single worker" in result.output
+
+
+def test_cli_loan_batch_bad_row_is_parameter_error(tmp_path) -> None:
+    table = tmp_path / "loans.csv"
+    table.write_text("principal,annual_rate,years\n100000,6,30\n-5,5,30\n", encoding="utf-8")
+    result = runner.invoke(app, ["loan", "--batch", str(table), "--json"])
+    assert result.exit_code == 2
+    assert "principal must be positive" in result.output
+    assert "Traceback" not in result.output
@@ -1,13 +1,18 @@
+import numpy as np
 import pytest
 
-from qfinancetools.core.corporate import wacc, capm, npv, irr, dcf, comps
+import qfinancetools.core.corporate as corporate_core
+from qfinancetools.core.corporate import wacc, capm, npv, npv_batch, irr, irr_batch, dcf, dcf_grid, comps, comps_table
 from qfinancetools.models.corporate import (
     WaccInput,
     CapmInput,
     NpvInput,
     IrrInput,
+    IrrResult,
     DcfInput,
+    DcfGridInput,
     CompsInput,
+    CompsTableInput,
 )
 
 
@@ -53,3 +58,119 @@ def test_comps() -> None:
     assert result.low == 50
     assert result.high == 90
     assert result.median == 70
+
+
+def test_npv_batch_matches_scalar_on_ragged_rows() -> None:
+    flows = [[-1000, 400, 400, 400], [-500, 600], [250]]
+    values = npv_batch(flows, [10, 5, 0])
+    expected = [npv(NpvInput(discount_rate=rate, cash_flows=row)).npv for rate, row in zip([10, 5, 0], flows)]
+    assert values == pytest.approx(expected)
+
+
+def test_irr_batch_matches_scalar_and_masks_rows_without_root() -> None:
+    flows = np.array([[-1000, 1100, np.nan], [-1000, 400, 700], [-100, -100, np.nan], [-1000, 300, 300]])
+    result = irr_batch(flows)
+    assert result.converged.tolist() == [True, True, False, True]
+    assert result.irr[0] == pytest.approx(10.0)
+    assert result.irr[1] == pytest.approx(irr(IrrInput(cash_flows=[-1000, 400, 700])).irr)
+    assert result.irr[3] == pytest.approx(irr(IrrInput(cash_flows=[-1000, 300, 300])).irr)
+    assert np.isnan(result.irr[2])
+
+
+def test_cash_flow_batches_reject_interior_gaps_and_infinities() -> None:
+    for flows in ([[-1000, np.nan, 700]], [[-1000, 400], [-1000, np.inf, np.nan]], np.array([[-1000, 1100], [np.nan, 500]])):
+        with pytest.raises(ValueError, match="row"):
+            npv_batch(flows, 10)
+
+
+def test_irr_roots_finds_every_rate() -> None:
+    result = irr(IrrInput(cash_flows=[-100, 230, -132], method="roots"))
+    assert result.roots == pytest.approx([10.0, 20.0])
+    assert result.irr == pytest.approx(10.0)
+    assert result.converged
+    assert [item.code for item in result.warnings] == ["corporate.multiple_irr"]
+
+
+def test_irr_roots_matches_newton_on_long_series() -> None:
+    flows = [-5000.0] + [45.0 + idx % 7 for idx in range(240)]
+    newton = irr(IrrInput(cash_flows=flows))
+    roots = irr(IrrInput(cash_flows=flows, method="roots"))
+    assert roots.roots == pytest.approx([newton.irr], rel=1e-9)
+    assert roots.residual < 1e-12
+
+
+def test_irr_roots_scan_matches_eigen_solve_on_long_two_irr_series(monkeypatch: pytest.MonkeyPatch) -> None:
+    flows = [-18_000.0] + [100.0] * 359 + [-16_200.0]
+    scanned = irr(IrrInput(cash_flows=flows, method="roots"))
+    assert corporate_core._scan_positive_roots(np.asarray(flows), 2) is not None
+    monkeypatch.setattr(corporate_core, "_scan_positive_roots", lambda cash_flows, sign_changes: None)
+    eigen = irr(IrrInput(cash_flows=flows, method="roots"))
+    assert len(scanned.roots) == 2
+    assert scanned.roots == pytest.approx(eigen.roots, rel=1e-9)
+    assert scanned.converged and scanned.residual < 1e-12
+
+
+def test_irr_reports_missing_root() -> None:
+    for method in ("newton", "roots"):
+        result = irr(IrrInput(cash_flows=[-100, -100], method=method))
+        assert not result.converged
+        assert result.roots == []
+        assert result.warnings[-1].code == "corporate.irr_not_converged"
+    roots = irr(IrrInput(cash_flows=[-100, -100], method="roots"))
+    assert roots.irr is None
+    assert roots.residual is None
+    newton = irr(IrrInput(cash_flows=[-100, -100]))
+    assert isinstance(newton.irr, float) and isinstance(newton.residual, float)
+    assert IrrResult(irr=10.0).converged
+    with pytest.raises(ValueError, match="only be None"):
+        IrrResult(irr=None)
+
+
+def test_dcf_grid_matches_dcf_cells() -> None:
+    flows = [100, 110, 121]
+    result = dcf_grid(DcfGridInput(cash_flows=flows, discount_rates=[2, 9, 10], terminal_growths=[0.01, 0.02, 0.03]))
+    for row, rate in enumerate([9, 10], start=1):
+        for col, growth in enumerate([0.01, 0.02, 0.03]):
+            expected = dcf(DcfInput(discount_rate=rate, cash_flows=flows, terminal_growth=growth))
+            assert result.total_value[row][col] == pytest.approx(expected.total_value)
+            assert result.present_value[row] == pytest.approx(expected.present_value)
+    assert result.total_value[0][1:] == [None, None]
+    assert result.warnings[0].code == "corporate.dcf_grid_invalid_cells"
+
+
+def test_comps_even_count_median() -> None:
+    result = comps(CompsInput(metric=10, multiples=[9, 5, 7, 11]))
+    assert result.median == 80
+
+
+def test_comps_table_matches_numpy_statistics() -> None:
+    rng = np.random.default_rng(3)
+    ev = rng.lognormal(2, 0.5, 501)
+    pe = rng.lognormal(3, 0.4, 501)
+    sector = ["Tech" if idx % 3 else "Energy" for idx in range(501)]
+    size = rng.lognormal(8, 1, 501)
+    pe_column: list[float | None] = pe.tolist()
+    pe_column[0] = None
+    data = CompsTableInput(
+        multiples={"ev_ebitda": ev.tolist(), "pe": pe_column},
+        sector=sector,
+        size=size.tolist(),
+        sectors=["Tech"],
+        min_size=1000,
+        quantiles=[0.1, 0.5, 0.9],
+        trim=0.1,
+        subject={"ev_ebitda": 50},
+    )
+    result = comps_table(data)
+    keep = np.array([value == "Tech" for value in sector]) & (size >= 1000)
+    assert result.peers == int(keep.sum())
+    for stats, column in zip(result.metrics, [ev, np.array(pe_column, dtype=float)]):
+        values = np.sort(column[keep][~np.isnan(column[keep])])
+        cut = int(np.floor(0.1 * values.size))
+        assert stats.count == values.size
+        assert stats.median == pytest.approx(np.median(values))
+        assert [stats.quantiles[key] for key in ("p10", "p50", "p90")] == pytest.approx(np.quantile(values, [0.1, 0.5, 0.9]))
+        assert stats.trimmed_mean == pytest.approx(values[cut : values.size - cut].mean())
+        assert stats.low == values[0] and stats.high == values[-1]
+        assert stats.robust_low >= stats.low and stats.robust_high <= stats.high
+    assert result.metrics[0].implied_median == pytest.approx(50 * result.metrics[0].median)
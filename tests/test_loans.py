@@ -1,7 +1,14 @@
 import pytest
+from hypothesis import given, settings, strategies as st
 
-from qfinancetools.core.loans import compute_monthly_payment, loan_summary
-from qfinancetools.models.loans import LoanInput
+from qfinancetools.core.loans import (
+    amortization_schedule,
+    compute_monthly_payment,
+    iter_amortization_rows,
+    loan_summary,
+    loan_summary_batch,
+)
+from qfinancetools.models.loans import AmortizationRow, LoanInput
 
 
 def test_monthly_payment_zero_rate() -> None:
@@ -21,3 +28,110 @@ def test_loan_summary_totals() -> None:
     result = loan_summary(data)
     assert result.total_paid >= data.principal
     assert result.total_interest >= 0
+
+
+def _legacy_schedule(loan: LoanInput) -> list[tuple[int, float, float, float, float]]:
+    monthly_rate = loan.annual_rate / 100 / 12
+    payment = compute_monthly_payment(loan) + loan.extra_payment
+    balance = loan.principal
+    rows = []
+    while balance > 1e-8:
+        interest = balance * monthly_rate
+        principal_paid = min(payment - interest, balance)
+        balance -= principal_paid
+        rows.append((len(rows) + 1, principal_paid + interest, principal_paid, interest, balance))
+    return rows
+
+
+@pytest.mark.parametrize(
+    "principal,rate,years,extra",
+    [(250000, 5.4, 30, 0), (12000, 0, 1, 0), (100000, 6, 15, 250), (5000, 0, 2, 100)],
+)
+def test_amortization_schedule_matches_row_loop(principal, rate, years, extra) -> None:
+    loan = LoanInput(principal=principal, annual_rate=rate, years=years, extra_payment=extra)
+    schedule = amortization_schedule(loan)
+    expected = _legacy_schedule(loan)
+    assert len(schedule) == len(expected)
+    for row, (month, payment, principal_paid, interest, balance) in zip(schedule, expected):
+        assert isinstance(row, AmortizationRow)
+        assert row.month == month
+        assert row.payment == pytest.approx(payment)
+        assert row.principal == pytest.approx(principal_paid)
+        assert row.interest == pytest.approx(interest)
+        assert row.balance == pytest.approx(balance, abs=1e-6)
+    assert schedule.balance[-1] == pytest.approx(0, abs=1e-8)
+    assert schedule.total_paid == pytest.approx(sum(item[1] for item in expected))
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    principal=st.floats(min_value=1000, max_value=2_000_000),
+    rate=st.one_of(st.just(0.0), st.floats(min_value=0.01, max_value=18)),
+    years=st.integers(min_value=1, max_value=40),
+    extra=st.one_of(st.just(0.0), st.floats(min_value=1, max_value=5000)),
+)
+def test_loan_summary_analytic_matches_schedule(principal, rate, years, extra) -> None:
+    loan = LoanInput(principal=principal, annual_rate=rate, years=years, extra_payment=extra)
+    schedule = amortization_schedule(loan)
+    result = loan_summary(loan)
+    assert result.years == len(schedule) / 12
+    assert result.total_paid == pytest.approx(schedule.total_paid, rel=1e-9)
+    assert result.total_interest == pytest.approx(schedule.total_interest, rel=1e-7, abs=principal * 1e-9)
+
+
+@settings(deadline=None)
+@given(
+    principal=st.floats(min_value=1000, max_value=500_000),
+    rate=st.floats(min_value=0.5, max_value=12),
+    years=st.integers(min_value=1, max_value=30),
+    extra=st.floats(min_value=1, max_value=2000),
+)
+def test_loan_summary_extra_payment_never_costs_more(principal, rate, years, extra) -> None:
+    base = loan_summary(LoanInput(principal=principal, annual_rate=rate, years=years))
+    faster = loan_summary(LoanInput(principal=principal, annual_rate=rate, years=years, extra_payment=extra))
+    assert faster.years <= base.years
+    assert faster.total_interest <= base.total_interest * (1 + 1e-9) + 1e-6
+
+
+def test_loan_summary_batch_matches_single_loans() -> None:
+    principal = [100000, 250000, 5000, 12000, 80000]
+    rate = [6, 5.4, 0, 25, 4]
+    years = [30, 30, 2, 1, 45]
+    extra = [0, 150, 100, 0, 9000]
+    result = loan_summary_batch(principal, rate, years, extra)
+    assert len(result) == 5
+    for idx in range(5):
+        single = loan_summary(
+            LoanInput(principal=principal[idx], annual_rate=rate[idx], years=years[idx], extra_payment=extra[idx])
+        )
+        assert result.monthly_payment[idx] == pytest.approx(single.monthly_payment)
+        assert result.total_paid[idx] == pytest.approx(single.total_paid)
+        assert result.total_interest[idx] == pytest.approx(single.total_interest, abs=1e-6)
+        assert result.years[idx] == single.years
+        assert [item.code for item in result.warnings.get(idx, [])] == [item.code for item in single.warnings]
+    assert sorted(result.warnings) == [3, 4]
+
+
+def test_loan_summary_batch_rejects_bad_rows() -> None:
+    with pytest.raises(ValueError, match="row 1"):
+        loan_summary_batch([1000, -5], [5, 5], [10, 10])
+
+
+def test_amortization_schedule_slices_to_rows() -> None:
+    schedule = amortization_schedule(LoanInput(principal=12000, annual_rate=6, years=2))
+    first_year = schedule[:12]
+    assert all(isinstance(row, AmortizationRow) for row in first_year)
+    assert [row.month for row in first_year] == list(range(1, 13))
+    assert schedule[-2:] == schedule.rows()[-2:]
+    assert schedule[::12][1] == schedule[12]
+    assert schedule[40:] == []
+
+
+@pytest.mark.parametrize("extra", [0, 75])
+def test_iter_amortization_rows_matches_schedule(extra) -> None:
+    loan = LoanInput(principal=180000, annual_rate=4.5, years=25, extra_payment=extra)
+    schedule = amortization_schedule(loan)
+    rows = list(iter_amortization_rows(loan, chunk_months=37))
+    assert len(rows) == len(schedule)
+    assert [row[0] for row in rows] == schedule.month.tolist()
+    assert [row[4] for row in rows] == pytest.approx(schedule.balance.tolist(), abs=1e-9)
@@ -1,7 +1,11 @@
+import random
+
 import pytest
 
-from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, stress_test
-from qfinancetools.models.risk import ScenarioInput, SensitivityInput, MonteCarloInput, StressTestInput
+from qfinancetools.core.corporate import dcf
+from qfinancetools.core.risk import scenario, sensitivity, monte_carlo, monte_carlo_dcf, stress_test, load_monte_carlo_paths
+from qfinancetools.models.corporate import DcfInput
+from qfinancetools.models.risk import ScenarioInput, SensitivityInput, MonteCarloInput, MonteCarloDcfInput, StressTestInput
 
 
 def test_scenario() -> None:
@@ -35,3 +39,161 @@ def test_stress_test() -> None:
     data = StressTestInput(base_value=1000, drawdown=0.2)
     result = stress_test(data)
     assert result.stressed_value == 800
+
+
+def _legacy_monte_carlo(data: MonteCarloInput) -> list[float]:
+    rng = random.Random(data.seed)
+    values = []
+    for _ in range(data.simulations):
+        value = data.initial_value
+        for _ in range(data.years):
+            value *= 1 + rng.gauss(data.mean_return, data.volatility) / 100
+        values.append(value)
+    return sorted(values)
+
+
+def test_monte_carlo_compat_matches_legacy_loop() -> None:
+    data = MonteCarloInput(
+        initial_value=10000,
+        mean_return=7,
+        volatility=15,
+        years=12,
+        simulations=250,
+        seed=7,
+        engine="compat",
+    )
+    expected = _legacy_monte_carlo(data)
+    result = monte_carlo(data)
+    assert result.values == expected
+    assert result.mean == sum(expected) / len(expected)
+    assert result.median == (expected[124] + expected[125]) / 2
+    assert result.p5 == expected[int(0.05 * 249)]
+    assert result.p95 == expected[int(0.95 * 249)]
+
+
+def test_monte_carlo_vectorized_is_seeded() -> None:
+    data = MonteCarloInput(initial_value=10000, mean_return=7, volatility=15, years=20, simulations=501, seed=3)
+    first = monte_carlo(data)
+    second = monte_carlo(data)
+    assert first.values == second.values
+    ordered = first.values
+    assert ordered == sorted(ordered)
+    assert first.median == ordered[250]
+    assert first.p5 == ordered[int(0.05 * 500)]
+    assert first.p95 == ordered[int(0.95 * 500)]
+    assert first.mean == pytest.approx(sum(ordered) / len(ordered))
+
+
+def test_monte_carlo_shards_identical_across_workers() -> None:
+    base = dict(initial_value=10000, mean_return=7, volatility=15, years=10, simulations=2500, seed=11, chunk_size=600)
+    serial = monte_carlo(MonteCarloInput(**base, workers=1))
+    parallel = monte_carlo(MonteCarloInput(**base, workers=3))
+    assert parallel.values == serial.values
+    assert (parallel.mean, parallel.median, parallel.p5, parallel.p95) == (serial.mean, serial.median, serial.p5, serial.p95)
+
+
+def test_monte_carlo_compat_rejects_workers() -> None:
+    data = MonteCarloInput(initial_value=100, mean_return=5, volatility=10, years=2, simulations=10, engine="compat", workers=2)
+    with pytest.raises(ValueError):
+        monte_carlo(data)
+
+
+def test_monte_carlo_summary_tracks_exact_statistics() -> None:
+    base = dict(initial_value=10000, mean_return=7, volatility=15, years=15, simulations=4000, seed=5, chunk_size=1000)
+    exact = monte_carlo(MonteCarloInput(**base))
+    summary = monte_carlo(MonteCarloInput(**base, output="summary"))
+    assert summary.values == []
+    assert summary.mean == pytest.approx(exact.mean, rel=1e-12)
+    assert summary.median == pytest.approx(exact.median, rel=2e-3)
+    assert summary.p5 == pytest.approx(exact.p5, rel=2e-3)
+    assert summary.p95 == pytest.approx(exact.p95, rel=2e-3)
+    assert sum(summary.histogram.counts) == 4000
+    assert len(summary.histogram.edges) == len(summary.histogram.counts) + 1
+    assert summary.histogram.edges[0] == pytest.approx(min(exact.values))
+    assert summary.histogram.edges[-1] == pytest.approx(max(exact.values))
+
+
+def test_monte_carlo_summary_constant_paths() -> None:
+    data = MonteCarloInput(initial_value=100, mean_return=5, volatility=0, years=2, simulations=3, output="summary")
+    result = monte_carlo(data)
+    assert result.mean == pytest.approx(110.25)
+    assert result.median == pytest.approx(110.25, rel=1e-3)
+    assert sum(result.histogram.counts) == 3
+
+
+def test_monte_carlo_records_memory_mapped_paths(tmp_path) -> None:
+    paths_file = tmp_path / "paths.npy"
+    data = MonteCarloInput(
+        initial_value=1000,
+        mean_return=6,
+        volatility=12,
+        years=8,
+        simulations=1500,
+        seed=9,
+        chunk_size=400,
+        paths_file=str(paths_file),
+    )
+    result = monte_carlo(data)
+    assert result.paths is not None
+    matrix = load_monte_carlo_paths(result.paths)
+    assert matrix.shape == (1500, 8)
+    assert sorted(matrix[:, -1].tolist()) == result.values
+    assert result.paths.median[-1] == pytest.approx(result.median, rel=2e-3)
+    assert all(low <= mid <= high for low, mid, high in zip(result.paths.p5, result.paths.median, result.paths.p95))
+    assert monte_carlo(data.model_copy(update={"paths_file": None})).values == result.values
+
+
+def test_monte_carlo_dcf_without_shocks_matches_dcf() -> None:
+    flows = [100.0, 110.0, 121.0]
+    data = MonteCarloDcfInput(
+        cash_flows=flows,
+        discount_rate=9,
+        terminal_growth=0.02,
+        growth_volatility=0,
+        margin_volatility=0,
+        rate_volatility=0,
+        simulations=20,
+    )
+    result = monte_carlo_dcf(data)
+    expected = dcf(DcfInput(discount_rate=9, cash_flows=flows, terminal_growth=0.02)).total_value
+    assert result.valid_simulations == 20
+    assert result.median == pytest.approx(expected)
+    assert result.p5 == pytest.approx(expected)
+    assert [item.code for item in result.warnings] == ["risk.low_sims"]
+
+
+def test_monte_carlo_dcf_flags_extreme_shocks_with_dcf_codes() -> None:
+    data = MonteCarloDcfInput(
+        cash_flows=[100.0, 110.0], discount_rate=9, growth_volatility=0.6, rate_volatility=6, simulations=1_000
+    )
+    codes = [item.code for item in monte_carlo_dcf(data).warnings]
+    assert codes[:2] == ["risk.dcf_high_growth_vol", "risk.dcf_high_rate_vol"]
+    assert "risk.extreme_vol" not in codes
+
+
+def test_monte_carlo_dcf_summary_is_shard_independent() -> None:
+    common = dict(
+        cash_flows=[100.0, 110.0, 121.0, 130.0],
+        discount_rate=9,
+        terminal_growth=0.02,
+        correlation=[[1, 0.5, -0.3], [0.5, 1, 0], [-0.3, 0, 1]],
+        simulations=20_000,
+        seed=7,
+        chunk_size=5_000,
+    )
+    exact = monte_carlo_dcf(MonteCarloDcfInput(**common))
+    streamed = monte_carlo_dcf(MonteCarloDcfInput(**common, output="summary", workers=2))
+    assert streamed.values == []
+    assert streamed.mean == pytest.approx(exact.mean, rel=1e-12)
+    assert streamed.median == pytest.approx(exact.median, rel=2e-3)
+    assert streamed.p5 == pytest.approx(exact.p5, rel=2e-3)
+    assert exact.p5 < exact.median < exact.p95
+
+
+def test_monte_carlo_dcf_rejects_invalid_correlation() -> None:
+    with pytest.raises(ValueError):
+        monte_carlo_dcf(
+            MonteCarloDcfInput(
+                cash_flows=[100.0], discount_rate=9, correlation=[[1, 1, -1], [1, 1, 1], [-1, 1, 1]], simulations=10
+            )
+        )
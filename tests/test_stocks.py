@@ -1,16 +1,39 @@
 import datetime as dt
+import gzip
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import numpy as np
 import pytest
 
 import qfinancetools.core.stocks as stocks_core
-from qfinancetools.core.stocks import stock_backtest, stock_history, stock_projection
+import qfinancetools.core.plugins as plugins_core
+from qfinancetools.core.stocks import (
+    CsvDirectoryProvider,
+    InMemoryProvider,
+    MarketDataProvider,
+    register_market_data_provider,
+    resolve_market_data_provider,
+    stock_backtest,
+    stock_history,
+    stock_projection,
+)
 from qfinancetools.models.stocks import (
+    PriceSeries,
     StockBacktestInput,
     StockHistoryInput,
     StockProjectionInput,
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(stocks_core, "_cache_dir", lambda: tmp_path)
+
+
 def test_stock_projection_basic() -> None:
     result = stock_projection(
         StockProjectionInput(
@@ -88,13 +111,15 @@ def test_stock_history_uses_cache_on_fetch_error(monkeypatch: pytest.MonkeyPatch
 
     def fake_cached(
         ticker: str, start: dt.date, end: dt.date
-    ) -> tuple[list[tuple[dt.date, float]] | None, dt.date | None]:
+    ) -> tuple[PriceSeries | None, dt.date | None]:
         _ = ticker, start, end
         return (
-            [
-                (dt.date(2024, 1, 2), 100.0),
-                (dt.date(2024, 2, 2), 110.0),
-            ],
+            PriceSeries.from_points(
+                [
+                    (dt.date(2024, 1, 2), 100.0),
+                    (dt.date(2024, 2, 2), 110.0),
+                ]
+            ),
             dt.date(2024, 2, 3),
         )
 
@@ -111,3 +136,406 @@ def test_stock_history_uses_cache_on_fetch_error(monkeypatch: pytest.MonkeyPatch
     )
     assert len(result.series) == 2
     assert any(item.code == "stocks.cache_fallback" for item in result.warnings)
+
+
+def test_price_store_serves_sub_windows_and_fetches_only_gaps(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[dt.date, dt.date]] = []
+
+    def fake_fetch(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        calls.append((start, end))
+        day = start
+        points = []
+        while day <= end:
+            if day.weekday() < 5:
+                points.append((day, float(day.toordinal() % 1000)))
+            day += dt.timedelta(days=1)
+        return points
+
+    monkeypatch.setattr(stocks_core, "_fetch_history_yahoo", fake_fetch)
+    request = StockHistoryInput(tickers=["AAA"], start_date="2023-01-01", end_date="2023-06-30")
+    first = stock_history(request)
+    assert calls == [(dt.date(2023, 1, 1), dt.date(2023, 6, 30))]
+
+    sub = stock_history(StockHistoryInput(tickers=["AAA"], start_date="2023-02-01", end_date="2023-03-31"))
+    assert len(calls) == 1
+    assert sub.series[0].points[0].date == "2023-02-01"
+    assert sub.series[0].points[-1].date == "2023-03-31"
+
+    stock_history(StockHistoryInput(tickers=["AAA"], start_date="2023-03-01", end_date="2023-09-30"))
+    assert calls[1:] == [(dt.date(2023, 6, 30), dt.date(2023, 9, 30))]
+    again = stock_history(request)
+    assert len(calls) == 2
+    assert again.series[0].points == first.series[0].points
+
+
+def test_price_store_widens_short_gaps_and_never_covers_today(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[dt.date, dt.date]] = []
+
+    def fake_fetch(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        calls.append((start, end))
+        return [(start, 10.0), (end, 11.0)]
+
+    monkeypatch.setattr(stocks_core, "_fetch_history_yahoo", fake_fetch)
+    stocks_core._save_cached_history("AAA", dt.date(2024, 1, 1), dt.date(2024, 1, 26), [(dt.date(2024, 1, 2), 9.0)])
+    assert stocks_core._missing_ranges("AAA", dt.date(2024, 1, 1), dt.date(2024, 1, 28)) == [
+        (dt.date(2024, 1, 21), dt.date(2024, 1, 28))
+    ]
+
+    today = dt.date.today()
+    stocks_core._save_cached_history("BBB", today - dt.timedelta(days=30), today, [(today, 5.0)])
+    assert stocks_core._missing_ranges("BBB", today - dt.timedelta(days=30), today) == [
+        (today - dt.timedelta(days=7), today)
+    ]
+    series, _ = stocks_core._load_cached_history("BBB", today, today)
+    assert series.points() == [(today, 5.0)]
+
+
+def test_price_store_drops_history_on_a_new_adjustment_basis_and_expires_old_ranges(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[dt.date, dt.date]] = []
+    basis = {"factor": 1.0}
+
+    def fake_fetch(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        calls.append((start, end))
+        days = [start + dt.timedelta(days=offset) for offset in range((end - start).days + 1)]
+        return [(day, day.toordinal() % 1000 * basis["factor"]) for day in days if day.weekday() < 5]
+
+    monkeypatch.setattr(stocks_core, "_fetch_history_yahoo", fake_fetch)
+    stock_history(StockHistoryInput(tickers=["AAA"], start_date="2023-01-01", end_date="2023-06-30"))
+    basis["factor"] = 0.5
+    result = stock_history(StockHistoryInput(tickers=["AAA"], start_date="2023-03-01", end_date="2023-09-30"))
+    assert calls[1:] == [(dt.date(2023, 6, 30), dt.date(2023, 9, 30)), (dt.date(2023, 3, 1), dt.date(2023, 9, 30))]
+    assert result.series[0].points[0].price == pytest.approx(dt.date(2023, 3, 1).toordinal() % 1000 * 0.5)
+
+    series, _ = stocks_core._load_cached_history("AAA", dt.date(2023, 1, 1), dt.date(2023, 9, 30))
+    assert series.first_date == dt.date(2023, 3, 1)
+    assert stocks_core._missing_ranges("AAA", dt.date(2023, 3, 1), dt.date(2023, 9, 30)) == []
+    with stocks_core._connect_store() as connection:
+        connection.execute("UPDATE coverage SET fetched_at = fetched_at - ?", (stocks_core._STORE_MAX_AGE_DAYS + 1,))
+    connection.close()
+    assert stocks_core._missing_ranges("AAA", dt.date(2023, 3, 1), dt.date(2023, 9, 30)) == [
+        (dt.date(2023, 3, 1), dt.date(2023, 9, 30))
+    ]
+
+
+@pytest.fixture
+def chart_server(monkeypatch: pytest.MonkeyPatch):
+    state = {"in_flight": 0, "peak": 0, "requests": 0, "clients": set(), "windows": [], "paths": [], "basis": 0.0}
+    lock = threading.Lock()
+
+    class ChartHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            parsed = urllib.parse.urlparse(self.path)
+            ticker = parsed.path.rsplit("/", 1)[-1]
+            query = urllib.parse.parse_qs(parsed.query)
+            with lock:
+                state["requests"] += 1
+                state["paths"].append(self.path)
+                state["clients"].add(self.client_address)
+                state["windows"].append((ticker, int(query["period1"][0]), int(query["period2"][0])))
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.1)
+            with lock:
+                state["in_flight"] -= 1
+            if ticker == "BAD":
+                self.send_error(404, "Not Found")
+                return
+            if ticker in {"OLD", "LOOP"}:
+                self.send_response(301)
+                self.send_header("Location", self.path.replace("/OLD?", "/AAA?"))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            timestamps = list(range(int(query["period1"][0]) + 12 * 3600, int(query["period2"][0]), 86400))
+            closes = [100.0 + ts // 86400 + state["basis"] for ts in timestamps]
+            body = json.dumps(
+                {"chart": {"result": [{"timestamp": timestamps, "indicators": {"adjclose": [{"adjclose": closes}]}}]}}
+            ).encode("utf-8")
+            gzipped = "gzip" in (self.headers.get("Accept-Encoding") or "")
+            if gzipped:
+                body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            _ = format, args
+
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChartHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(stocks_core, "_YAHOO_CHART_URL", f"http://127.0.0.1:{server.server_address[1]}/v8/finance/chart")
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_load_histories_fetches_tickers_concurrently(chart_server) -> None:
+    tickers = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]
+    histories, _, warnings = stocks_core._load_histories(tickers, dt.date(2024, 1, 1), dt.date(2024, 1, 31))
+    assert list(histories) == tickers
+    assert all(len(history) == 31 for history in histories.values())
+    assert chart_server["requests"] == len(tickers)
+    assert chart_server["peak"] > 1
+    assert not any(item.code == "stocks.cache_fallback" for item in warnings)
+
+
+def test_load_histories_falls_back_per_ticker(chart_server) -> None:
+    start, end = dt.date(2024, 1, 1), dt.date(2024, 1, 31)
+    stocks_core._save_cached_history("BAD", start, dt.date(2024, 1, 15), [(dt.date(2024, 1, 2), 50.0)])
+    histories, _, warnings = stocks_core._load_histories(["AAA", "BAD"], start, end)
+    assert histories["BAD"].points() == [(dt.date(2024, 1, 2), 50.0)]
+    fallback = [item for item in warnings if item.code == "stocks.cache_fallback"]
+    assert len(fallback) == 1 and "BAD" in fallback[0].message and "404" in fallback[0].message
+
+    with pytest.raises(ValueError, match="HTTP Error 404"):
+        stocks_core._load_histories(["CCC", "BAD"], dt.date(2023, 1, 1), dt.date(2023, 1, 31))
+
+
+def test_csv_directory_provider_reads_local_bars(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_network(ticker: str, start: dt.date, end: dt.date) -> list[tuple[dt.date, float]]:
+        raise AssertionError("csv provider must not fetch over HTTP")
+
+    monkeypatch.setattr(stocks_core, "_fetch_history_yahoo", no_network)
+    prices = tmp_path / "prices"
+    prices.mkdir()
+    (prices / "AAA.csv").write_text(
+        "Date,Open,Close,Adj Close\n2024-03-01,1,101,100\n2024-01-02,1,91,90\n2024-02-01,1,,null\n2024-02-02,1,96,95\n",
+        encoding="utf-8",
+    )
+    (prices / "bbb.csv").write_text("date,close\n2024-01-02,10\n2024-02-02,11\n2024-03-01,12\n", encoding="utf-8")
+
+    provider = CsvDirectoryProvider(prices)
+    assert provider.fetch("AAA", dt.date(2024, 1, 1), dt.date(2024, 2, 28)) == [
+        (dt.date(2024, 1, 2), 90.0),
+        (dt.date(2024, 2, 2), 95.0),
+    ]
+    result = stock_backtest(
+        StockBacktestInput(
+            tickers=["AAA", "BBB"],
+            start_date="2024-01-01",
+            end_date="2024-03-10",
+            lump_sum=1000,
+            provider="csv",
+            data_dir=str(prices),
+        )
+    )
+    assert result.source == "csv_directory"
+    assert result.final_value == pytest.approx(500 * 100 / 90 + 500 * 12 / 10)
+    assert not (tmp_path / "prices.sqlite3").exists()
+
+    with pytest.raises(ValueError, match="No price file for CCC"):
+        provider.fetch("CCC", dt.date(2024, 1, 1), dt.date(2024, 2, 28))
+    with pytest.raises(ValueError, match="requires data_dir"):
+        resolve_market_data_provider("csv")
+
+
+def test_in_memory_and_plugin_providers_are_selectable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(stocks_core, "_REGISTERED_PROVIDERS", {})
+    histories = {"aaa": [(dt.date(2024, 2, 1), 110.0), (dt.date(2024, 1, 2), 100.0)]}
+    register_market_data_provider("Fixture", InMemoryProvider(histories))
+    result = stock_history(
+        StockHistoryInput(tickers=["AAA"], start_date="2024-01-01", end_date="2024-02-10", provider="fixture")
+    )
+    assert result.source == "memory"
+    assert [point.price for point in result.series[0].points] == [100.0, 110.0]
+
+    class BarsProvider(InMemoryProvider):
+        def __init__(self) -> None:
+            super().__init__({"BBB": [(dt.date(2024, 1, 2), 5.0)]})
+
+    class BarsPlugin:
+        market_data_providers = {"Bars": BarsProvider, "Broken": object()}
+
+    class FakeEntryPoint:
+        name = "bars"
+
+        def load(self) -> type:
+            return BarsPlugin
+
+    scans: list[str] = []
+
+    def entry_points(group: str) -> list[FakeEntryPoint]:
+        scans.append(group)
+        return [FakeEntryPoint()]
+
+    monkeypatch.setattr(plugins_core.importlib.metadata, "entry_points", entry_points)
+    stocks_core._plugin_providers.cache_clear()
+    provider = resolve_market_data_provider("BARS")
+    assert isinstance(provider, MarketDataProvider)
+    assert provider.fetch("BBB", dt.date(2024, 1, 1), dt.date(2024, 1, 31)) == [(dt.date(2024, 1, 2), 5.0)]
+    with pytest.raises(ValueError, match="Unknown market data provider"):
+        resolve_market_data_provider("nope")
+    with pytest.raises(ValueError, match="must define name, cached and fetch"):
+        resolve_market_data_provider("broken")
+    assert scans == ["qfinance.plugins"]
+    stocks_core._plugin_providers.cache_clear()
+
+
+def test_chart_requests_reuse_pooled_connections_and_refresh_only_new_days(chart_server, monkeypatch) -> None:
+    monkeypatch.setattr(stocks_core, "_HTTP_SESSION", stocks_core._HttpSession(max_idle=2))
+    today = dt.date.today()
+    start = today - dt.timedelta(days=60)
+    for ticker in ["AAA", "BBB", "CCC"]:
+        stocks_core._load_histories([ticker], start, today - dt.timedelta(days=10))
+    assert chart_server["requests"] == 3
+    assert len(chart_server["clients"]) == 1
+
+    histories, _, _ = stocks_core._load_histories(["AAA"], start, today)
+    assert histories["AAA"].last_date == today
+    ticker, period1, _ = chart_server["windows"][-1]
+    assert ticker == "AAA"
+    assert dt.date.fromtimestamp(period1) == today - dt.timedelta(days=10)
+
+
+def test_chart_refresh_revalidates_the_anchor_bar_and_reloads_a_rebased_ticker(chart_server) -> None:
+    today = dt.date.today()
+    start = today - dt.timedelta(days=60)
+    stocks_core._load_histories(["AAA"], start, today - dt.timedelta(days=10))
+    chart_server["basis"] = 7.0
+    histories, _, _ = stocks_core._load_histories(["AAA"], start, today)
+    anchor_window, full_window = chart_server["windows"][-2:]
+    assert dt.date.fromtimestamp(anchor_window[1]) == today - dt.timedelta(days=10)
+    assert dt.date.fromtimestamp(full_window[1]) == start
+    assert np.diff(histories["AAA"].closes).tolist() == [1.0] * (len(histories["AAA"]) - 1)
+    stored, _ = stocks_core._load_cached_history("AAA", start, today)
+    assert stored.points() == histories["AAA"].points()
+
+
+def test_chart_session_follows_redirects_and_rejects_loops(chart_server) -> None:
+    points = stocks_core._fetch_history_yahoo("OLD", dt.date(2024, 1, 1), dt.date(2024, 1, 31))
+    assert len(points) == 31
+    assert "/AAA?" in chart_server["paths"][-1]
+    with pytest.raises(ValueError, match="HTTP Error 301"):
+        stocks_core._fetch_history_yahoo("LOOP", dt.date(2024, 1, 1), dt.date(2024, 1, 31))
+    assert chart_server["requests"] == 2 + stocks_core._MAX_REDIRECTS + 1
+
+
+def test_chart_requests_go_through_the_environment_proxy(chart_server, monkeypatch: pytest.MonkeyPatch) -> None:
+    proxy = urllib.parse.urlsplit(stocks_core._YAHOO_CHART_URL)
+    monkeypatch.setenv("http_proxy", f"http://{proxy.netloc}")
+    monkeypatch.setattr(stocks_core, "_YAHOO_CHART_URL", "http://quotes.example.invalid/v8/finance/chart")
+    monkeypatch.setattr(stocks_core, "_HTTP_SESSION", stocks_core._HttpSession(max_idle=2))
+    points = stocks_core._fetch_history_yahoo("AAA", dt.date(2024, 1, 1), dt.date(2024, 1, 31))
+    assert len(points) == 31
+    assert chart_server["paths"][-1].startswith("http://quotes.example.invalid/v8/finance/chart/AAA?")
+
+
+def test_proxy_urls_without_a_port_use_the_scheme_default() -> None:
+    session = stocks_core._HttpSession(max_idle=1)
+    for proxy_url, port in (("http://proxy.example.invalid", 80), ("https://proxy.example.invalid", 443)):
+        plain, _ = session._checkout(("http", "quotes.example.invalid", None, proxy_url), timeout=1)
+        tunnel, _ = session._checkout(("https", "quotes.example.invalid", None, proxy_url), timeout=1)
+        assert (plain.host, plain.port) == ("proxy.example.invalid", port)
+        assert (tunnel.host, tunnel.port) == ("proxy.example.invalid", port)
+        assert tunnel._tunnel_host == "quotes.example.invalid"
+
+
+def test_pooled_connections_are_retried_only_when_dropped_before_a_response(chart_server) -> None:
+    session = stocks_core._HttpSession(max_idle=2)
+    url = f"{stocks_core._YAHOO_CHART_URL}/AAA?period1=0&period2=86400"
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.hostname, parts.port, None)
+
+    class DeadConnection:
+        def __init__(self, error: Exception) -> None:
+            self.error = error
+
+        def request(self, *args: object, **kwargs: object) -> None:
+            raise self.error
+
+        def close(self) -> None:
+            pass
+
+    session._idle[key] = [DeadConnection(BrokenPipeError())]
+    status, _, _ = session.get(url, {}, timeout=5)
+    assert status == 200
+    session._idle[key] = [DeadConnection(TimeoutError("timed out"))]
+    with pytest.raises(TimeoutError):
+        session.get(url, {}, timeout=5)
+    assert chart_server["requests"] == 1
+
+
+def test_price_series_alignment_and_contribution_mask() -> None:
+    series = PriceSeries.from_points([(dt.date(2024, 1, 3), 3.0), (dt.date(2024, 1, 2), 2.0), (dt.date(2024, 1, 3), 3.0)])
+    assert series.days.dtype == np.int32 and series.closes.dtype == np.float64
+    assert series.points() == [(dt.date(2024, 1, 2), 2.0), (dt.date(2024, 1, 3), 3.0)]
+
+    other = PriceSeries.from_points([(dt.date(2024, 1, 3), 30.0), (dt.date(2024, 1, 4), 40.0)])
+    days, prices = stocks_core._align([series, other])
+    assert stocks_core._iso_dates(days) == ["2024-01-03"]
+    assert prices.tolist() == [[3.0, 30.0]]
+    with pytest.raises(ValueError, match="No overlapping dates"):
+        stocks_core._align([series, PriceSeries.from_points([(dt.date(2024, 2, 1), 1.0)])])
+
+    trading = PriceSeries.from_points(
+        [(dt.date(2024, month, day), 1.0) for month in (1, 2, 3, 4) for day in (2, 15)]
+    )
+    mask = stocks_core._contribution_mask(trading.days, 2)
+    assert [date for date, flag in zip(stocks_core._iso_dates(trading.days), mask) if flag] == [
+        "2024-01-02",
+        "2024-03-02",
+    ]
+
+
+def test_vectorized_backtest_matches_daily_walk_and_thins_timeline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(stocks_core, "_REGISTERED_PROVIDERS", {})
+    rng = np.random.default_rng(7)
+    start = dt.date(2023, 1, 2)
+    days = [start + dt.timedelta(days=offset) for offset in range(240) if (start + dt.timedelta(days=offset)).weekday() < 5]
+    histories = {
+        ticker: [(day, float(price)) for day, price in zip(days, 50 * np.exp(np.cumsum(rng.normal(0, 0.01, len(days)))))]
+        for ticker in ("AAA", "BBB", "CCC")
+    }
+    histories["BBB"] = histories["BBB"][::2]
+    register_market_data_provider("walk", InMemoryProvider(histories))
+    request = dict(
+        tickers=["AAA", "BBB", "CCC"],
+        start_date="2023-01-01",
+        end_date="2023-12-31",
+        lump_sum=1000,
+        periodic_amount=250,
+        periodic_months=2,
+        weights=[0.5, 0.3, 0.2],
+        provider="walk",
+    )
+    daily = stock_backtest(StockBacktestInput(**request))
+
+    common = sorted(set(day for day, _ in histories["BBB"]))
+    prices = {ticker: dict(points) for ticker, points in histories.items()}
+    shares = dict.fromkeys(prices, 0.0)
+    invested, seen, expected = 0.0, set(), []
+    for idx, day in enumerate(common):
+        contribution = 1000.0 if idx == 0 else 0.0
+        month_delta = (day.year - common[0].year) * 12 + day.month - common[0].month
+        if (day.year, day.month) not in seen and month_delta % 2 == 0:
+            contribution += 250
+        seen.add((day.year, day.month))
+        invested += contribution
+        for ticker, weight in zip(["AAA", "BBB", "CCC"], [0.5, 0.3, 0.2]):
+            shares[ticker] += contribution * weight / prices[ticker][day]
+        expected.append((day.isoformat(), invested, sum(shares[t] * prices[t][day] for t in shares)))
+
+    assert [(point.date, point.invested) for point in daily.timeline] == [(date, paid) for date, paid, _ in expected]
+    assert [point.value for point in daily.timeline] == pytest.approx([value for _, _, value in expected], rel=1e-12)
+
+    monthly = stock_backtest(StockBacktestInput(**request, timeline_resolution="monthly"))
+    assert [point.date[:7] for point in monthly.timeline] == sorted({date[:7] for date, _, _ in expected})
+    assert monthly.timeline[-1] == daily.timeline[-1]
+    weekly = stock_backtest(StockBacktestInput(**request, timeline_resolution="weekly"))
+    last_in_week: dict[tuple[int, int], str] = {}
+    for day in common:
+        last_in_week[day.isocalendar()[:2]] = day.isoformat()
+    assert [point.date for point in weekly.timeline] == list(last_in_week.values())
+    bare = stock_backtest(StockBacktestInput(**request, timeline_resolution="none"))
+    assert bare.timeline == []
+    assert bare.final_value == pytest.approx(daily.final_value)
+    assert (bare.start_date, bare.end_date) == (daily.start_date, daily.end_date)
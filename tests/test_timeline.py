@@ -1,5 +1,7 @@
+import pytest
+
 from qfinancetools.core.timeline import build_unified_timeline
-from qfinancetools.models.bonds import BondPriceInput
+from qfinancetools.models.bonds import BondLadderProjectionInput, BondPriceInput
 from qfinancetools.models.investments import InvestmentInput
 from qfinancetools.models.loans import LoanInput
 from qfinancetools.models.stocks import StockProjectionInput
@@ -24,3 +26,12 @@ def test_timeline_basic() -> None:
     assert result.months == 24
     assert len(result.series) == 4
     assert len(result.net) == 24
+
+
+def test_timeline_includes_ladder_cash_flows() -> None:
+    ladder = BondLadderProjectionInput(maturities=[1, 2], amounts=[1000, 2000], coupon_rates=[4, 5], payments_per_year=2)
+    result = build_unified_timeline(TimelineRequest(months=18), ladder_input=ladder)
+    bonds = next(series for series in result.series if series.name == "Bonds")
+    assert bonds.points[5].amount == pytest.approx(20 + 50)
+    assert bonds.points[11].amount == pytest.approx(20 + 50 + 1000)
+    assert bonds.points[17].amount == pytest.approx(50)